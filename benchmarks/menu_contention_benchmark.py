@@ -0,0 +1,131 @@
+"""
+Menu Contention Benchmark
+
+Readers look items up and list categories from 1 to 32 threads while a
+background writer keeps repricing the menu and toggling availability.
+Compares a MenuManager guarded by a single lock with the snapshot reads of
+ConcurrentMenuManager.
+
+Run from the project root:
+    python -m benchmarks.menu_contention_benchmark
+"""
+import random
+import threading
+import time
+from typing import List
+
+from domains.menu import MenuManager, ConcurrentMenuManager, MenuItemFactory, MenuCategory
+
+MENU_SIZE = 10_000
+THREAD_COUNTS = [1, 2, 4, 8, 16, 32]
+DURATION = 1.0
+CATEGORIES = [MenuCategory.APPETIZER, MenuCategory.ENTREE, MenuCategory.DESSERT, MenuCategory.BEVERAGE]
+
+
+def fill_menu(manager: MenuManager, size: int, seed: int = 42) -> List[str]:
+    """Add random items of every category; returns their names"""
+    rng = random.Random(seed)
+    factory = MenuItemFactory()
+    creators = [factory.create_appetizer, factory.create_main_course,
+                factory.create_dessert, factory.create_beverage]
+    items = [
+        creators[i % len(creators)](f"Item {i}", "Benchmark item", round(rng.uniform(3, 40), 2))
+        for i in range(size)
+    ]
+    manager.add_items(items)
+    return [item.name for item in items]
+
+
+class LockedMenu:
+    """Plain MenuManager behind one lock, the straightforward way to share it"""
+
+    def __init__(self, manager: MenuManager):
+        self.manager = manager
+        self.lock = threading.Lock()
+
+    def read(self, name: str, category: MenuCategory) -> int:
+        with self.lock:
+            self.manager.get_item(name)
+            return len(list(self.manager.get_items_by_category(category)))
+
+    def write(self, names: List[str], percent: float) -> None:
+        with self.lock:
+            self.manager.reprice_by_percentage(percent, names=names)
+            self.manager.bulk_set_availability(names[:10], percent > 0)
+
+
+class SnapshotMenu:
+    """ConcurrentMenuManager, whose reads go through the published snapshot"""
+
+    def __init__(self, manager: ConcurrentMenuManager):
+        self.manager = manager
+
+    def read(self, name: str, category: MenuCategory) -> int:
+        snapshot = self.manager.snapshot()
+        snapshot.get_item(name)
+        return len(snapshot.get_items_by_category(category))
+
+    def write(self, names: List[str], percent: float) -> None:
+        self.manager.reprice_by_percentage(percent, names=names)
+        self.manager.bulk_set_availability(names[:10], percent > 0)
+
+
+def run(menu, names: List[str], threads: int) -> float:
+    """
+    Reads per second across all reader threads while the writer runs
+
+    Time runs from starting the threads to setting the stop flag, and a
+    read only counts if it finished before the flag was set, so reads
+    still blocked behind the writer at the end do not inflate the rate.
+    """
+    stop = threading.Event()
+    counts = [0] * threads
+
+    def reader(slot: int) -> None:
+        rng = random.Random(slot)
+        done = 0
+        while True:
+            menu.read(rng.choice(names), rng.choice(CATEGORIES))
+            if stop.is_set():
+                break
+            done += 1
+        counts[slot] = done
+
+    def writer() -> None:
+        rng = random.Random(-1)
+        percent = 1.0
+        while not stop.is_set():
+            menu.write(rng.sample(names, 100), percent)
+            percent = -percent
+            time.sleep(0.001)
+
+    workers = [threading.Thread(target=reader, args=(slot,)) for slot in range(threads)]
+    workers.append(threading.Thread(target=writer))
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    time.sleep(DURATION)
+    stop.set()
+    elapsed = time.perf_counter() - start
+    for worker in workers:
+        worker.join()
+    return sum(counts) / elapsed
+
+
+def main():
+    manager = MenuManager()
+    names = fill_menu(manager, MENU_SIZE)
+    locked_menu = LockedMenu(manager)
+    concurrent = ConcurrentMenuManager()
+    fill_menu(concurrent, MENU_SIZE)
+    snapshot_menu = SnapshotMenu(concurrent)
+
+    print(f"{'threads':>8} {'locked reads/s':>16} {'snapshot reads/s':>18} {'speedup':>8}")
+    for threads in THREAD_COUNTS:
+        locked = run(locked_menu, names, threads)
+        snapshot = run(snapshot_menu, names, threads)
+        print(f"{threads:>8} {locked:>16,.0f} {snapshot:>18,.0f} {snapshot / locked:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Menu Factory Ingest Benchmark
+
+Measures items per second for building menu items from dictionaries with
+MenuItemFactory.create_from_dict and create_many, and for a full catalog
+ingest (create_many followed by MenuManager.add_items).
+
+Run from the project root:
+    python -m benchmarks.menu_factory_benchmark [item_count]
+"""
+import sys
+import time
+
+from benchmarks.menu_jsonl_benchmark import synthetic_records
+from domains.menu import MenuItemFactory, MenuManager
+
+DEFAULT_ITEM_COUNT = 200_000
+
+
+def report(label: str, count: int, seconds: float) -> None:
+    print(f"{label:<28} {count:>9,} items in {seconds:6.2f}s = {count / seconds:>10,.0f} items/s")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ITEM_COUNT
+    records = list(synthetic_records(count))
+    factory = MenuItemFactory()
+
+    start = time.perf_counter()
+    for record in records:
+        factory.create_from_dict(record)
+    report("create_from_dict loop", count, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    factory.create_many(records)
+    report("create_many", count, time.perf_counter() - start)
+
+    manager = MenuManager()
+    start = time.perf_counter()
+    manager.add_items(factory.create_many(records))
+    report("create_many + add_items", count, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Menu JSONL Import/Export Benchmark
+
+Writes a synthetic JSON Lines menu file (1M items by default), streams it
+into a MenuManager with import_jsonl and streams it back out with
+export_jsonl, reporting items per second for each step.
+
+Run from the project root:
+    python -m benchmarks.menu_jsonl_benchmark [item_count]
+"""
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from typing import Dict, Iterator
+
+from domains.menu import MenuManager
+
+DEFAULT_ITEM_COUNT = 1_000_000
+CATEGORIES = ["appetizer", "entree", "dessert", "beverage"]
+INGREDIENTS = ["tomato", "basil", "mozzarella", "garlic", "chicken", "beef", "onion", "pepper"]
+
+
+def synthetic_records(count: int, seed: int = 11) -> Iterator[Dict]:
+    """Generate item records in the format written by export_jsonl"""
+    rng = random.Random(seed)
+    for i in range(count):
+        yield {
+            'name': f"Item {i}",
+            'description': f"Chef's dish number {i}",
+            'price': round(rng.uniform(3, 45), 2),
+            'category': rng.choice(CATEGORIES),
+            'available': rng.random() > 0.05,
+            'chef_special': rng.random() < 0.05,
+            'seasonal': rng.random() < 0.1,
+            'spice_level': rng.randint(0, 5),
+            'dietary_restrictions': ["vegetarian"] if i % 4 == 0 else [],
+            'allergens': ["dairy"] if i % 3 == 0 else [],
+            'ingredients': rng.sample(INGREDIENTS, 3),
+        }
+
+
+def peak_rss_mb() -> float:
+    """Peak resident memory of this process in MB (Linux reports KB)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ITEM_COUNT
+
+    with tempfile.TemporaryDirectory() as workdir:
+        source = os.path.join(workdir, "menu.jsonl")
+        target = os.path.join(workdir, "menu_export.jsonl")
+
+        start = time.perf_counter()
+        with open(source, 'w', encoding='utf-8') as output:
+            for record in synthetic_records(count):
+                output.write(json.dumps(record))
+                output.write('\n')
+        write_seconds = time.perf_counter() - start
+        print(f"generated {count:,} records in {write_seconds:.1f}s "
+              f"({os.path.getsize(source) / 1e6:.0f} MB)")
+
+        manager = MenuManager()
+        start = time.perf_counter()
+        imported = manager.import_jsonl(source)
+        import_seconds = time.perf_counter() - start
+        print(f"import_jsonl: {imported:,} items in {import_seconds:.1f}s "
+              f"= {imported / import_seconds:,.0f} items/s (peak RSS {peak_rss_mb():,.0f} MB)")
+
+        start = time.perf_counter()
+        exported = manager.export_jsonl(target)
+        export_seconds = time.perf_counter() - start
+        print(f"export_jsonl: {exported:,} items in {export_seconds:.1f}s "
+              f"= {exported / export_seconds:,.0f} items/s (peak RSS {peak_rss_mb():,.0f} MB)")
+
+
+if __name__ == "__main__":
+    main()
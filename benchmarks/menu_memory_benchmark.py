@@ -0,0 +1,141 @@
+"""
+Menu Item Memory Benchmark
+
+Measures bytes per menu item with tracemalloc for the slotted item classes
+and for a replica of the previous dict-based layout (plain attributes,
+mutable dataclasses and a fresh list per metadata field).
+
+Run from the project root:
+    python -m benchmarks.menu_memory_benchmark
+"""
+import random
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, List, Optional
+
+from domains.menu import MenuItemFactory, MenuItemMetadata, NutritionalInfo, DietaryRestriction
+
+ITEM_COUNT = 100_000
+INGREDIENTS = ["tomato", "basil", "mozzarella", "garlic", "olive oil", "chicken", "beef", "onion"]
+ALLERGENS = ["dairy", "gluten", "nuts", "eggs"]
+
+
+@dataclass
+class LegacyNutritionalInfo:
+    calories: Optional[int] = None
+    protein_grams: Optional[float] = None
+    carbs_grams: Optional[float] = None
+    fat_grams: Optional[float] = None
+    fiber_grams: Optional[float] = None
+    sodium_mg: Optional[float] = None
+
+
+@dataclass
+class LegacyMenuItemMetadata:
+    chef_special: bool = False
+    seasonal: bool = False
+    spice_level: int = 0
+    preparation_style: Optional[object] = None
+    dietary_restrictions: Optional[List] = None
+    ingredients: Optional[List[str]] = None
+    allergens: Optional[List[str]] = None
+    origin: Optional[str] = None
+
+    def __post_init__(self):
+        if self.dietary_restrictions is None:
+            self.dietary_restrictions = []
+        if self.ingredients is None:
+            self.ingredients = []
+        if self.allergens is None:
+            self.allergens = []
+
+
+class LegacyMainCourseItem:
+    """Attribute layout of MainCourseItem before it was slotted"""
+
+    def __init__(self, name, description, price, nutritional_info=None, metadata=None,
+                 protein_source=None, cooking_method=None):
+        self.name = name
+        self.price = price
+        self.description = description
+        self.nutritional_info = nutritional_info or LegacyNutritionalInfo()
+        self.metadata = metadata or LegacyMenuItemMetadata()
+        self.category = None
+        self.created_at = datetime.now()
+        self.available = True
+        self.protein_source = protein_source
+        self.cooking_method = cooking_method
+
+
+def item_specs(count: int, seed: int = 7) -> List[dict]:
+    """Item fields built up front so only the item objects are measured"""
+    rng = random.Random(seed)
+    specs = []
+    for i in range(count):
+        # Mimic parsed input: equal strings arriving as separate objects
+        plain = i % 2 == 0
+        specs.append({
+            'name': f"Item {i}",
+            'description': "House special",
+            'price': round(rng.uniform(5, 40), 2),
+            'ingredients': [] if plain else ["".join(list(name)) for name in rng.sample(INGREDIENTS, 3)],
+            'allergens': [] if plain else ["".join(list(name)) for name in rng.sample(ALLERGENS, 1)],
+            'vegan': i % 5 == 0,
+            'calories': None if plain else 450,
+        })
+    return specs
+
+
+def build_current(spec: dict):
+    metadata = MenuItemMetadata(
+        ingredients=spec['ingredients'],
+        allergens=spec['allergens'],
+        dietary_restrictions=[DietaryRestriction.VEGAN] if spec['vegan'] else None
+    )
+    nutrition = NutritionalInfo(calories=spec['calories']) if spec['calories'] else None
+    return MenuItemFactory.create_main_course(
+        spec['name'], spec['description'], spec['price'],
+        cooking_method="grilled", nutritional_info=nutrition, metadata=metadata
+    )
+
+
+def build_legacy(spec: dict):
+    metadata = LegacyMenuItemMetadata(
+        ingredients=spec['ingredients'],
+        allergens=spec['allergens'],
+        dietary_restrictions=[DietaryRestriction.VEGAN] if spec['vegan'] else None
+    )
+    nutrition = LegacyNutritionalInfo(calories=spec['calories']) if spec['calories'] else None
+    return LegacyMainCourseItem(
+        spec['name'], spec['description'], spec['price'],
+        cooking_method="grilled", nutritional_info=nutrition, metadata=metadata
+    )
+
+
+def bytes_per_item(builder: Callable[[dict], object], specs: List[dict]) -> float:
+    """Net bytes allocated per item while building (and keeping) all items"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    items = [builder(spec) for spec in specs]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del items
+    return allocated / len(specs)
+
+
+def main():
+    specs = item_specs(ITEM_COUNT)
+    legacy = bytes_per_item(build_legacy, specs)
+    current = bytes_per_item(build_current, specs)
+
+    print(f"items measured:      {ITEM_COUNT:,}")
+    print(f"dict-based layout:   {legacy:8.1f} bytes/item")
+    print(f"slotted layout:      {current:8.1f} bytes/item")
+    print(f"saving:              {legacy - current:8.1f} bytes/item ({(1 - current / legacy) * 100:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
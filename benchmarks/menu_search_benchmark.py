@@ -0,0 +1,78 @@
+"""
+Menu Search Benchmark
+
+Compares the linear substring scan, the trigram search index and the
+fuzzy trigram search on synthetic menus of 1k, 10k and 100k items.
+
+Run from the project root:
+    python -m benchmarks.menu_search_benchmark
+"""
+import random
+import time
+from typing import Callable
+
+from domains.menu import MenuManager, MenuItemFactory, MenuItemMetadata
+
+MENU_SIZES = [1_000, 10_000, 100_000]
+QUERIES = ["margherita", "margarita", "basil", "spicy chiken", "mozz"]
+
+WORDS = [
+    "margherita", "pepperoni", "basil", "tomato", "mozzarella", "chicken",
+    "beef", "spicy", "garlic", "lemon", "chocolate", "vanilla", "cream",
+    "pasta", "pepper", "onion", "mushroom", "truffle", "salmon", "shrimp",
+    "avocado", "bacon", "cheddar", "parmesan", "pesto", "ricotta", "spinach",
+]
+SYLLABLES = ["ka", "lo", "mi", "ren", "ta", "sul", "vo", "chi", "ne", "pra", "do", "gu"]
+
+
+def filler_words(rng: random.Random, count: int) -> list:
+    """Generate made-up words so descriptions have a realistic vocabulary"""
+    return ["".join(rng.choice(SYLLABLES) for _ in range(3)) for _ in range(count)]
+
+
+def build_menu(size: int, seed: int = 42) -> MenuManager:
+    """Build a menu of random items"""
+    rng = random.Random(seed)
+    vocabulary = filler_words(rng, 5_000)
+    factory = MenuItemFactory()
+    manager = MenuManager()
+
+    for i in range(size):
+        name = f"{rng.choice(WORDS).title()} {rng.choice(vocabulary).title()} #{i}"
+        item = factory.create_main_course(
+            name,
+            " ".join(rng.sample(vocabulary, 8)),
+            round(rng.uniform(5, 40), 2),
+            metadata=MenuItemMetadata(ingredients=[rng.choice(WORDS)] + rng.sample(vocabulary, 3))
+        )
+        manager.add_item(item)
+    return manager
+
+
+def time_per_call(func: Callable[[], object], repeat: int) -> float:
+    """Average wall time of a call in milliseconds"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    print(f"{'items':>8} {'query':>14} {'scan ms':>10} {'index ms':>10} {'fuzzy ms':>10} {'hits':>7} {'fuzzy top hit'}")
+    for size in MENU_SIZES:
+        manager = build_menu(size)
+        repeat = max(1, 20_000 // size)
+
+        for query in QUERIES:
+            scan_ms = time_per_call(lambda: manager.search_items(query, use_index=False), repeat)
+            index_ms = time_per_call(lambda: manager.search_items(query), repeat)
+            fuzzy_ms = time_per_call(lambda: manager.fuzzy_search_items(query), repeat)
+
+            hits = len(manager.search_items(query))
+            fuzzy = manager.fuzzy_search_items(query, limit=1)
+            top_hit = fuzzy[0].name if fuzzy else "-"
+            print(f"{size:>8} {query:>14} {scan_ms:>10.3f} {index_ms:>10.3f} {fuzzy_ms:>10.3f} {hits:>7} {top_hit}")
+
+
+if __name__ == "__main__":
+    main()
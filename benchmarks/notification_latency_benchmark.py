@@ -0,0 +1,93 @@
+"""
+Notification Latency Benchmark
+
+Times Order.update_status as seen by the caller, with observers run
+synchronously and with deliveries handed to a NotificationBus under each
+backpressure policy. Every order has a customer notifier, three staff
+notifiers and a webhook observer that takes a few milliseconds per event,
+standing in for a slow delivery channel. The notifiers' console output is
+discarded while timing.
+
+Run from the project root:
+    python -m benchmarks.notification_latency_benchmark
+"""
+import contextlib
+import io
+import statistics
+import time
+from typing import List, Optional
+
+from config.enums import OrderStatus
+from core.base_classes import Observer
+from domains.notifications import StaffNotifier, NotificationBus, BackpressurePolicy
+from models.order import Order
+
+ORDERS = 200
+QUEUE_SIZE = 64
+WEBHOOK_DELAY = 0.002
+STATUSES = [OrderStatus.PREPARING, OrderStatus.READY, OrderStatus.DELIVERED]
+
+
+class SlowWebhook(Observer):
+    """Observer whose delivery takes WEBHOOK_DELAY seconds"""
+
+    def update(self, event_type: str, data: dict) -> None:
+        time.sleep(WEBHOOK_DELAY)
+
+
+def build_orders(bus: Optional[NotificationBus]) -> List[Order]:
+    staff = [StaffNotifier("Chef", "kitchen"), StaffNotifier("Sam", "server"), StaffNotifier("Max", "manager")]
+    webhook = SlowWebhook()
+    orders = []
+    for number in range(ORDERS):
+        order = Order(f"Customer {number}", "555-0100", f"customer{number}@example.com")
+        for observer in staff:
+            order.attach(observer)
+        order.attach(webhook)
+        order.set_notification_bus(bus)
+        orders.append(order)
+    return orders
+
+
+def run(bus: Optional[NotificationBus]) -> tuple:
+    """Per-call update_status latencies in milliseconds, and the time to drain the bus"""
+    latencies = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        orders = build_orders(bus)
+        for status in STATUSES:
+            for order in orders:
+                start = time.perf_counter()
+                order.update_status(status)
+                latencies.append((time.perf_counter() - start) * 1000)
+        drain_start = time.perf_counter()
+        if bus is not None:
+            bus.shutdown()
+        drain = time.perf_counter() - drain_start
+    return latencies, drain
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def main():
+    scenarios = [("synchronous", None)]
+    for policy in BackpressurePolicy:
+        scenarios.append((f"bus, {policy.value}", NotificationBus(max_queue_size=QUEUE_SIZE, policy=policy)))
+
+    print(f"{len(STATUSES) * ORDERS} status changes, webhook delay {WEBHOOK_DELAY * 1000:.0f} ms, "
+          f"queue size {QUEUE_SIZE}")
+    print(f"{'mode':<20} {'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9} {'drain s':>9}  dropped/spilled")
+    for label, bus in scenarios:
+        latencies, drain = run(bus)
+        counters = ""
+        if bus is not None:
+            channels = bus.stats().values()
+            counters = f"{sum(c['dropped'] for c in channels)}/{sum(c['spilled'] for c in channels)}"
+        print(f"{label:<20} {statistics.mean(latencies):>9.3f} {percentile(latencies, 0.5):>9.3f} "
+              f"{percentile(latencies, 0.99):>9.3f} {max(latencies):>9.3f} {drain:>9.2f}  {counters}")
+
+
+if __name__ == "__main__":
+    main()
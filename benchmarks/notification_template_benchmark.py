@@ -0,0 +1,111 @@
+"""
+Notification Template Benchmark
+
+Measures the per-notification cost of message formatting against the
+10 µs budget of a 100k events/s stream:
+
+1. Template lookup and formatting: rebuilding the template dictionary and
+   reparsing the format string on every event (the previous behaviour)
+   versus the class-level templates with compiled render functions.
+2. Complete observer updates (templates, formatting, history and simulated
+   delivery) for each notifier type, with console output discarded.
+
+Run from the project root:
+    python -m benchmarks.notification_template_benchmark
+"""
+import contextlib
+import io
+import time
+from typing import Dict
+
+from domains.notifications import CustomerNotifier, StaffNotifier, PromotionalSubscriber, NotificationChannel
+
+EVENTS = 100_000
+BUDGET_US = 1_000_000 / 100_000
+
+DATA = {
+    'order_id': 1042,
+    'customer_name': "Jordan",
+    'total': 38.5,
+    'amount': 38.5,
+    'eta': 20,
+    'items': ["Burger", "Fries", "Cola"],
+    'payment_method': "credit_card",
+    'transaction_id': "txn_123456",
+    'message': "Two-for-one desserts tonight!",
+    'promo_code': "SWEET2",
+    'category': "dessert",
+}
+
+
+class LegacyTemplate:
+    """The previous NotificationTemplate: a dictionary of format strings"""
+
+    def __init__(self, template_id: str, templates: Dict[NotificationChannel, str]):
+        self.template_id = template_id
+        self.templates = templates
+
+    def format_message(self, channel: NotificationChannel, **kwargs) -> str:
+        return self.templates[channel].format(**kwargs)
+
+
+def legacy_templates(observer) -> Dict[str, LegacyTemplate]:
+    """Fresh template objects per call, as get_notification_templates used to build"""
+    return {
+        event_type: LegacyTemplate(template.template_id, dict(template.templates))
+        for event_type, template in observer.TEMPLATES.items()
+    }
+
+
+def time_per_event(function, count: int = EVENTS) -> float:
+    """Mean microseconds per call"""
+    start = time.perf_counter()
+    for _ in range(count):
+        function()
+    return (time.perf_counter() - start) / count * 1_000_000
+
+
+def main():
+    observers = [
+        ("customer", CustomerNotifier("Jordan", "555-0100", "jordan@example.com"), "order_ready"),
+        ("staff", StaffNotifier("Sam", "manager"), "payment_successful"),
+        ("promotional", PromotionalSubscriber("Jordan", "jordan@example.com"), "promotion"),
+    ]
+
+    print(f"Budget at 100k events/s: {BUDGET_US:.1f} µs per event\n")
+    print(f"{'formatting':<14} {'legacy µs':>10} {'compiled µs':>12} {'speedup':>8}")
+    for label, observer, event_type in observers:
+        values = {**DATA, 'customer_name': "Jordan", 'item_count': 3}
+        channels = observer.preferred_channels
+
+        def legacy():
+            template = legacy_templates(observer)[event_type]
+            for channel in channels:
+                template.format_message(channel, **values)
+
+        def compiled():
+            template = observer.TEMPLATES[event_type]
+            for channel in channels:
+                template.render(channel, values)
+
+        old = time_per_event(legacy)
+        new = time_per_event(compiled)
+        print(f"{label:<14} {old:>10.2f} {new:>12.2f} {old / new:>7.1f}x")
+
+    print(f"\n{'update()':<14} {'µs/event':>10} {'events/s':>12} {'budget':>8}")
+    with contextlib.redirect_stdout(io.StringIO()) as sink:
+        results = []
+        for label, observer, event_type in observers:
+            def update():
+                observer.update(event_type, DATA)
+                sink.seek(0)
+                sink.truncate()
+                observer.notification_history.clear()
+
+            results.append((label, time_per_event(update)))
+    for label, cost in results:
+        print(f"{label:<14} {cost:>10.2f} {1_000_000 / cost:>12,.0f} {cost / BUDGET_US:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Promotion Campaign Benchmark
+
+Sends one category promotion to a large subscriber list, first through
+RestaurantService.send_promotion (one observer callback per subscriber,
+console output discarded) and then through the CampaignEngine, in the
+calling process and across a process pool.
+
+Run from the project root:
+    python -m benchmarks.promotion_campaign_benchmark
+"""
+import contextlib
+import io
+import os
+import random
+import time
+
+from domains.notifications import CampaignEngine, PreferenceIndex, Promotion
+from services.restaurant_service import RestaurantService
+
+SUBSCRIBERS = 200_000
+OBSERVER_SUBSCRIBERS = 20_000
+PREFERENCES = ["dessert", "drinks", "vegan", "brunch", "family"]
+
+
+def build_restaurant(size: int, seed: int = 7) -> RestaurantService:
+    rng = random.Random(seed)
+    restaurant = RestaurantService("Benchmark Bistro")
+    with contextlib.redirect_stdout(io.StringIO()):
+        for number in range(size):
+            restaurant.add_promotional_subscriber(
+                f"Customer {number}", f"customer{number}@example.com",
+                rng.sample(PREFERENCES, rng.randint(0, 2))
+            )
+    return restaurant
+
+
+def main():
+    restaurant = build_restaurant(OBSERVER_SUBSCRIBERS)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        restaurant.send_promotion("dessert", "Two-for-one desserts tonight!")
+    observer_rate = OBSERVER_SUBSCRIBERS / (time.perf_counter() - start)
+
+    restaurant = build_restaurant(SUBSCRIBERS)
+    index: PreferenceIndex = restaurant.subscriber_index
+    promotion = Promotion("Two-for-one desserts tonight!", category="dessert", promo_code="SWEET2")
+
+    print(f"{SUBSCRIBERS:,} subscribers, promotion for 'dessert'")
+    print(f"{'mode':<28} {'subscribers/s':>14} {'est. 2M list':>13}")
+    print(f"{'observer callbacks':<28} {observer_rate:>14,.0f} {2_000_000 / observer_rate:>12.0f}s")
+    for workers in (0, os.cpu_count() or 1):
+        report = CampaignEngine(index, workers=workers).run(promotion)
+        rate = SUBSCRIBERS / report.elapsed
+        label = "engine, in process" if workers == 0 else f"engine, {workers} processes"
+        print(f"{label:<28} {rate:>14,.0f} {2_000_000 / rate:>12.0f}s")
+
+
+if __name__ == "__main__":
+    main()
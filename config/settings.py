@@ -21,6 +21,9 @@ PAYMENT_SUCCESS_RATES = {
 MAX_ITEMS_PER_ORDER = 20
 MIN_ORDER_AMOUNT = 5.00
 
+# Menu Configuration
+MENU_SNAPSHOT_PATH = None  # e.g. "menu.snap" to load the GUI menu from a binary snapshot
+
 # Notification Configuration
 NOTIFICATION_ENABLED = True
 SMS_ENABLED = True
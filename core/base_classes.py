@@ -2,32 +2,87 @@
 Base classes for the restaurant management system
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, FrozenSet, Iterable, List, Optional
 
 
 class Subject(ABC):
-    """Abstract Subject class for Observer Pattern"""
+    """
+    Abstract Subject class for Observer Pattern
+
+    Observers that declare their events through ``subscribed_events`` are
+    indexed by event type when attached, so ``notify`` only visits the
+    observers that handle the event. Observers without a declaration
+    receive every event. Delivery follows attach order. With a
+    notification bus set, deliveries are queued on the bus instead of
+    running in the caller.
+    """
     def __init__(self):
-        self._observers: List['Observer'] = []
-    
+        self._observers: Dict['Observer', Optional[FrozenSet[str]]] = {}
+        self._event_index: Dict[str, Dict['Observer', int]] = {}
+        self._all_events: Dict['Observer', int] = {}
+        self._attach_sequence = 0
+        self._notification_bus = None
+
+    def set_notification_bus(self, bus) -> None:
+        """Deliver notifications through ``bus`` (None delivers synchronously)"""
+        self._notification_bus = bus
+
     def attach(self, observer: 'Observer') -> None:
         """Attach an observer to the subject"""
         if observer not in self._observers:
-            self._observers.append(observer)
+            order = self._attach_sequence
+            self._attach_sequence += 1
+            events = subscribed_events_of(observer)
+            self._observers[observer] = events
+            if events is None:
+                self._all_events[observer] = order
+            else:
+                for event_type in events:
+                    self._event_index.setdefault(event_type, {})[observer] = order
             print(f"Observer {type(observer).__name__} attached")
-    
+
     def detach(self, observer: 'Observer') -> None:
         """Detach an observer from the subject"""
         if observer in self._observers:
-            self._observers.remove(observer)
+            events = self._observers.pop(observer)
+            if events is None:
+                del self._all_events[observer]
+            for event_type in events or ():
+                subscribers = self._event_index[event_type]
+                del subscribers[observer]
+                if not subscribers:
+                    del self._event_index[event_type]
             print(f"Observer {type(observer).__name__} detached")
-    
+
     def notify(self, event_type: str, data: Optional[dict] = None) -> None:
-        """Notify all observers about an event"""
+        """Notify the observers handling ``event_type`` about an event"""
         if data is None:
             data = {}
-        for observer in self._observers:
-            observer.update(event_type, data)
+        bus = self._notification_bus
+        for observer in self.observers_for(event_type):
+            if bus is None:
+                observer.update(event_type, data)
+            else:
+                bus.publish(observer, event_type, data)
+
+    def observers_for(self, event_type: str) -> List['Observer']:
+        """Observers that receive ``event_type``, in attach order"""
+        subscribers = self._event_index.get(event_type)
+        if not self._all_events:
+            return list(subscribers) if subscribers else []
+        if not subscribers:
+            return list(self._all_events)
+        merged = {**subscribers, **self._all_events}
+        return sorted(merged, key=merged.__getitem__)
+
+
+def subscribed_events_of(observer: object) -> Optional[FrozenSet[str]]:
+    """Event types an observer declared, or None if it takes every event"""
+    declared = getattr(observer, 'subscribed_events', None)
+    if declared is None:
+        return None
+    events = declared()
+    return None if events is None else frozenset(events)
 
 
 class Observer(ABC):
@@ -36,3 +91,11 @@ class Observer(ABC):
     def update(self, event_type: str, data: dict) -> None:
         """Update method called by Subject when an event occurs"""
         pass
+
+    def subscribed_events(self) -> Optional[Iterable[str]]:
+        """
+        Event types this observer handles, read once when it is attached
+
+        None (the default) subscribes to every event.
+        """
+        return None
@@ -39,6 +39,21 @@ from .menu_item_factory import (
 )
 
 from .menu_manager import MenuManager
+from .search_index import MenuSearchIndex
+from .fuzzy_search import FuzzyMenuSearch
+from .facet_index import MenuFacetIndex
+from .price_index import MenuPriceIndex
+from .menu_statistics import MenuStatistics
+from .columnar_store import ColumnarMenuManager, ColumnarMenuStore
+from .snapshot import SNAPSHOT_VERSION
+from .flyweight import MenuFlyweightPool, DEFAULT_FLYWEIGHT_POOL
+from .menu_overlay import MenuOverlay
+from .concurrent_manager import ConcurrentMenuManager, MenuReadSnapshot
+from .change_log import MenuChangeLog
+from .menu_query import MenuQuery, QueryPlan
+from .name_index import MenuNameIndex
+from .pagination import MenuPage
+from .payload_cache import MenuPayloadCache
 
 __all__ = [
     # Base classes and types
@@ -56,6 +71,25 @@ __all__ = [
     'DessertItem',
     'BeverageItem',
     
-    # Manager
-    'MenuManager'
+    # Manager and indexes
+    'MenuManager',
+    'MenuSearchIndex',
+    'FuzzyMenuSearch',
+    'MenuFacetIndex',
+    'MenuPriceIndex',
+    'MenuStatistics',
+    'ColumnarMenuManager',
+    'ColumnarMenuStore',
+    'SNAPSHOT_VERSION',
+    'MenuFlyweightPool',
+    'DEFAULT_FLYWEIGHT_POOL',
+    'MenuOverlay',
+    'ConcurrentMenuManager',
+    'MenuReadSnapshot',
+    'MenuChangeLog',
+    'MenuQuery',
+    'QueryPlan',
+    'MenuNameIndex',
+    'MenuPage',
+    'MenuPayloadCache'
 ]
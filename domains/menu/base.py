@@ -1,9 +1,12 @@
 """
 Base Menu System Interfaces and Types
 """
+import functools
+import operator
+import sys
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from typing import Callable, Dict, Any, Iterable, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass, fields
 from datetime import datetime
 from enum import Enum
 from config.enums import FoodCategory
@@ -47,9 +50,68 @@ class DietaryRestriction(Enum):
     KOSHER = "kosher"
 
 
-@dataclass
+# Shared empty value for items without dietary restrictions, ingredients or allergens
+EMPTY_TUPLE: Tuple = ()
+
+
+def intern_optional(value: Optional[str]) -> Optional[str]:
+    """Intern a string so repeated values share one object"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def intern_all(values: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """Freeze a list of strings into a tuple of interned strings"""
+    if not values:
+        return EMPTY_TUPLE
+    return tuple(sys.intern(value) for value in values)
+
+
+# Other spellings of the same allergen, folded into one name
+ALLERGEN_ALIASES: Dict[str, str] = {
+    'milk': 'dairy',
+    'lactose': 'dairy',
+    'egg': 'eggs',
+    'nut': 'nuts',
+    'tree nut': 'nuts',
+    'tree nuts': 'nuts',
+    'peanut': 'peanuts',
+    'soya': 'soy',
+}
+
+
+def normalize_allergen(allergen: str) -> str:
+    """Canonical interned name of an allergen (lowercase, aliases folded)"""
+    key = " ".join(allergen.lower().split())
+    return sys.intern(ALLERGEN_ALIASES.get(key, key))
+
+
+def normalize_allergens(values: Union[str, Iterable[str], None]) -> Tuple[str, ...]:
+    """Freeze allergens into a tuple of distinct canonical names; a single string is one allergen"""
+    if not values:
+        return EMPTY_TUPLE
+    if isinstance(values, str):
+        values = (values,)
+    return tuple(dict.fromkeys(normalize_allergen(value) for value in values))
+
+
+def normalize_dietary(values: Union[DietaryRestriction, str, Iterable[Union[DietaryRestriction, str]], None]
+                      ) -> Tuple[DietaryRestriction, ...]:
+    """
+    Dietary filter as a tuple of restrictions
+
+    A single restriction or restriction value (such as "vegan") counts as
+    one; unknown values raise ValueError.
+    """
+    if values is None:
+        return EMPTY_TUPLE
+    if isinstance(values, (DietaryRestriction, str)):
+        values = (values,)
+    return tuple(DietaryRestriction(value) for value in values)
+
+
+@dataclass(frozen=True, slots=True)
 class NutritionalInfo:
-    """Nutritional information for menu items"""
+    """Nutritional information for menu items (immutable, so it can be shared)"""
     calories: Optional[int] = None
     protein_grams: Optional[float] = None
     carbs_grams: Optional[float] = None
@@ -69,25 +131,112 @@ class NutritionalInfo:
         }
 
 
-@dataclass
+EMPTY_NUTRITION = NutritionalInfo()
+
+
+@dataclass(frozen=True, slots=True)
 class MenuItemMetadata:
-    """Extended metadata for menu items"""
+    """
+    Extended metadata for menu items
+    
+    List fields are stored as tuples of interned strings; items without
+    restrictions, ingredients or allergens share the same empty tuple.
+    Allergens are normalized with ``normalize_allergen``. Metadata is
+    immutable so it can be shared between items and stores; change an
+    item's metadata with the manager's ``update_item(name,
+    metadata=dataclasses.replace(item.metadata, ...))``.
+    """
     chef_special: bool = False
     seasonal: bool = False
     spice_level: int = 0  # 0-5 scale
     preparation_style: Optional[PreparationStyle] = None
-    dietary_restrictions: Optional[List[DietaryRestriction]] = None
-    ingredients: Optional[List[str]] = None
-    allergens: Optional[List[str]] = None
+    dietary_restrictions: Optional[Sequence[DietaryRestriction]] = None
+    ingredients: Optional[Sequence[str]] = None
+    allergens: Optional[Sequence[str]] = None
     origin: Optional[str] = None  # e.g., "Italian", "Mexican"
     
     def __post_init__(self):
-        if self.dietary_restrictions is None:
-            self.dietary_restrictions = []
-        if self.ingredients is None:
-            self.ingredients = []
-        if self.allergens is None:
-            self.allergens = []
+        set_field = object.__setattr__
+        set_field(self, 'dietary_restrictions',
+                  tuple(self.dietary_restrictions) if self.dietary_restrictions else EMPTY_TUPLE)
+        set_field(self, 'ingredients', intern_all(self.ingredients))
+        set_field(self, 'allergens', normalize_allergens(self.allergens))
+        set_field(self, 'origin', intern_optional(self.origin))
+    
+    def __setstate__(self, state) -> None:
+        """Unpickle support - also reads the (None, slots) state pickled before metadata was frozen"""
+        if isinstance(state, tuple):
+            slots = state[1]
+            state = [slots.get(field.name, field.default) for field in fields(self)]
+        for field, value in zip(fields(self), state):
+            object.__setattr__(self, field.name, value)
+
+
+class ComputedValueMetrics:
+    """Hit and miss counters for one memoized item method"""
+    
+    __slots__ = ('hits', 'misses')
+    
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+    
+    def hit_rate(self) -> float:
+        """Share of calls answered from the cache"""
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hit_rate()}
+
+
+CACHE_METRICS: Dict[str, ComputedValueMetrics] = {}
+
+# Attributes read by MenuItemBase.get_display_name
+DISPLAY_NAME_DEPENDENCIES = (
+    'name', 'metadata.chef_special', 'metadata.seasonal', 'metadata.dietary_restrictions'
+)
+
+
+def memoized(*dependencies: str) -> Callable[[Callable], Callable]:
+    """
+    Cache a zero-argument item method until one of its dependencies changes
+    
+    ``dependencies`` are the attribute paths the method reads, such as
+    ``'cooking_method'`` or ``'metadata.spice_level'``. The result is kept
+    in the item's ``_<name>_cache`` slot (without the ``get_`` prefix)
+    together with the dependency values it was computed from, so replacing
+    the metadata or changing any listed attribute recomputes it. Only the
+    outermost call is cached; an override reaching this implementation
+    through ``super()`` always computes it.
+    """
+    key_of = operator.attrgetter(*dependencies)
+    
+    def decorator(method: Callable) -> Callable:
+        method_name = method.__name__
+        slot = f"_{method_name.removeprefix('get_')}_cache"
+        metrics = CACHE_METRICS.setdefault(method_name, ComputedValueMetrics())
+        
+        @functools.wraps(method)
+        def cached_method(self):
+            if getattr(type(self), method_name) is not cached_method:
+                return method(self)
+            
+            key = key_of(self)
+            cached = getattr(self, slot, None)
+            if cached is not None and cached[0] == key:
+                metrics.hits += 1
+                return cached[1]
+            
+            metrics.misses += 1
+            value = method(self)
+            setattr(self, slot, (key, value))
+            return value
+        
+        cached_method.dependencies = dependencies
+        return cached_method
+    
+    return decorator
 
 
 class MenuItemBase(ABC):
@@ -95,19 +244,28 @@ class MenuItemBase(ABC):
     Enhanced Abstract Base Class for Menu Items
     
     Provides a rich interface for menu items with nutritional info,
-    dietary restrictions, preparation details, and more.
+    dietary restrictions, preparation details, and more. Items are slotted
+    to keep large catalogs compact. ``get_display_name`` is memoized per
+    item with ``@memoized``, as are subclass methods that cost more than
+    the cache check, such as MainCourseItem's ``get_preparation_time``.
     """
     
+    __slots__ = (
+        'name', 'price', 'description', 'nutritional_info', 'metadata',
+        'category', 'created_at', 'available',
+        '_display_name_cache', '_preparation_time_cache', '__weakref__'
+    )
+    
     def __init__(self, 
                  name: str, 
                  price: float, 
                  description: str = "",
                  nutritional_info: Optional[NutritionalInfo] = None,
                  metadata: Optional[MenuItemMetadata] = None):
-        self.name = name
+        self.name = sys.intern(name)
         self.price = price
         self.description = description
-        self.nutritional_info = nutritional_info or NutritionalInfo()
+        self.nutritional_info = nutritional_info or EMPTY_NUTRITION
         self.metadata = metadata or MenuItemMetadata()
         self.category: Optional[FoodCategory] = None
         self.created_at = datetime.now()
@@ -128,6 +286,7 @@ class MenuItemBase(ABC):
         """Get the food category for this item"""
         pass
     
+    @memoized(*DISPLAY_NAME_DEPENDENCIES)
     def get_display_name(self) -> str:
         """Get formatted display name with special indicators"""
         name = self.name
@@ -158,8 +317,7 @@ class MenuItemBase(ABC):
     
     def has_allergen(self, allergen: str) -> bool:
         """Check if item contains specific allergen"""
-        allergens = self.metadata.allergens or []
-        return allergen.lower() in [a.lower() for a in allergens]
+        return normalize_allergen(allergen) in (self.metadata.allergens or EMPTY_TUPLE)
     
     def get_nutritional_summary(self) -> str:
         """Get formatted nutritional summary"""
@@ -176,6 +334,7 @@ class MenuItemBase(ABC):
         """Convert menu item to dictionary"""
         restrictions = self.metadata.dietary_restrictions or []
         allergens = self.metadata.allergens or []
+        preparation_style = self.metadata.preparation_style
         
         return {
             'name': self.name,
@@ -188,6 +347,9 @@ class MenuItemBase(ABC):
             'spice_level': self.metadata.spice_level,
             'dietary_restrictions': [d.value for d in restrictions],
             'allergens': list(allergens),
+            'ingredients': list(self.metadata.ingredients or []),
+            'preparation_style': preparation_style.value if preparation_style else None,
+            'origin': self.metadata.origin,
             'nutritional_info': self.nutritional_info.to_dict(),
             'preparation_time': self.get_preparation_time(),
             'created_at': self.created_at.isoformat()
@@ -211,6 +373,18 @@ class MenuItemBase(ABC):
         
         return base_str
     
+    @staticmethod
+    def cache_metrics() -> Dict[str, Dict[str, Any]]:
+        """Hit/miss counters of the memoized item methods"""
+        return {method_name: metrics.to_dict() for method_name, metrics in CACHE_METRICS.items()}
+    
+    @staticmethod
+    def reset_cache_metrics() -> None:
+        """Zero the memoization counters"""
+        for metrics in CACHE_METRICS.values():
+            metrics.hits = 0
+            metrics.misses = 0
+    
     def __eq__(self, other) -> bool:
         """Equality comparison based on name and category"""
         if not isinstance(other, MenuItemBase):
@@ -0,0 +1,147 @@
+"""Menu Change Log - Versioned, append-only record of menu mutations"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Entry operations
+OP_ADD = "add"
+OP_REMOVE = "remove"
+OP_PRICE = "price"
+OP_AVAILABILITY = "availability"
+
+ChangeEntry = Tuple[int, str, str, Any]
+
+# Entries kept for delta sync while no consumer is registered
+DEFAULT_RETENTION = 10_000
+
+
+class MenuChangeLog:
+    """
+    Append-only log of (version, operation, name, value) entries
+
+    Every manager operation bumps the version once and appends one entry
+    per item it changed, so a bulk update is a single version. Add entries
+    carry no value; the manager renders the item when a delta is requested.
+    Registered consumers acknowledge the versions they have applied and
+    entries every consumer has seen are dropped. Without consumers only
+    the newest ``retention`` entries are kept. A client that falls behind
+    the oldest kept entry has to resynchronize from a full export.
+    Compaction replaces the entry list instead of shortening it, so a
+    ``frozen`` copy keeps reading the entries it was made with.
+    """
+
+    retention = DEFAULT_RETENTION
+
+    def __init__(self, retention: int = DEFAULT_RETENTION):
+        if retention < 0:
+            raise ValueError(f"retention must not be negative, got {retention}")
+        self.retention = retention
+        self.version = 0
+        self._entries: List[ChangeEntry] = []
+        self._floor = 0
+        self._consumers: Dict[str, int] = {}
+
+    @property
+    def floor(self) -> int:
+        """Oldest version a delta can start from"""
+        return self._floor
+
+    def frozen(self) -> 'MenuChangeLog':
+        """
+        Read-only copy of the log as of the current version
+
+        The copy shares the entry list, which only grows past its version,
+        so making one costs nothing. Do not record into it.
+        """
+        clone = MenuChangeLog.__new__(MenuChangeLog)
+        clone.retention = self.retention
+        clone.version = self.version
+        clone._entries = self._entries
+        clone._floor = self._floor
+        clone._consumers = {}
+        return clone
+
+    def record(self, operation: str, name: str, value: Any = None) -> int:
+        """Bump the version and log a single change"""
+        self.version += 1
+        self._entries.append((self.version, operation, name, value))
+        self._trim()
+        return self.version
+
+    def record_many(self, operation: str, changes: Iterable[Tuple[str, Any]]) -> int:
+        """Bump the version once and log every (name, value) change under it"""
+        version = self.version + 1
+        entries = [(version, operation, name, value) for name, value in changes]
+        if entries:
+            self.version = version
+            self._entries.extend(entries)
+            self._trim()
+        return self.version
+
+    def entries_since(self, version: int) -> Optional[List[ChangeEntry]]:
+        """Entries newer than ``version``, or None when they were compacted away"""
+        if version < self._floor:
+            return None
+        return self._entries[self._start_of(version):self._start_of(self.version)]
+
+    def register_consumer(self, consumer: str) -> int:
+        """Track a consumer starting from the current version"""
+        self._consumers[consumer] = self.version
+        return self.version
+
+    def unregister_consumer(self, consumer: str) -> None:
+        """Stop tracking a consumer so it no longer holds back compaction"""
+        if self._consumers.pop(consumer, None) is not None:
+            self.compact()
+
+    def acknowledge(self, consumer: str, version: int) -> int:
+        """
+        Record that a consumer applied every change up to ``version``
+
+        Returns the number of entries compacted as a result.
+        """
+        if consumer not in self._consumers:
+            raise KeyError(f"Unknown change log consumer '{consumer}'")
+        self._consumers[consumer] = max(self._consumers[consumer], min(version, self.version))
+        return self.compact()
+
+    def compact(self) -> int:
+        """
+        Drop entries every registered consumer has acknowledged
+
+        Without consumers, drops all but the newest ``retention`` entries;
+        a version is always dropped or kept as a whole.
+        """
+        entries = self._entries
+        if self._consumers:
+            horizon = min(self._consumers.values())
+        elif len(entries) > self.retention:
+            horizon = entries[len(entries) - self.retention - 1][0]
+        else:
+            return 0
+        if horizon <= self._floor:
+            return 0
+
+        cut = self._start_of(horizon)
+        self._entries = self._entries[cut:]
+        self._floor = horizon
+        return cut
+
+    def _trim(self) -> None:
+        """Compact an unconsumed log once it has grown to twice its retention"""
+        if not self._consumers and len(self._entries) >= 2 * self.retention:
+            self.compact()
+
+    def _start_of(self, version: int) -> int:
+        """Position of the first entry newer than ``version``"""
+        entries = self._entries
+        low, high = 0, len(entries)
+        while low < high:
+            middle = (low + high) // 2
+            if entries[middle][0] <= version:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,510 @@
+"""
+Columnar Menu Store - Array-backed menu storage for analytics-scale catalogs
+
+Prices, spice levels, flags, category codes and creation times live in
+``array`` columns (viewed as NumPy arrays when NumPy is installed); names
+and other strings are interned. ``ColumnarMenuManager`` exposes the regular
+MenuManager API on top of the columns and hands out MenuItemBase views that
+are built on demand.
+"""
+
+import pickle
+import sys
+import weakref
+from array import array
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from .base import (
+    MenuItemBase, MenuCategory, MenuItemMetadata, DietaryRestriction, normalize_allergens, normalize_dietary
+)
+from .menu_item_factory import AppetizerItem, MainCourseItem, DessertItem, BeverageItem
+from .menu_manager import MenuManager
+from .flyweight import MenuFlyweightPool
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the array module covers the same columns
+    np = None
+
+
+# Bits of the flags column
+FLAG_AVAILABLE = 1
+FLAG_CHEF_SPECIAL = 2
+FLAG_SEASONAL = 4
+
+# Category code 0 means "no menu category"
+CATEGORY_CODES: Dict[MenuCategory, int] = {
+    category: code for code, category in enumerate(MenuCategory, start=1)
+}
+
+# Built-in item classes; every store's class table starts with them
+ITEM_CLASSES: Tuple[Type[MenuItemBase], ...] = (AppetizerItem, MainCourseItem, DessertItem, BeverageItem)
+
+# Slots each item class adds to MenuItemBase, filled in on first use
+_EXTRA_SLOTS: Dict[Type[MenuItemBase], Tuple[str, ...]] = {}
+
+
+def _extra_slots(item_class: Type[MenuItemBase]) -> Tuple[str, ...]:
+    """
+    The slots an item class declares beyond MenuItemBase
+
+    Collected over the whole MRO, base classes first, with private names
+    mangled the way Python stores them, as copy and pickle do.
+    """
+    slots = _EXTRA_SLOTS.get(item_class)
+    if slots is not None:
+        return slots
+    names: List[str] = []
+    for cls in reversed(item_class.__mro__):
+        if cls is MenuItemBase or not issubclass(cls, MenuItemBase):
+            continue
+        declared = vars(cls).get('__slots__', ())
+        if isinstance(declared, str):
+            declared = (declared,)
+        for slot in declared:
+            if slot in ('__dict__', '__weakref__'):
+                continue
+            if slot.startswith('__') and not slot.endswith('__'):
+                slot = f"_{cls.__name__.lstrip('_')}{slot}"
+            if slot not in names:
+                names.append(slot)
+    slots = _EXTRA_SLOTS[item_class] = tuple(names)
+    return slots
+
+
+class ColumnarMenuStore:
+    """
+    Column storage for menu items
+
+    Each item is a row. Hot numeric fields are kept in typed columns and the
+    remaining descriptive fields in a compact per-row tuple. Removing an item
+    moves the last row into the freed position so columns stay dense. The
+    ``kinds`` column holds positions in the store's own ``item_classes``
+    table, which is pickled with it, so other item classes can be stored
+    without the codes depending on what else the process has loaded.
+    """
+
+    def __init__(self):
+        self.prices = array('d')
+        self.spice_levels = array('b')
+        self.flags = array('B')
+        self.category_codes = array('B')
+        self.kinds = array('B')
+        self.created_at = array('d')
+        self.names: List[str] = []
+        self.details: List[Tuple] = []
+        self.item_classes: List[Type[MenuItemBase]] = list(ITEM_CLASSES)
+        self._row_of: Dict[str, int] = {}
+        self._kind_of: Dict[Type[MenuItemBase], int] = {}
+        self._index_kinds()
+
+    def append(self, item: MenuItemBase, menu_category: Optional[MenuCategory]) -> int:
+        """Decompose an item into a new row"""
+        metadata = item.metadata
+        flags = (
+            (FLAG_AVAILABLE if item.available else 0)
+            | (FLAG_CHEF_SPECIAL if metadata.chef_special else 0)
+            | (FLAG_SEASONAL if metadata.seasonal else 0)
+        )
+        item_class = type(item)
+        kind = self._kind_of.get(item_class)
+        if kind is None:
+            kind = self._kind_of[item_class] = len(self.item_classes)
+            self.item_classes.append(item_class)
+
+        row = len(self.names)
+        self.prices.append(item.price)
+        self.spice_levels.append(metadata.spice_level)
+        self.flags.append(flags)
+        self.category_codes.append(CATEGORY_CODES.get(menu_category, 0))
+        self.kinds.append(kind)
+        self.created_at.append(item.created_at.timestamp())
+        self.names.append(sys.intern(item.name))
+        self.details.append((
+            item.description,
+            item.nutritional_info,
+            metadata.preparation_style,
+            metadata.dietary_restrictions,
+            metadata.ingredients,
+            metadata.allergens,
+            metadata.origin,
+            tuple(getattr(item, slot) for slot in _extra_slots(item_class))
+        ))
+        self._row_of[item.name] = row
+        return row
+
+    def remove(self, name: str) -> None:
+        """Drop a row, filling the gap with the last row"""
+        row = self._row_of.pop(name)
+        last = len(self.names) - 1
+
+        if row != last:
+            for column in self._columns():
+                column[row] = column[last]
+            self._row_of[self.names[row]] = row
+
+        for column in self._columns():
+            del column[last]
+
+    def row_of(self, name: str) -> Optional[int]:
+        """Row number of an item"""
+        return self._row_of.get(name)
+
+    def set_price(self, name: str, price: float) -> None:
+        self.prices[self._row_of[name]] = price
+
+    def set_flag(self, name: str, flag: int, enabled: bool) -> None:
+        row = self._row_of[name]
+        if enabled:
+            self.flags[row] |= flag
+        else:
+            self.flags[row] &= ~flag
+
+    def materialize(self, row: int) -> MenuItemBase:
+        """Build a MenuItemBase view of a row"""
+        (description, nutritional_info, preparation_style, dietary_restrictions,
+         ingredients, allergens, origin, extras) = self.details[row]
+        item_class = self.item_classes[self.kinds[row]]
+        flags = self.flags[row]
+
+        item = item_class.__new__(item_class)
+        item.name = self.names[row]
+        item.price = self.prices[row]
+        item.description = description
+        item.nutritional_info = nutritional_info
+        item.metadata = MenuItemMetadata(
+            chef_special=bool(flags & FLAG_CHEF_SPECIAL),
+            seasonal=bool(flags & FLAG_SEASONAL),
+            spice_level=self.spice_levels[row],
+            preparation_style=preparation_style,
+            dietary_restrictions=dietary_restrictions,
+            ingredients=ingredients,
+            allergens=allergens,
+            origin=origin
+        )
+        item.available = bool(flags & FLAG_AVAILABLE)
+        item.created_at = datetime.fromtimestamp(self.created_at[row])
+        for slot, value in zip(_extra_slots(item_class), extras):
+            setattr(item, slot, value)
+        item.category = item.get_category()
+        return item
+
+    # ===== VECTORIZED QUERIES =====
+
+    def select(self,
+               category: Optional[MenuCategory] = None,
+               required_flags: int = 0,
+               min_price: Optional[float] = None,
+               max_price: Optional[float] = None,
+               max_spice_level: Optional[int] = None,
+               excluded_flags: int = 0,
+               min_spice_level: Optional[int] = None) -> List[str]:
+        """Names of the rows matching every condition, in row order"""
+        names = self.names
+        return [names[row] for row in self.select_rows(category, required_flags, min_price, max_price,
+                                                       max_spice_level, excluded_flags, min_spice_level)]
+
+    def select_rows(self,
+                    category: Optional[MenuCategory] = None,
+                    required_flags: int = 0,
+                    min_price: Optional[float] = None,
+                    max_price: Optional[float] = None,
+                    max_spice_level: Optional[int] = None,
+                    excluded_flags: int = 0,
+                    min_spice_level: Optional[int] = None) -> List[int]:
+        """
+        Rows matching every condition, in row order
+
+        ``required_flags`` must all be set and ``excluded_flags`` all clear;
+        None leaves a bound open.
+        """
+        if np is not None:
+            mask = np.ones(len(self.names), dtype=bool)
+            if category is not None:
+                mask &= self._np(self.category_codes) == CATEGORY_CODES[category]
+            if required_flags or excluded_flags:
+                mask &= (self._np(self.flags) & (required_flags | excluded_flags)) == required_flags
+            if min_price is not None:
+                mask &= self._np(self.prices) >= min_price
+            if max_price is not None:
+                mask &= self._np(self.prices) <= max_price
+            if min_spice_level is not None:
+                mask &= self._np(self.spice_levels) >= min_spice_level
+            if max_spice_level is not None:
+                mask &= self._np(self.spice_levels) <= max_spice_level
+            return np.flatnonzero(mask).tolist()
+
+        rows = range(len(self.names))
+        if category is not None:
+            code = CATEGORY_CODES[category]
+            codes = self.category_codes
+            rows = [row for row in rows if codes[row] == code]
+        if required_flags or excluded_flags:
+            flags = self.flags
+            checked = required_flags | excluded_flags
+            rows = [row for row in rows if flags[row] & checked == required_flags]
+        if min_price is not None or max_price is not None:
+            low = float('-inf') if min_price is None else min_price
+            high = float('inf') if max_price is None else max_price
+            prices = self.prices
+            rows = [row for row in rows if low <= prices[row] <= high]
+        if min_spice_level is not None or max_spice_level is not None:
+            low = -128 if min_spice_level is None else min_spice_level
+            high = 127 if max_spice_level is None else max_spice_level
+            spice = self.spice_levels
+            rows = [row for row in rows if low <= spice[row] <= high]
+        return list(rows)
+
+    def count_flags(self, flags: int) -> int:
+        """Number of rows carrying every given flag"""
+        if np is not None:
+            return int(np.count_nonzero((self._np(self.flags) & flags) == flags))
+        return sum(1 for value in self.flags if value & flags == flags)
+
+    def category_counts(self) -> Dict[str, int]:
+        """Rows per menu category"""
+        counts = {category.value: 0 for category in MenuCategory}
+        if np is not None:
+            totals = np.bincount(self._np(self.category_codes), minlength=len(CATEGORY_CODES) + 1)
+        else:
+            totals = [0] * (len(CATEGORY_CODES) + 1)
+            for code in self.category_codes:
+                totals[code] += 1
+        for category, code in CATEGORY_CODES.items():
+            counts[category.value] = int(totals[code])
+        return counts
+
+    def price_statistics(self) -> Dict[str, float]:
+        """Min, max, mean and upper median of the price column"""
+        if not self.names:
+            return {}
+        if np is not None:
+            prices = self._np(self.prices)
+            middle = len(prices) // 2
+            return {
+                'min_price': float(prices.min()),
+                'max_price': float(prices.max()),
+                'average_price': float(prices.mean()),
+                'median_price': float(np.partition(prices, middle)[middle])
+            }
+        prices = self.prices
+        return {
+            'min_price': min(prices),
+            'max_price': max(prices),
+            'average_price': sum(prices) / len(prices),
+            'median_price': sorted(prices)[len(prices) // 2]
+        }
+
+    # ===== SNAPSHOT SUPPORT =====
+
+    _ARRAY_COLUMNS = ('prices', 'spice_levels', 'flags', 'category_codes', 'kinds', 'created_at')
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Hand numeric columns to pickle as out-of-band buffers"""
+        state = self.__dict__.copy()
+        for column in self._ARRAY_COLUMNS:
+            values = state[column]
+            state[column] = (values.typecode, pickle.PickleBuffer(values))
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for column in self._ARRAY_COLUMNS:
+            typecode, buffer = state[column]
+            values = array(typecode)
+            values.frombytes(buffer)
+            state[column] = values
+        self.__dict__.update(state)
+        if 'item_classes' not in state:
+            # Older stores used the shared table, which starts with the same classes
+            self.item_classes = list(ITEM_CLASSES)
+        self._index_kinds()
+
+    def _index_kinds(self) -> None:
+        self._kind_of = {item_class: kind for kind, item_class in enumerate(self.item_classes)}
+
+    def _np(self, column: array):
+        """Zero-copy NumPy view of a column"""
+        return np.frombuffer(column, dtype=column.typecode)
+
+    def _columns(self):
+        return (self.prices, self.spice_levels, self.flags, self.category_codes,
+                self.kinds, self.created_at, self.names, self.details)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._row_of
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._row_of)
+
+
+class ColumnarItemView(Mapping):
+    """
+    Read-only name -> item mapping over a ColumnarMenuStore
+
+    Items are materialized on access. Views stay cached while something
+    holds a reference to them, so repeated lookups return the same object.
+    """
+
+    def __init__(self, store: ColumnarMenuStore):
+        self._store = store
+        self._views: "weakref.WeakValueDictionary[str, MenuItemBase]" = weakref.WeakValueDictionary()
+
+    def __getitem__(self, name: str) -> MenuItemBase:
+        item = self._views.get(name)
+        if item is not None:
+            return item
+        row = self._store.row_of(name)
+        if row is None:
+            raise KeyError(name)
+        item = self._store.materialize(row)
+        self._views[name] = item
+        return item
+
+    def __reduce__(self):
+        """Pickle only the store; cached views are rebuilt on demand"""
+        return (ColumnarItemView, (self._store,))
+
+    def cached(self, name: str) -> Optional[MenuItemBase]:
+        """The live view of an item, if one exists"""
+        return self._views.get(name)
+
+    def forget(self, name: str) -> None:
+        self._views.pop(name, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store)
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._store
+
+
+class ColumnarMenuManager(MenuManager):
+    """
+    MenuManager backed by a ColumnarMenuStore
+
+    Items are not kept as objects; ``get_item`` and every listing return
+    views built from the columns. Change prices and availability through
+    the manager (``update_item`` for other fields) - edits made directly
+    on a view are not written back.
+
+    Category listings scan the columns. With NumPy installed, facet
+    queries (``query``, the facet-driven ``find`` plans and the listings
+    built on them) and price ranges are vectorized column scans as well;
+    without it the facet bitsets answer them, which beats per-row loops.
+    The running statistics stay incremental, and the columns serve the
+    full recomputation behind ``debug_statistics``.
+    """
+
+    def __init__(self, debug_statistics: bool = False, flyweights: Optional[MenuFlyweightPool] = None):
+        super().__init__(debug_statistics=debug_statistics, flyweights=flyweights)
+        self._store = ColumnarMenuStore()
+        self._items = ColumnarItemView(self._store)
+
+    def get_items_by_category(self, category: MenuCategory) -> List[MenuItemBase]:
+        """Get all items in a specific category"""
+        return [self._items[name] for name in self._store.select(category=category)]
+
+    def get_items_by_price_range(self, min_price: float, max_price: float) -> List[MenuItemBase]:
+        """Get available items within a specific price range, cheapest first"""
+        if np is None:
+            return super().get_items_by_price_range(min_price, max_price)
+        store = self._store
+        prices, names = store.prices, store.names
+        rows = store.select_rows(required_flags=FLAG_AVAILABLE, min_price=min_price, max_price=max_price)
+        rows.sort(key=lambda row: (prices[row], names[row]))
+        return [self._items[names[row]] for row in rows]
+
+    def _facet_names(self,
+                     category: Optional[MenuCategory] = None,
+                     dietary: Union[DietaryRestriction, Iterable[DietaryRestriction], None] = None,
+                     chef_special: Optional[bool] = None,
+                     seasonal: Optional[bool] = None,
+                     min_spice_level: Optional[int] = None,
+                     max_spice_level: Optional[int] = None,
+                     available: Optional[bool] = True,
+                     exclude_allergens: Optional[Iterable[str]] = None) -> List[str]:
+        """Scan the columns for the facets, then check dietary and allergen facets on the matching rows"""
+        if np is None:
+            return super()._facet_names(category, dietary, chef_special, seasonal,
+                                        min_spice_level, max_spice_level, available, exclude_allergens)
+        required = excluded = 0
+        for flag, wanted in ((FLAG_CHEF_SPECIAL, chef_special), (FLAG_SEASONAL, seasonal),
+                             (FLAG_AVAILABLE, available)):
+            if wanted:
+                required |= flag
+            elif wanted is not None:
+                excluded |= flag
+
+        store = self._store
+        rows = store.select_rows(category, required, max_spice_level=max_spice_level,
+                                 excluded_flags=excluded, min_spice_level=min_spice_level)
+        restrictions = set(normalize_dietary(dietary))
+        allergens = set(normalize_allergens(exclude_allergens))
+        if restrictions or allergens:
+            details = store.details
+            rows = [row for row in rows
+                    if restrictions.issubset(details[row][3]) and allergens.isdisjoint(details[row][5])]
+        names = store.names
+        return [names[row] for row in rows]
+
+    def recompute_menu_statistics(self) -> Dict[str, Any]:
+        """Compute menu statistics from the columns"""
+        store = self._store
+        total_items = len(store)
+        available_items = store.count_flags(FLAG_AVAILABLE)
+
+        return {
+            'total_items': total_items,
+            'available_items': available_items,
+            'unavailable_items': total_items - available_items,
+            'category_counts': store.category_counts(),
+            'price_statistics': store.price_statistics(),
+            'dietary_statistics': self._calculate_dietary_statistics(),
+            'chef_specials': store.count_flags(FLAG_AVAILABLE | FLAG_CHEF_SPECIAL),
+            'seasonal_items': store.count_flags(FLAG_AVAILABLE | FLAG_SEASONAL)
+        }
+
+    def _calculate_dietary_statistics(self) -> Dict[str, int]:
+        """Count dietary restrictions straight from the row details"""
+        counts = {restriction.value: 0 for restriction in DietaryRestriction}
+        for details in self._store.details:
+            for restriction in details[3]:
+                counts[restriction.value] += 1
+        return counts
+
+    def _store_item(self, item: MenuItemBase, menu_category: Optional[MenuCategory]) -> None:
+        self._store.append(item, menu_category)
+
+    def _normalize_stored_allergens(self) -> None:
+        self._store.details = [
+            details[:5] + (normalize_allergens(details[5]),) + details[6:] for details in self._store.details
+        ]
+
+    def _discard_item(self, item: MenuItemBase, menu_category: Optional[MenuCategory]) -> None:
+        self._store.remove(item.name)
+        self._items.forget(item.name)
+
+    def _write_price(self, item: MenuItemBase, price: float) -> MenuItemBase:
+        self._store.set_price(item.name, price)
+        item.price = price
+        return item
+
+    def _write_availability(self, item: MenuItemBase, available: bool) -> MenuItemBase:
+        self._store.set_flag(item.name, FLAG_AVAILABLE, available)
+        item.available = available
+        return item
+
+    def _write_fields(self, item: MenuItemBase, changes: Dict[str, Any]) -> MenuItemBase:
+        """Apply the changes to the item's view and rewrite its row"""
+        item = super()._write_fields(item, changes)
+        self._store.remove(item.name)
+        self._store.append(item, self._map_food_to_menu_category(item.get_category()))
+        return item
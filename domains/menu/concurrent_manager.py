@@ -0,0 +1,426 @@
+"""
+Concurrent Menu Manager - MenuManager safe to read from many threads
+
+Writers are serialized by a lock and publish an immutable
+``MenuReadSnapshot`` when each write commits. The snapshot holds the item
+mapping and the index objects of that version; before a later write
+changes one of them the writer replaces it with a copy, and changes to an
+item go to a copy of the item. Readers grab the snapshot
+with a single attribute read, so lookups, listings, queries, searches,
+statistics, deltas and exports never wait for a writer.
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .base import MenuItemBase, MenuCategory, DietaryRestriction
+from .menu_manager import MenuManager
+from .flyweight import MenuFlyweightPool
+from .menu_query import MenuQuery, QueryPlan
+from .pagination import MenuPage, DEFAULT_PAGE_SIZE
+from .payload_cache import MenuPayloadCache
+
+# Structures each kind of write changes; the writer copies the ones the
+# published snapshot still holds before starting
+PRICE_STATE = ('_items', '_categories', '_price_index', '_statistics')
+AVAILABILITY_STATE = ('_items', '_categories', '_facet_index', '_statistics')
+MENU_STATE = ('_items', '_categories', '_search_index', '_fuzzy_search',
+              '_facet_index', '_price_index', '_name_index', '_statistics')
+
+
+class _PooledTextIndex:
+    """A flyweight pool's shared text index, searched under the writer lock"""
+
+    __slots__ = ('_index', '_lock')
+
+    def __init__(self, index: Any, lock: threading.RLock):
+        self._index = index
+        self._lock = lock
+
+    def search(self, query: str, *args: Any) -> List[Any]:
+        with self._lock:
+            return self._index.search(query, *args)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+
+class MenuReadSnapshot(MenuManager):
+    """
+    Immutable view of the menu at one version
+
+    Holds the item mapping, per-category mappings and indexes the writer
+    published; the writer never changes them afterwards, so every
+    MenuManager read (lookups, facet, price and text queries, pages,
+    statistics, ``changes_since`` and exports) runs on a snapshot from
+    any thread without locks and sees one consistent version. Query
+    results and item renderings are cached per snapshot. Text searches of
+    a menu whose indexes live in a flyweight pool read the pool's shared
+    indexes, which other stores change in place, so they take the writer
+    lock. Write methods raise TypeError.
+    """
+
+    def __init__(self, manager: 'ConcurrentMenuManager'):
+        self._writer = manager
+        self._items = manager._items
+        self._categories = manager._categories
+        self._listings: Dict[MenuCategory, Tuple[MenuItemBase, ...]] = {}
+        self._search_index = manager._search_index
+        self._fuzzy_search = manager._fuzzy_search
+        if manager.flyweights is not None:
+            self._search_index = _PooledTextIndex(self._search_index, manager._lock)
+            self._fuzzy_search = _PooledTextIndex(self._fuzzy_search, manager._lock)
+        self._facet_index = manager._facet_index
+        self._price_index = manager._price_index
+        self._name_index = manager._name_index
+        self._statistics = manager._statistics
+        self._change_log = manager._change_log.frozen()
+        self._query_cache: 'OrderedDict[tuple, tuple]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._renderings: Optional[MenuPayloadCache] = None
+        self.debug_statistics = manager.debug_statistics
+        self.flyweights = manager.flyweights
+
+    @property
+    def _payload_cache(self) -> MenuPayloadCache:
+        """Item renderings of this version, started from the newest earlier ones on first use"""
+        cache = self._renderings
+        if cache is None:
+            with self._cache_lock:
+                cache = self._renderings
+                if cache is None:
+                    cache = self._renderings = self._writer._fork_renderings(self)
+        return cache
+
+    def get_items_by_category(self, category: MenuCategory) -> List[MenuItemBase]:
+        """Get all items in a specific category, as a new list"""
+        listing = self._listings.get(category)
+        if listing is None:
+            listing = self._listings[category] = tuple(self._categories.get(category, {}).values())
+        return list(listing)
+
+    def _cached_query(self, key: tuple) -> Optional[tuple]:
+        with self._cache_lock:
+            return super()._cached_query(key)
+
+    def _cache_query(self, key: tuple, result: tuple) -> None:
+        with self._cache_lock:
+            super()._cache_query(key, result)
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("MenuReadSnapshot is read-only; write through the ConcurrentMenuManager")
+
+    add_item = add_items = remove_item = _read_only
+    update_item_availability = update_item_price = _read_only
+    bulk_update_prices = reprice_by_percentage = bulk_set_availability = _read_only
+    update_item = reindex_item = use_flyweights = import_menu_data = import_jsonl = _read_only
+    register_sync_consumer = unregister_sync_consumer = acknowledge_changes = _read_only
+    save_snapshot = _read_only
+
+    def __getstate__(self) -> Dict[str, Any]:
+        raise TypeError("MenuReadSnapshot cannot be pickled; save the ConcurrentMenuManager instead")
+
+    def __iter__(self) -> Iterator[MenuItemBase]:
+        return iter(self._items.values())
+
+    def __repr__(self) -> str:
+        return f"MenuReadSnapshot(version={self.version}, items={len(self._items)})"
+
+
+class ConcurrentMenuManager(MenuManager):
+    """
+    MenuManager for many reader threads and a background writer
+
+    Every mutation runs under one writer lock and publishes a new
+    snapshot when it commits. Reads go to the published snapshot and
+    never wait for the writer, except text searches on menus using a
+    flyweight pool (see MenuReadSnapshot). Each write first copies the
+    item mapping and indexes it changes that the snapshot still holds,
+    which costs time linear in the menu size; run many single writes
+    inside ``batch()`` so they share one copy and one publish, or use the
+    bulk methods and ``add_items``.
+
+    Change item fields with ``update_item`` rather than on the item
+    itself: items are shared with published snapshots, and
+    ``reindex_item`` cannot hide an in-place edit from their readers.
+    """
+
+    def __init__(self, debug_statistics: bool = False, flyweights: Optional[MenuFlyweightPool] = None):
+        self._lock = threading.RLock()
+        self._depth = 0
+        super().__init__(debug_statistics=debug_statistics, flyweights=flyweights)
+        self._categories: Dict[MenuCategory, Dict[str, MenuItemBase]] = {
+            category: {} for category in MenuCategory
+        }
+        self._renderings: Optional[MenuPayloadCache] = None
+        self._publish()
+
+    def snapshot(self) -> MenuReadSnapshot:
+        """The snapshot published by the last committed write"""
+        return self._published
+
+    @contextmanager
+    def batch(self) -> Iterator['ConcurrentMenuManager']:
+        """
+        Group writes into one commit
+
+        Writes made inside the block copy the published state once and
+        publish a single snapshot when the block exits; until then readers,
+        including this thread, keep seeing the previous snapshot.
+        """
+        with self._writing(MENU_STATE):
+            yield self
+
+    # Reads, all answered by the published snapshot
+
+    def get_item(self, name: str) -> Optional[MenuItemBase]:
+        """Get a menu item by name"""
+        return self._published.get_item(name)
+
+    def get_all_items(self) -> List[MenuItemBase]:
+        """Get all menu items"""
+        return self._published.get_all_items()
+
+    def get_items_by_category(self, category: MenuCategory) -> List[MenuItemBase]:
+        """Get all items in a specific category, as a new list"""
+        return self._published.get_items_by_category(category)
+
+    def filter_items(self, filter_func: Union[Callable[[MenuItemBase], bool], MenuQuery]) -> List[MenuItemBase]:
+        return self._published.filter_items(filter_func)
+
+    def iter_item_records(self) -> Iterator[Dict[str, Any]]:
+        """Yield each item's dictionary form from one consistent snapshot"""
+        return self._published.iter_item_records()
+
+    def search_items(self, query: str, use_index: bool = True) -> List[MenuItemBase]:
+        return self._published.search_items(query, use_index)
+
+    def fuzzy_search_items(self, query: str, limit: int = 10) -> List[MenuItemBase]:
+        return self._published.fuzzy_search_items(query, limit)
+
+    def query(self,
+              category: Optional[MenuCategory] = None,
+              dietary: Union[DietaryRestriction, Iterable[DietaryRestriction], None] = None,
+              chef_special: Optional[bool] = None,
+              seasonal: Optional[bool] = None,
+              min_spice_level: Optional[int] = None,
+              max_spice_level: Optional[int] = None,
+              available: Optional[bool] = True,
+              exclude_allergens: Optional[Iterable[str]] = None) -> List[MenuItemBase]:
+        return self._published.query(category, dietary, chef_special, seasonal,
+                                     min_spice_level, max_spice_level, available, exclude_allergens)
+
+    def get_allergens(self) -> List[str]:
+        return self._published.get_allergens()
+
+    def find(self, query: MenuQuery) -> List[MenuItemBase]:
+        return self._published.find(query)
+
+    def plan(self, query: MenuQuery) -> QueryPlan:
+        return self._published.plan(query)
+
+    def get_page(self, order_by: str = "category", cursor: Optional[str] = None,
+                 limit: int = DEFAULT_PAGE_SIZE, category: Optional[MenuCategory] = None,
+                 available: Optional[bool] = True) -> MenuPage:
+        return self._published.get_page(order_by, cursor, limit, category, available)
+
+    def iter_pages(self, order_by: str = "category", page_size: int = DEFAULT_PAGE_SIZE,
+                   category: Optional[MenuCategory] = None,
+                   available: Optional[bool] = True) -> Iterator[MenuPage]:
+        """Yield every page of an ordered listing, all from one snapshot"""
+        return self._published.iter_pages(order_by, page_size, category, available)
+
+    def get_items_by_price_range(self, min_price: float, max_price: float) -> List[MenuItemBase]:
+        return self._published.get_items_by_price_range(min_price, max_price)
+
+    def get_cheapest_items(self, count: int) -> List[MenuItemBase]:
+        return self._published.get_cheapest_items(count)
+
+    def get_most_expensive_items(self, count: int) -> List[MenuItemBase]:
+        return self._published.get_most_expensive_items(count)
+
+    def get_menu_statistics(self) -> Dict[str, Any]:
+        return self._published.get_menu_statistics()
+
+    def recompute_menu_statistics(self) -> Dict[str, Any]:
+        return self._published.recompute_menu_statistics()
+
+    def changes_since(self, version: int) -> Optional[Dict[str, Any]]:
+        return self._published.changes_since(version)
+
+    def export_menu_data(self) -> Dict[str, Any]:
+        return self._published.export_menu_data()
+
+    def export_menu_payload(self, compress: bool = False) -> bytes:
+        return self._published.export_menu_payload(compress)
+
+    # Writes
+
+    def add_item(self, item: MenuItemBase) -> bool:
+        with self._writing(MENU_STATE):
+            return super().add_item(item)
+
+    def add_items(self, items: Iterable[MenuItemBase]) -> int:
+        with self._writing(MENU_STATE):
+            return super().add_items(items)
+
+    def remove_item(self, name: str) -> bool:
+        with self._writing(MENU_STATE):
+            return super().remove_item(name)
+
+    def update_item_availability(self, name: str, available: bool) -> bool:
+        with self._writing(AVAILABILITY_STATE):
+            return super().update_item_availability(name, available)
+
+    def update_item_price(self, name: str, new_price: float) -> bool:
+        with self._writing(PRICE_STATE):
+            return super().update_item_price(name, new_price)
+
+    def bulk_update_prices(self, prices: Dict[str, float]) -> int:
+        with self._writing(PRICE_STATE):
+            return super().bulk_update_prices(prices)
+
+    def reprice_by_percentage(self, percent: float, category: Optional[MenuCategory] = None,
+                              names: Optional[Iterable[str]] = None, decimals: int = 2) -> int:
+        with self._lock:
+            return super().reprice_by_percentage(percent, category, names, decimals)
+
+    def bulk_set_availability(self, names: Iterable[str], available: bool) -> int:
+        with self._writing(AVAILABILITY_STATE):
+            return super().bulk_set_availability(names, available)
+
+    def update_item(self, name: str, /, **changes: Any) -> bool:
+        with self._writing(MENU_STATE):
+            return super().update_item(name, **changes)
+
+    def reindex_item(self, name: str) -> bool:
+        with self._writing(MENU_STATE):
+            return super().reindex_item(name)
+
+    def use_flyweights(self, flyweights: MenuFlyweightPool) -> int:
+        with self._writing(MENU_STATE):
+            return super().use_flyweights(flyweights)
+
+    def register_sync_consumer(self, consumer: str) -> int:
+        with self._lock:
+            return super().register_sync_consumer(consumer)
+
+    def unregister_sync_consumer(self, consumer: str) -> None:
+        with self._lock:
+            super().unregister_sync_consumer(consumer)
+
+    def acknowledge_changes(self, consumer: str, version: int) -> int:
+        with self._lock:
+            return super().acknowledge_changes(consumer, version)
+
+    def save_snapshot(self, path: str) -> int:
+        with self._lock:
+            return super().save_snapshot(path)
+
+    # Storage hooks
+
+    def _store_item(self, item: MenuItemBase, menu_category: Optional[MenuCategory]) -> None:
+        """Put an item into the primary storage, categories keyed by name"""
+        self._items[item.name] = item
+        if menu_category:
+            self._category_items(menu_category)[item.name] = item
+
+    def _discard_item(self, item: MenuItemBase, menu_category: Optional[MenuCategory]) -> None:
+        """Take an item out of the primary storage"""
+        del self._items[item.name]
+        if menu_category:
+            self._category_items(menu_category).pop(item.name, None)
+
+    def _write_price(self, item: MenuItemBase, price: float) -> MenuItemBase:
+        """Store a new price on a copy of the item"""
+        clone = self._replace_item(item)
+        clone.price = price
+        return clone
+
+    def _write_availability(self, item: MenuItemBase, available: bool) -> MenuItemBase:
+        """Store a new availability flag on a copy of the item"""
+        clone = self._replace_item(item)
+        clone.available = available
+        return clone
+
+    def _write_fields(self, item: MenuItemBase, changes: Dict[str, Any]) -> MenuItemBase:
+        """Store new field values on a copy of the item"""
+        return super()._write_fields(self._replace_item(item), changes)
+
+    def _replace_item(self, item: MenuItemBase) -> MenuItemBase:
+        """Swap an item for a private copy that published snapshots do not hold"""
+        clone = copy.copy(item)
+        self._items[item.name] = clone
+        menu_category = self._map_food_to_menu_category(item.get_category())
+        if menu_category:
+            self._category_items(menu_category)[item.name] = clone
+        return clone
+
+    def _category_items(self, category: MenuCategory) -> Dict[str, MenuItemBase]:
+        """A category's items for changing, copied first if the published snapshot holds them"""
+        if category in self._shared_categories:
+            self._shared_categories.discard(category)
+            self._categories[category] = dict(self._categories[category])
+        return self._categories[category]
+
+    # Publishing
+
+    @contextmanager
+    def _writing(self, state: Tuple[str, ...]) -> Iterator[None]:
+        """Hold the writer lock, detach ``state`` from the published snapshot and publish once done"""
+        with self._lock:
+            for name in state:
+                if name in self._shared:
+                    self._shared.discard(name)
+                    setattr(self, name, getattr(self, name).copy())
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+                if not self._depth:
+                    self._publish()
+
+    def _publish(self) -> None:
+        """Publish the current state as the read snapshot; the caller holds the lock"""
+        self._published = MenuReadSnapshot(self)
+        self._shared = set(MENU_STATE)
+        self._shared_categories = set(self._categories)
+
+    def _fork_renderings(self, snapshot: MenuReadSnapshot) -> MenuPayloadCache:
+        """Payload cache for a snapshot, reusing the newest renderings handed out so far"""
+        latest = self._renderings
+        cache = latest.fork(snapshot) if latest is not None else MenuPayloadCache(snapshot)
+        if latest is None or snapshot.version >= latest._version:
+            self._renderings = cache
+        return cache
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle support - the lock and the read snapshot are rebuilt on load"""
+        state = super().__getstate__()
+        for key in ('_lock', '_depth', '_published', '_shared', '_shared_categories'):
+            del state[key]
+        state['_renderings'] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        super().__setstate__(state)
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._renderings = None
+        self._publish()
+
+    def __len__(self) -> int:
+        return len(self._published)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._published
+
+    def __str__(self) -> str:
+        return f"ConcurrentMenuManager({len(self)} items)"
@@ -0,0 +1,226 @@
+"""Menu Facet Index - Bitset index for filtering menu items by facet"""
+
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+class MenuFacetIndex:
+    """
+    Bitset index over item facets
+
+    Each item owns a slot number and every facet (a dietary restriction,
+    chef special, seasonal, availability, a spice level, an allergen or a
+    category) keeps an integer whose bits mark the slots carrying it.
+    Combining filters is a bitwise AND of those integers instead of a pass
+    over every item.
+    Slots of removed items are reused by later additions. An item's facet
+    list is replaced rather than changed in place, so ``copy`` only has to
+    copy the containers.
+    """
+
+    AVAILABLE = "available"
+    CHEF_SPECIAL = "chef_special"
+    SEASONAL = "seasonal"
+
+    # Facet layout revision; 2 added allergen facets. Indexes unpickled
+    # without a schema attribute predate it.
+    SCHEMA = 2
+
+    def __init__(self):
+        self.schema = self.SCHEMA
+        self._slot_of: Dict[str, int] = {}
+        self._names: List[Optional[str]] = []
+        self._free_slots: List[int] = []
+        self._item_facets: Dict[str, List[Hashable]] = {}
+        self._bitsets: Dict[Hashable, int] = {}
+        self._all = 0
+
+    @staticmethod
+    def spice_facet(level: int) -> Hashable:
+        """Facet key for a spice level"""
+        return ("spice", level)
+
+    def spice_levels(self) -> List[int]:
+        """Spice levels currently carried by at least one item"""
+        return [facet[1] for facet in self._bitsets
+                if isinstance(facet, tuple) and facet[0] == "spice"]
+
+    @staticmethod
+    def allergen_facet(allergen: str) -> Hashable:
+        """Facet key for a normalized allergen"""
+        return ("allergen", allergen)
+
+    def allergens(self) -> List[str]:
+        """Allergens currently carried by at least one item"""
+        return [facet[1] for facet in self._bitsets
+                if isinstance(facet, tuple) and facet[0] == "allergen"]
+
+    def add(self, name: str, facets: Iterable[Hashable]) -> None:
+        """Give an item a slot and set its facet bits"""
+        if name in self._slot_of:
+            self.remove(name)
+
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._names[slot] = name
+        else:
+            slot = len(self._names)
+            self._names.append(name)
+
+        self._slot_of[name] = slot
+        self._all |= 1 << slot
+        self._item_facets[name] = []
+        for facet in facets:
+            self.set_facet(name, facet, True)
+
+    def copy(self) -> 'MenuFacetIndex':
+        """Independent copy, sharing only the immutable bitsets and facet keys"""
+        clone = MenuFacetIndex.__new__(MenuFacetIndex)
+        clone.schema = self.schema
+        clone._slot_of = dict(self._slot_of)
+        clone._names = list(self._names)
+        clone._free_slots = list(self._free_slots)
+        clone._item_facets = dict(self._item_facets)
+        clone._bitsets = dict(self._bitsets)
+        clone._all = self._all
+        return clone
+
+    def add_many(self, entries: Iterable[Tuple[str, Iterable[Hashable]]]) -> None:
+        """
+        Index a batch of (name, facets) pairs
+        
+        Bits are collected per facet in a bytearray and merged into the
+        bitsets once, instead of rewriting every bitset for each item.
+        Names must be unique within the batch.
+        """
+        pending: Dict[Hashable, List[int]] = {}
+        slots = []
+        for name, facets in entries:
+            if name in self._slot_of:
+                self.remove(name)
+            if self._free_slots:
+                slot = self._free_slots.pop()
+                self._names[slot] = name
+            else:
+                slot = len(self._names)
+                self._names.append(name)
+            self._slot_of[name] = slot
+            self._item_facets[name] = item_facets = []
+            for facet in facets:
+                if facet not in item_facets:
+                    item_facets.append(facet)
+                    pending.setdefault(facet, []).append(slot)
+            slots.append(slot)
+
+        self._all |= self._bits_for(slots)
+        for facet, facet_slots in pending.items():
+            self._bitsets[facet] = self._bitsets.get(facet, 0) | self._bits_for(facet_slots)
+
+    def remove(self, name: str) -> None:
+        """Clear an item's bits and free its slot"""
+        slot = self._slot_of.pop(name, None)
+        if slot is None:
+            return
+
+        bit = 1 << slot
+        for facet in self._item_facets.pop(name):
+            self._clear_bit(facet, bit)
+        self._all &= ~bit
+        self._names[slot] = None
+        self._free_slots.append(slot)
+
+    def set_facet(self, name: str, facet: Hashable, enabled: bool) -> None:
+        """Turn a single facet on or off for an item"""
+        slot = self._slot_of.get(name)
+        if slot is None:
+            return
+
+        bit = 1 << slot
+        facets = self._item_facets[name]
+        if enabled and facet not in facets:
+            self._item_facets[name] = facets + [facet]
+            self._bitsets[facet] = self._bitsets.get(facet, 0) | bit
+        elif not enabled and facet in facets:
+            self._item_facets[name] = [kept for kept in facets if kept != facet]
+            self._clear_bit(facet, bit)
+
+    def set_facet_many(self, names: Iterable[str], facet: Hashable, enabled: bool) -> None:
+        """Turn a facet on or off for many items with a single bitset update"""
+        changed = 0
+        for name in names:
+            slot = self._slot_of.get(name)
+            if slot is None:
+                continue
+            facets = self._item_facets[name]
+            if enabled and facet not in facets:
+                self._item_facets[name] = facets + [facet]
+            elif not enabled and facet in facets:
+                self._item_facets[name] = [kept for kept in facets if kept != facet]
+            else:
+                continue
+            changed |= 1 << slot
+
+        if not changed:
+            return
+        if enabled:
+            self._bitsets[facet] = self._bitsets.get(facet, 0) | changed
+        else:
+            self._clear_bit(facet, changed)
+
+    def has_facet(self, name: str, facet: Hashable) -> bool:
+        """Check whether an item carries a facet"""
+        return facet in self._item_facets.get(name, ())
+
+    def in_mask(self, name: str, mask: int) -> bool:
+        """Check whether an item's bit is set in a bitset"""
+        slot = self._slot_of.get(name)
+        return slot is not None and (mask >> slot) & 1 == 1
+
+    def mask(self, facet: Hashable) -> int:
+        """Bitset of the items carrying a facet"""
+        return self._bitsets.get(facet, 0)
+
+    def any_of(self, facets: Iterable[Hashable]) -> int:
+        """Bitset of the items carrying at least one of the facets"""
+        combined = 0
+        for facet in facets:
+            combined |= self._bitsets.get(facet, 0)
+        return combined
+
+    def all_items(self) -> int:
+        """Bitset of every indexed item"""
+        return self._all
+
+    def count(self, mask: int) -> int:
+        """Number of items in a bitset"""
+        return bin(mask).count("1")
+
+    def names(self, mask: int) -> List[str]:
+        """Item names for the set bits of a bitset, in slot order"""
+        names = self._names
+        bits = bin(mask)[:1:-1]
+        result = []
+        slot = bits.find("1")
+        while slot != -1:
+            result.append(names[slot])
+            slot = bits.find("1", slot + 1)
+        return result
+
+    def _bits_for(self, slots: List[int]) -> int:
+        """Build a bitset with the given slots set"""
+        if not slots:
+            return 0
+        buffer = bytearray(max(slots) // 8 + 1)
+        for slot in slots:
+            buffer[slot >> 3] |= 1 << (slot & 7)
+        return int.from_bytes(buffer, 'little')
+
+    def _clear_bit(self, facet: Hashable, bit: int) -> None:
+        """Clear bits of a facet, dropping facets that become empty"""
+        remaining = self._bitsets.get(facet, 0) & ~bit
+        if remaining:
+            self._bitsets[facet] = remaining
+        else:
+            self._bitsets.pop(facet, None)
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
@@ -0,0 +1,222 @@
+"""
+Menu Flyweights - Shared immutable item parts for multi-store processes
+
+When one brand menu is loaded into many MenuManager instances, every store
+would otherwise hold its own equal copies of each item's description,
+NutritionalInfo and MenuItemMetadata (with its ingredient and allergen
+tuples), and its own text search indexes over them. A MenuFlyweightPool
+keeps one canonical instance of each part and one reference-counted pair of
+text indexes; managers using the pool only keep the item shell with its
+per-store price and availability, plus their price and facet indexes.
+"""
+
+import dataclasses
+import operator
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .base import MenuItemBase, MenuItemMetadata, NutritionalInfo
+from .search_index import MenuSearchIndex
+from .fuzzy_search import FuzzyMenuSearch
+
+METADATA_FIELDS = tuple(field.name for field in dataclasses.fields(MenuItemMetadata))
+_metadata_key = operator.attrgetter(*METADATA_FIELDS)
+
+TextIndex = Union[MenuSearchIndex, FuzzyMenuSearch]
+
+# (name, description, ingredients) - the text an index entry was built from
+DocumentKey = Tuple[str, str, Tuple[str, ...]]
+
+
+class SharedTextIndex:
+    """
+    A text index shared by many stores
+
+    Entries are keyed by the full text they were built from rather than by
+    name, so two stores carrying different descriptions under the same name
+    get separate entries. Each entry is reference counted and dropped when
+    the last store removes it.
+    """
+
+    def __init__(self, index: TextIndex):
+        self.index = index
+        self._references: Dict[DocumentKey, int] = {}
+
+    def acquire(self, key: DocumentKey) -> None:
+        references = self._references.get(key, 0)
+        if not references:
+            name, description, ingredients = key
+            self.index.add(name, description, ingredients, key=key)
+        self._references[key] = references + 1
+
+    def release(self, key: DocumentKey) -> None:
+        references = self._references[key] - 1
+        if references:
+            self._references[key] = references
+        else:
+            del self._references[key]
+            self.index.remove(key)
+
+    def __len__(self) -> int:
+        return len(self._references)
+
+
+class SharedIndexView:
+    """
+    One store's view of a SharedTextIndex
+
+    Offers the add/remove/search interface of MenuSearchIndex and
+    FuzzyMenuSearch, restricted to the store's own items. Pickling a view
+    produces a private index with the same entries, so snapshots stay
+    self-contained.
+    """
+
+    def __init__(self, shared: SharedTextIndex):
+        self._shared = shared
+        self._keys: Dict[str, DocumentKey] = {}
+
+    def copy(self) -> 'SharedIndexView':
+        """Another view with the same items over the same shared index"""
+        clone = SharedIndexView(self._shared)
+        clone._keys = dict(self._keys)
+        return clone
+
+    def add(self, name: str, description: str, ingredients: Iterable[str]) -> None:
+        """Index an item's searchable text"""
+        self.remove(name)
+        key = (name, description or "", tuple(ingredients or ()))
+        self._shared.acquire(key)
+        self._keys[name] = key
+
+    def remove(self, name: str) -> None:
+        """Drop an item from the store's view"""
+        key = self._keys.pop(name, None)
+        if key is not None:
+            self._shared.release(key)
+
+    def search(self, query: str, *args: Any) -> List[Any]:
+        """Search the shared index, keeping only this store's items"""
+        if isinstance(self._shared.index, FuzzyMenuSearch):
+            results = self._shared.index.search(query, *args, include=self._includes)
+            return [(key[0], score) for key, score in results]
+        return [key[0] for key in self._shared.index.search(query, *args) if self._includes(key)]
+
+    def _includes(self, key: DocumentKey) -> bool:
+        return self._keys.get(key[0]) == key
+
+    def __reduce__(self):
+        return (_private_index, (type(self._shared.index), list(self._keys.values())))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._keys
+
+
+def _private_index(index_class: type, keys: List[DocumentKey]) -> TextIndex:
+    """Rebuild a store-private index from the entries of a view"""
+    index = index_class()
+    for name, description, ingredients in keys:
+        index.add(name, description, ingredients)
+    return index
+
+
+class MenuFlyweightPool:
+    """
+    Canonical instances of the immutable parts of menu items
+
+    Every shared part is immutable, so editing one store's item cannot
+    change another store's: MenuItemMetadata is frozen and a store changes
+    an item's metadata by assigning a new instance.
+    """
+
+    def __init__(self):
+        self._nutrition: Dict[NutritionalInfo, NutritionalInfo] = {}
+        self._metadata: Dict[Tuple, MenuItemMetadata] = {}
+        self._strings: Dict[str, str] = {}
+        self.search_index = SharedTextIndex(MenuSearchIndex())
+        self.fuzzy_search = SharedTextIndex(FuzzyMenuSearch())
+        self.shared_parts = 0
+        self.new_parts = 0
+
+    def share(self, item: MenuItemBase) -> MenuItemBase:
+        """Replace an item's immutable parts with their canonical instances"""
+        item.description = self.string(item.description)
+        item.nutritional_info = self.nutrition(item.nutritional_info)
+        item.metadata = self.metadata(item.metadata)
+        return item
+
+    def share_all(self, items: Iterable[MenuItemBase]) -> int:
+        """Share the parts of many items; returns the number of items"""
+        count = 0
+        for item in items:
+            self.share(item)
+            count += 1
+        return count
+
+    def search_view(self) -> SharedIndexView:
+        """A store's view of the shared substring search index"""
+        return SharedIndexView(self.search_index)
+
+    def fuzzy_view(self) -> SharedIndexView:
+        """A store's view of the shared fuzzy search index"""
+        return SharedIndexView(self.fuzzy_search)
+
+    def string(self, text: Optional[str]) -> Optional[str]:
+        """Canonical copy of a string"""
+        if not text:
+            return text
+        shared = self._strings.get(text)
+        if shared is None:
+            shared = self._strings[text] = text
+            self.new_parts += 1
+        else:
+            self.shared_parts += 1
+        return shared
+
+    def nutrition(self, info: NutritionalInfo) -> NutritionalInfo:
+        """Canonical copy of a NutritionalInfo"""
+        shared = self._nutrition.get(info)
+        if shared is None:
+            shared = self._nutrition[info] = info
+            self.new_parts += 1
+        else:
+            self.shared_parts += 1
+        return shared
+
+    def metadata(self, metadata: MenuItemMetadata) -> MenuItemMetadata:
+        """Canonical copy of a MenuItemMetadata"""
+        key = _metadata_key(metadata)
+        shared = self._metadata.get(key)
+        if shared is None:
+            shared = self._metadata[key] = metadata
+            self.new_parts += 1
+        else:
+            self.shared_parts += 1
+        return shared
+
+    def clear(self) -> None:
+        """Forget the canonical item parts; items keep the ones they hold"""
+        self._nutrition.clear()
+        self._metadata.clear()
+        self._strings.clear()
+        self.shared_parts = 0
+        self.new_parts = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size and how often parts were reused"""
+        return {
+            'strings': len(self._strings),
+            'nutritional_infos': len(self._nutrition),
+            'metadata': len(self._metadata),
+            'indexed_documents': len(self.search_index),
+            'shared_parts': self.shared_parts,
+            'new_parts': self.new_parts
+        }
+
+    def __len__(self) -> int:
+        return len(self._strings) + len(self._nutrition) + len(self._metadata)
+
+
+# Process-wide pool for callers that do not manage their own
+DEFAULT_FLYWEIGHT_POOL = MenuFlyweightPool()
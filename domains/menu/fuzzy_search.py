@@ -0,0 +1,179 @@
+"""Fuzzy Menu Search - Typo tolerant trigram similarity search over menu items"""
+
+import heapq
+import re
+from collections import Counter
+from typing import Callable, Dict, FrozenSet, Hashable, Iterable, List, Optional, Set, Tuple
+
+
+class FuzzyMenuSearch:
+    """
+    Word-level trigram similarity search
+
+    Each word of an item's name, description and ingredients is padded and
+    split into trigrams. A query word is compared with indexed words through
+    the shared-trigram postings using the Dice coefficient, so near misses
+    such as "margarita" still find "Margherita". Item scores add up the best
+    weighted similarity for every query word and the top results are picked
+    with a bounded heap. ``copy`` shares the per-gram and per-word
+    containers; each side copies a shared one the first time it changes it.
+    """
+
+    GRAM_SIZE = 3
+    DEFAULT_MIN_SIMILARITY = 0.45
+
+    # Field weights - name matches count most
+    NAME_WEIGHT = 3
+    INGREDIENT_WEIGHT = 2
+    DESCRIPTION_WEIGHT = 1
+
+    _WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+    # Grams and words whose containers this index may change in place;
+    # None when it was never copied and owns all of them
+    _owned_grams: Optional[Set[str]] = None
+    _owned_words: Optional[Set[str]] = None
+
+    def __init__(self, min_similarity: float = DEFAULT_MIN_SIMILARITY):
+        self.min_similarity = min_similarity
+        self._word_grams: Dict[str, FrozenSet[str]] = {}
+        self._gram_words: Dict[str, Set[str]] = {}
+        self._word_items: Dict[str, Dict[str, int]] = {}
+        self._item_words: Dict[str, Dict[str, int]] = {}
+
+    def copy(self) -> 'FuzzyMenuSearch':
+        """Copy of the index that shares containers until either side changes them"""
+        clone = FuzzyMenuSearch.__new__(FuzzyMenuSearch)
+        clone.min_similarity = self.min_similarity
+        clone._word_grams = dict(self._word_grams)
+        clone._gram_words = dict(self._gram_words)
+        clone._word_items = dict(self._word_items)
+        clone._item_words = dict(self._item_words)
+        clone._owned_grams, clone._owned_words = set(), set()
+        self._owned_grams, self._owned_words = set(), set()
+        return clone
+
+    def add(self, name: str, description: str, ingredients: Iterable[str],
+            key: Optional[Hashable] = None) -> None:
+        """Index an item's words with their best field weight under ``key`` (the name by default)"""
+        if key is None:
+            key = name
+        if key in self._item_words:
+            self.remove(key)
+
+        weights: Dict[str, int] = {}
+        self._collect_words(weights, description or "", self.DESCRIPTION_WEIGHT)
+        for ingredient in ingredients or ():
+            self._collect_words(weights, ingredient, self.INGREDIENT_WEIGHT)
+        self._collect_words(weights, name, self.NAME_WEIGHT)
+
+        self._item_words[key] = weights
+        for word, weight in weights.items():
+            if word not in self._word_items:
+                self._register_word(word)
+            self._items_of(word)[key] = weight
+
+    def remove(self, name: str) -> None:
+        """Drop an item and any words only it used"""
+        weights = self._item_words.pop(name, None)
+        if weights is None:
+            return
+
+        for word in weights:
+            items = self._items_of(word)
+            items.pop(name, None)
+            if not items:
+                self._unregister_word(word)
+
+    def search(self, query: str, limit: int = 10,
+               include: Optional[Callable[[Hashable], bool]] = None) -> List[Tuple[str, float]]:
+        """Return up to ``limit`` (item name, score) pairs, best first; ``include`` filters items"""
+        item_scores: Dict[str, float] = {}
+
+        for query_word in set(self._WORD_PATTERN.findall(query.lower())):
+            best: Dict[str, float] = {}
+            for word, similarity in self._similar_words(query_word):
+                for name, weight in self._word_items[word].items():
+                    score = similarity * weight
+                    if score > best.get(name, 0.0):
+                        best[name] = score
+            for name, score in best.items():
+                item_scores[name] = item_scores.get(name, 0.0) + score
+
+        candidates = item_scores.items()
+        if include is not None:
+            candidates = [entry for entry in candidates if include(entry[0])]
+        top = heapq.nlargest(limit, candidates, key=lambda entry: entry[1])
+        return [(name, round(score, 4)) for name, score in top]
+
+    def _similar_words(self, query_word: str) -> List[Tuple[str, float]]:
+        """Find indexed words whose trigram similarity passes the threshold"""
+        query_grams = self._grams_of(query_word)
+        shared = Counter()
+        for gram in query_grams:
+            shared.update(self._gram_words.get(gram, ()))
+
+        matches = []
+        query_size = len(query_grams)
+        for word, count in shared.items():
+            similarity = 2.0 * count / (query_size + len(self._word_grams[word]))
+            if similarity >= self.min_similarity:
+                matches.append((word, similarity))
+        return matches
+
+    def _collect_words(self, weights: Dict[str, int], text: str, weight: int) -> None:
+        """Record each word of a field, keeping the highest weight seen"""
+        for word in self._WORD_PATTERN.findall(text.lower()):
+            if weight > weights.get(word, 0):
+                weights[word] = weight
+
+    def _register_word(self, word: str) -> None:
+        """Add a new vocabulary word to the gram postings"""
+        grams = self._grams_of(word)
+        self._word_grams[word] = grams
+        self._word_items[word] = {}
+        if self._owned_words is not None:
+            self._owned_words.add(word)
+        for gram in grams:
+            self._words_of(gram).add(word)
+
+    def _unregister_word(self, word: str) -> None:
+        """Remove a vocabulary word no item uses any more"""
+        del self._word_items[word]
+        for gram in self._word_grams.pop(word):
+            words = self._words_of(gram)
+            words.discard(word)
+            if not words:
+                del self._gram_words[gram]
+
+    def _items_of(self, word: str) -> Dict[str, int]:
+        """Item weights of an indexed word, copied first if shared with a copy"""
+        owned = self._owned_words
+        if owned is None or word in owned:
+            return self._word_items[word]
+        items = self._word_items[word] = dict(self._word_items[word])
+        owned.add(word)
+        return items
+
+    def _words_of(self, gram: str) -> Set[str]:
+        """Words containing a gram, created or copied first if shared with a copy"""
+        owned = self._owned_grams
+        words = self._gram_words.get(gram)
+        if words is None:
+            words = self._gram_words[gram] = set()
+        elif owned is None or gram in owned:
+            return words
+        else:
+            words = self._gram_words[gram] = set(words)
+        if owned is not None:
+            owned.add(gram)
+        return words
+
+    def _grams_of(self, word: str) -> FrozenSet[str]:
+        """Split a padded word into trigrams"""
+        padded = f"  {word} "
+        size = self.GRAM_SIZE
+        return frozenset(padded[i:i + size] for i in range(len(padded) - size + 1))
+
+    def __len__(self) -> int:
+        return len(self._item_words)
@@ -1,16 +1,32 @@
 """Menu Factory - Creates specific menu items using the Factory Pattern"""
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable, Tuple, Type, Union
+import dataclasses
+from datetime import datetime
 from decimal import Decimal
 from .base import (
     MenuItemBase, MenuCategory, DietaryRestriction,
-    NutritionalInfo, MenuItemMetadata, PreparationStyle
+    NutritionalInfo, MenuItemMetadata, PreparationStyle,
+    EMPTY_NUTRITION, DISPLAY_NAME_DEPENDENCIES, intern_optional, memoized
 )
 from config.enums import FoodCategory
 
 
+# Cached enum lookups for parsing serialized items
+DIETARY_RESTRICTIONS_BY_VALUE: Dict[str, DietaryRestriction] = {r.value: r for r in DietaryRestriction}
+PREPARATION_STYLES_BY_VALUE: Dict[str, PreparationStyle] = {p.value: p for p in PreparationStyle}
+NUTRITION_FIELDS = tuple(field.name for field in dataclasses.fields(NutritionalInfo))
+
+
 class MenuItemFactory:
-    """Factory for creating different types of menu items"""
+    """
+    Factory for creating different types of menu items
+    
+    Category values map to item classes through a registry, so adding a
+    new item type means registering it rather than extending an if-chain.
+    """
+    
+    _registry: Dict[str, Tuple[Type[MenuItemBase], Tuple[Tuple[str, Any], ...]]] = {}
     
     @staticmethod
     def create_appetizer(
@@ -90,79 +106,109 @@ class MenuItemFactory:
             **kwargs
         )
     
+    @classmethod
+    def register_category(
+        cls,
+        category: str,
+        item_class: Type[MenuItemBase],
+        fields: Dict[str, Any]
+    ) -> None:
+        """
+        Register the item class built for a category value
+        
+        ``fields`` maps each category specific constructor argument to its
+        default; create_from_dict copies exactly these keys from the data.
+        """
+        cls._registry[category] = (item_class, tuple(fields.items()))
+    
+    @classmethod
+    def create(
+        cls,
+        category: Union[FoodCategory, MenuCategory, str, None],
+        name: str,
+        description: str,
+        price: float,
+        **kwargs
+    ) -> MenuItemBase:
+        """Create an item for a category, defaulting to an appetizer when missing or unknown"""
+        key = getattr(category, 'value', category)
+        registered = cls._registry.get(key) if isinstance(key, str) else None
+        if registered is None:
+            registered = cls._registry[MenuCategory.APPETIZER.value]
+        item_class, _ = registered
+        return item_class(name=name, description=description, price=price, **kwargs)
+    
     @classmethod
     def create_from_dict(cls, item_data: Dict[str, Any]) -> MenuItemBase:
         """Create menu item from dictionary data"""
         category = item_data.get('category', 'appetizer')
+        registered = cls._registry.get(category)
+        if registered is None:
+            # Unknown categories default to a plain appetizer
+            item_class, field_defaults = cls._registry[MenuCategory.APPETIZER.value][0], ()
+        else:
+            item_class, field_defaults = registered
         
-        # Extract base parameters
-        base_params = {
-            'name': item_data['name'],
-            'description': item_data['description'],
-            'price': float(item_data['price'])
-        }
+        params = {field: item_data.get(field, default) for field, default in field_defaults}
+        params['name'] = item_data['name']
+        params['description'] = item_data['description']
+        params['price'] = float(item_data['price'])
         
         # Add nutritional info if present
-        if 'nutritional_info' in item_data:
-            nutritional_data = item_data['nutritional_info']
-            base_params['nutritional_info'] = NutritionalInfo(
-                calories=nutritional_data.get('calories'),
-                protein_grams=nutritional_data.get('protein_grams'),
-                carbs_grams=nutritional_data.get('carbs_grams'),
-                fat_grams=nutritional_data.get('fat_grams'),
-                fiber_grams=nutritional_data.get('fiber_grams'),
-                sodium_mg=nutritional_data.get('sodium_mg')
-            )
+        nutritional_data = item_data.get('nutritional_info')
+        if nutritional_data is not None:
+            params['nutritional_info'] = cls._nutrition_from_dict(nutritional_data)
         
-        # Add metadata if present
+        # Add metadata if present; records written by to_dict() keep it at the top level
         if 'metadata' in item_data:
-            metadata = item_data['metadata']
-            dietary_restrictions = [
-                DietaryRestriction(r) for r in metadata.get('dietary_restrictions', [])
-            ]
-            base_params['metadata'] = MenuItemMetadata(
-                dietary_restrictions=dietary_restrictions,
-                allergens=metadata.get('allergens', []),
-                spice_level=metadata.get('spice_level', 0),
-                preparation_style=PreparationStyle(metadata['preparation_style']) if metadata.get('preparation_style') else None,
-                chef_special=metadata.get('chef_special', False),
-                seasonal=metadata.get('seasonal', False)
-            )
+            params['metadata'] = cls._metadata_from_dict(item_data['metadata'])
+        elif 'dietary_restrictions' in item_data:
+            params['metadata'] = cls._metadata_from_dict(item_data)
         
-        # Create specific item type
-        if category == MenuCategory.APPETIZER.value:
-            return cls.create_appetizer(
-                serving_size=item_data.get('serving_size'),
-                shareable=item_data.get('shareable', False),
-                **base_params
-            )
-        elif category == MenuCategory.ENTREE.value:
-            return cls.create_main_course(
-                protein_source=item_data.get('protein_source'),
-                cooking_method=item_data.get('cooking_method'),
-                **base_params
-            )
-        elif category == MenuCategory.DESSERT.value:
-            return cls.create_dessert(
-                sweetness_level=item_data.get('sweetness_level', 'medium'),
-                temperature=item_data.get('temperature', 'room'),
-                **base_params
-            )
-        elif category == MenuCategory.BEVERAGE.value:
-            return cls.create_beverage(
-                beverage_type=item_data.get('beverage_type', 'soft'),
-                temperature=item_data.get('temperature', 'cold'),
-                caffeine_content=item_data.get('caffeine_content'),
-                **base_params
-            )
-        else:
-            # Default to appetizer
-            return cls.create_appetizer(**base_params)
+        item = item_class(**params)
+        item.available = item_data.get('available', True)
+        created_at = item_data.get('created_at')
+        if created_at:
+            item.created_at = datetime.fromisoformat(created_at)
+        return item
+    
+    @classmethod
+    def create_many(cls, records: Iterable[Dict[str, Any]]) -> List[MenuItemBase]:
+        """Create menu items for a batch of dictionaries"""
+        create = cls.create_from_dict
+        return [create(record) for record in records]
+    
+    @staticmethod
+    def _nutrition_from_dict(nutritional_data: Dict[str, Any]) -> NutritionalInfo:
+        """Build nutritional info, sharing the empty instance when nothing is set"""
+        values = {field: nutritional_data.get(field) for field in NUTRITION_FIELDS}
+        if all(value is None for value in values.values()):
+            return EMPTY_NUTRITION
+        return NutritionalInfo(**values)
+    
+    @staticmethod
+    def _metadata_from_dict(metadata: Dict[str, Any]) -> MenuItemMetadata:
+        """Build item metadata using the cached enum lookups"""
+        preparation_style = metadata.get('preparation_style')
+        return MenuItemMetadata(
+            dietary_restrictions=[
+                DIETARY_RESTRICTIONS_BY_VALUE[r] for r in metadata.get('dietary_restrictions', ())
+            ],
+            allergens=metadata.get('allergens'),
+            ingredients=metadata.get('ingredients'),
+            spice_level=metadata.get('spice_level', 0),
+            preparation_style=PREPARATION_STYLES_BY_VALUE[preparation_style] if preparation_style else None,
+            chef_special=metadata.get('chef_special', False),
+            seasonal=metadata.get('seasonal', False),
+            origin=metadata.get('origin')
+        )
 
 
 class AppetizerItem(MenuItemBase):
     """Specialized appetizer menu item"""
     
+    __slots__ = ('serving_size', 'shareable')
+    
     def __init__(
         self,
         serving_size: Optional[str] = None,
@@ -170,7 +216,7 @@ class AppetizerItem(MenuItemBase):
         **kwargs
     ):
         super().__init__(**kwargs)
-        self.serving_size = serving_size
+        self.serving_size = intern_optional(serving_size)
         self.shareable = shareable
         self.category = FoodCategory.APPETIZER
     
@@ -189,6 +235,15 @@ class AppetizerItem(MenuItemBase):
             base_time += 2
         return max(5, base_time)
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert appetizer to dictionary"""
+        return {
+            **super().to_dict(),
+            'serving_size': self.serving_size,
+            'shareable': self.shareable
+        }
+    
+    @memoized(*DISPLAY_NAME_DEPENDENCIES, 'shareable', 'serving_size')
     def get_display_name(self) -> str:
         """Enhanced display name for appetizers"""
         base_name = super().get_display_name()
@@ -202,6 +257,8 @@ class AppetizerItem(MenuItemBase):
 class MainCourseItem(MenuItemBase):
     """Specialized main course menu item"""
     
+    __slots__ = ('protein_source', 'cooking_method')
+    
     def __init__(
         self,
         protein_source: Optional[str] = None,
@@ -209,8 +266,8 @@ class MainCourseItem(MenuItemBase):
         **kwargs
     ):
         super().__init__(**kwargs)
-        self.protein_source = protein_source
-        self.cooking_method = cooking_method
+        self.protein_source = intern_optional(protein_source)
+        self.cooking_method = intern_optional(cooking_method)
         self.category = FoodCategory.ENTREE
     
     def prepare(self) -> str:
@@ -222,6 +279,7 @@ class MainCourseItem(MenuItemBase):
         """Get main course category"""
         return FoodCategory.ENTREE
     
+    @memoized('cooking_method', 'metadata.spice_level')
     def get_preparation_time(self) -> int:
         """Main courses typically take longer"""
         base_time = 20
@@ -240,6 +298,15 @@ class MainCourseItem(MenuItemBase):
         
         return max(10, base_time + adjustment + spice_adjustment)
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert main course to dictionary"""
+        return {
+            **super().to_dict(),
+            'protein_source': self.protein_source,
+            'cooking_method': self.cooking_method
+        }
+    
+    @memoized(*DISPLAY_NAME_DEPENDENCIES, 'cooking_method', 'protein_source')
     def get_display_name(self) -> str:
         """Enhanced display name for main courses"""
         base_name = super().get_display_name()
@@ -255,6 +322,8 @@ class MainCourseItem(MenuItemBase):
 class DessertItem(MenuItemBase):
     """Specialized dessert menu item"""
     
+    __slots__ = ('sweetness_level', 'temperature')
+    
     def __init__(
         self,
         sweetness_level: str = "medium",
@@ -262,8 +331,8 @@ class DessertItem(MenuItemBase):
         **kwargs
     ):
         super().__init__(**kwargs)
-        self.sweetness_level = sweetness_level
-        self.temperature = temperature
+        self.sweetness_level = intern_optional(sweetness_level)
+        self.temperature = intern_optional(temperature)
         self.category = FoodCategory.DESSERT
     
     def prepare(self) -> str:
@@ -286,6 +355,15 @@ class DessertItem(MenuItemBase):
             return base_time + 3
         return base_time
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert dessert to dictionary"""
+        return {
+            **super().to_dict(),
+            'sweetness_level': self.sweetness_level,
+            'temperature': self.temperature
+        }
+    
+    @memoized(*DISPLAY_NAME_DEPENDENCIES, 'temperature', 'sweetness_level')
     def get_display_name(self) -> str:
         """Enhanced display name for desserts"""
         base_name = super().get_display_name()
@@ -299,6 +377,8 @@ class DessertItem(MenuItemBase):
 class BeverageItem(MenuItemBase):
     """Specialized beverage menu item"""
     
+    __slots__ = ('beverage_type', 'temperature', 'caffeine_content')
+    
     def __init__(
         self,
         beverage_type: str = "soft",
@@ -307,8 +387,8 @@ class BeverageItem(MenuItemBase):
         **kwargs
     ):
         super().__init__(**kwargs)
-        self.beverage_type = beverage_type
-        self.temperature = temperature
+        self.beverage_type = intern_optional(beverage_type)
+        self.temperature = intern_optional(temperature)
         self.caffeine_content = caffeine_content
         self.category = FoodCategory.BEVERAGE
     
@@ -333,6 +413,16 @@ class BeverageItem(MenuItemBase):
         """Check if beverage contains caffeine"""
         return self.caffeine_content is not None and self.caffeine_content > 0
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert beverage to dictionary"""
+        return {
+            **super().to_dict(),
+            'beverage_type': self.beverage_type,
+            'temperature': self.temperature,
+            'caffeine_content': self.caffeine_content
+        }
+    
+    @memoized(*DISPLAY_NAME_DEPENDENCIES, 'temperature', 'caffeine_content')
     def get_display_name(self) -> str:
         """Enhanced display name for beverages"""
         base_name = super().get_display_name()
@@ -341,3 +431,21 @@ class BeverageItem(MenuItemBase):
         if self.is_caffeinated():
             base_name += f" - {self.caffeine_content}mg caffeine"
         return base_name
+
+
+MenuItemFactory.register_category(
+    MenuCategory.APPETIZER.value, AppetizerItem,
+    {'serving_size': None, 'shareable': False}
+)
+MenuItemFactory.register_category(
+    MenuCategory.ENTREE.value, MainCourseItem,
+    {'protein_source': None, 'cooking_method': None}
+)
+MenuItemFactory.register_category(
+    MenuCategory.DESSERT.value, DessertItem,
+    {'sweetness_level': 'medium', 'temperature': 'room'}
+)
+MenuItemFactory.register_category(
+    MenuCategory.BEVERAGE.value, BeverageItem,
+    {'beverage_type': 'soft', 'temperature': 'cold', 'caffeine_content': None}
+)
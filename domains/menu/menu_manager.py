@@ -1,23 +1,94 @@
 """Menu Manager - Manages collections of menu items and menu operations"""
 
-from typing import Dict, List, Optional, Callable, Any
-from .base import MenuItemBase, MenuCategory, DietaryRestriction
+from typing import Dict, List, Optional, Callable, Any, Hashable, Iterable, Iterator, Union
+from core.base_classes import Subject
+from .base import MenuItemBase, MenuCategory, DietaryRestriction, normalize_allergens, normalize_dietary
 from .menu_item_factory import MenuItemFactory
+from .search_index import MenuSearchIndex
+from .fuzzy_search import FuzzyMenuSearch
+from .facet_index import MenuFacetIndex
+from .price_index import MenuPriceIndex
+from .name_index import MenuNameIndex
+from .pagination import MenuPage, PAGE_ORDERS, DEFAULT_PAGE_SIZE, encode_cursor, decode_cursor
+from .payload_cache import MenuPayloadCache, copy_rendered
+from .menu_statistics import MenuStatistics
+from .snapshot import read_snapshot, write_snapshot
+from .flyweight import MenuFlyweightPool
+from .change_log import MenuChangeLog, OP_ADD, OP_REMOVE, OP_PRICE, OP_AVAILABILITY
+from .menu_query import MenuQuery, QueryPlan, plan_query, execute_plan, QUERY_CACHE_SIZE
 from config.enums import FoodCategory
+import dataclasses
+import gc
+from collections import OrderedDict
+from contextlib import contextmanager
+import itertools
+import json
 import logging
+import math
 
 logger = logging.getLogger(__name__)
 
+FOOD_TO_MENU_CATEGORY: Dict[FoodCategory, MenuCategory] = {
+    FoodCategory.APPETIZER: MenuCategory.APPETIZER,
+    FoodCategory.ENTREE: MenuCategory.ENTREE,
+    FoodCategory.DESSERT: MenuCategory.DESSERT,
+    FoodCategory.BEVERAGE: MenuCategory.BEVERAGE,
+    FoodCategory.SIDE: MenuCategory.SIDE
+}
 
-class MenuManager:
-    """Manages menu items and provides menu operations"""
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """
+    Suspend cyclic garbage collection for a bulk load
+    
+    Bulk loads only create long-lived objects, so the collector would keep
+    rescanning them for nothing.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+class MenuManager(Subject):
+    """
+    Manages menu items and provides menu operations
+    
+    Bulk updates notify attached observers with a single
+    "menu_prices_updated" or "menu_availability_updated" event.
+    Set ``debug_statistics`` to cross-check the incrementally maintained
+    statistics against a full recomputation on every read. Managers given
+    the same ``flyweights`` pool share the immutable parts of equal items.
+    Every mutation bumps ``version`` and is recorded in a change log, so
+    clients can sync with ``changes_since`` instead of a full export.
+    """
     
-    def __init__(self):
+    def __init__(self, debug_statistics: bool = False, flyweights: Optional[MenuFlyweightPool] = None):
+        super().__init__()
         self._items: Dict[str, MenuItemBase] = {}
         self._categories: Dict[MenuCategory, List[MenuItemBase]] = {
             category: [] for category in MenuCategory
         }
+        if flyweights is not None:
+            self._search_index = flyweights.search_view()
+            self._fuzzy_search = flyweights.fuzzy_view()
+        else:
+            self._search_index = MenuSearchIndex()
+            self._fuzzy_search = FuzzyMenuSearch()
+        self._facet_index = MenuFacetIndex()
+        self._price_index = MenuPriceIndex()
+        self._name_index = MenuNameIndex()
+        self._statistics = MenuStatistics()
+        self._change_log = MenuChangeLog()
+        self._query_cache: 'OrderedDict[tuple, tuple]' = OrderedDict()
+        self.debug_statistics = debug_statistics
+        self.flyweights = flyweights
         self.factory = MenuItemFactory()
+        self._payload_cache = MenuPayloadCache(self)
     
     def add_item(self, item: MenuItemBase) -> bool:
         """Add a menu item to the menu"""
@@ -26,12 +97,13 @@ class MenuManager:
                 logger.warning(f"Item '{item.name}' already exists in menu")
                 return False
             
-            self._items[item.name] = item
-            
-            # Add to category list
+            if self.flyweights is not None:
+                self.flyweights.share(item)
             menu_category = self._map_food_to_menu_category(item.get_category())
-            if menu_category:
-                self._categories[menu_category].append(item)
+            self._store_item(item, menu_category)
+            self._index_item(item)
+            self._statistics.item_added(item, menu_category)
+            self._change_log.record(OP_ADD, item.name)
             
             logger.info(f"Added menu item: {item.name}")
             return True
@@ -40,6 +112,38 @@ class MenuManager:
             logger.error(f"Error adding menu item: {e}")
             return False
     
+    def add_items(self, items: Iterable[MenuItemBase]) -> int:
+        """
+        Add a batch of menu items
+        
+        The price and facet indexes are updated once for the whole batch
+        and a single log line is written. Items whose name is already on
+        the menu are skipped. Returns the number of items added.
+        """
+        added = []
+        skipped = 0
+        flyweights = self.flyweights
+        
+        with gc_paused():
+            for item in items:
+                if item.name in self._items:
+                    skipped += 1
+                    continue
+                if flyweights is not None:
+                    flyweights.share(item)
+                menu_category = self._map_food_to_menu_category(item.get_category())
+                self._store_item(item, menu_category)
+                self._statistics.item_added(item, menu_category)
+                added.append(item)
+            
+            self._index_items(added)
+            self._change_log.record_many(OP_ADD, ((item.name, None) for item in added))
+        
+        if skipped:
+            logger.warning(f"Skipped {skipped} items already on the menu")
+        logger.info(f"Added {len(added)} menu items")
+        return len(added)
+    
     def remove_item(self, name: str) -> bool:
         """Remove a menu item from the menu"""
         try:
@@ -48,12 +152,11 @@ class MenuManager:
                 return False
             
             item = self._items[name]
-            del self._items[name]
-            
-            # Remove from category list
             menu_category = self._map_food_to_menu_category(item.get_category())
-            if menu_category and item in self._categories[menu_category]:
-                self._categories[menu_category].remove(item)
+            self._discard_item(item, menu_category)
+            self._unindex_item(item)
+            self._statistics.item_removed(item, menu_category)
+            self._change_log.record(OP_REMOVE, name)
             
             logger.info(f"Removed menu item: {name}")
             return True
@@ -74,33 +177,112 @@ class MenuManager:
         """Get all items in a specific category"""
         return self._categories.get(category, [])
     
+    def get_page(self,
+                 order_by: str = "category",
+                 cursor: Optional[str] = None,
+                 limit: int = DEFAULT_PAGE_SIZE,
+                 category: Optional[MenuCategory] = None,
+                 available: Optional[bool] = True) -> MenuPage:
+        """
+        Get one page of the menu ordered by category, name or price
+        
+        Pass the previous page's ``next_cursor`` to continue. Pages are
+        read straight from the sorted name and price indexes, so only the
+        items on the page are touched, and cursors stay valid while items
+        are added or removed. Category order follows MenuCategory with
+        names sorted case-insensitively inside each category.
+        """
+        if order_by not in PAGE_ORDERS:
+            raise ValueError(f"order_by must be one of {PAGE_ORDERS}, got {order_by!r}")
+        if limit < 1:
+            raise ValueError(f"limit must be at least 1, got {limit}")
+        
+        after = decode_cursor(cursor, order_by) if cursor else None
+        if order_by == "price":
+            keys = self._price_index.iter_after(after)
+        elif order_by == "name":
+            keys = self._name_index.by_name(after)
+        else:
+            keys = self._name_index.by_category(after, category)
+        
+        index = self._facet_index
+        mask = self._facet_mask(category=category, available=available)
+        filtered = mask != index.all_items()
+        
+        items = []
+        last_key = None
+        next_cursor = None
+        for key, name in keys:
+            if filtered and not index.in_mask(name, mask):
+                continue
+            if len(items) == limit:
+                next_cursor = encode_cursor(order_by, last_key)
+                break
+            items.append(self._items[name])
+            last_key = key
+        
+        return MenuPage(items, next_cursor, index.count(mask))
+    
+    def iter_pages(self,
+                   order_by: str = "category",
+                   page_size: int = DEFAULT_PAGE_SIZE,
+                   category: Optional[MenuCategory] = None,
+                   available: Optional[bool] = True) -> Iterator[MenuPage]:
+        """Yield every page of an ordered listing, for streaming to a client"""
+        cursor = None
+        while True:
+            page = self.get_page(order_by, cursor, page_size, category, available)
+            yield page
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+    
     def get_available_items(self) -> List[MenuItemBase]:
         """Get all available menu items"""
-        return [item for item in self._items.values() if item.available]
+        return self.query()
     
     def get_items_by_dietary_restriction(self, restriction: DietaryRestriction) -> List[MenuItemBase]:
         """Get items that meet a specific dietary restriction"""
-        return [
-            item for item in self._items.values()
-            if item.matches_dietary_restriction(restriction) and item.available
-        ]
+        return self.query(dietary=restriction)
     
     def get_items_by_price_range(self, min_price: float, max_price: float) -> List[MenuItemBase]:
-        """Get items within a specific price range"""
+        """Get available items within a specific price range, cheapest first"""
         return [
-            item for item in self._items.values()
-            if min_price <= item.price <= max_price and item.available
+            self._items[name] for name in self._price_index.in_range(min_price, max_price)
+            if self._facet_index.has_facet(name, MenuFacetIndex.AVAILABLE)
         ]
     
+    def get_cheapest_items(self, count: int) -> List[MenuItemBase]:
+        """Get the ``count`` cheapest available items"""
+        return self._take_available(self._price_index.ascending(), count)
+    
+    def get_most_expensive_items(self, count: int) -> List[MenuItemBase]:
+        """Get the ``count`` most expensive available items"""
+        return self._take_available(reversed(self._price_index.ascending()), count)
+    
+    def get_allergen_free_items(self, allergens: Iterable[str]) -> List[MenuItemBase]:
+        """Get available items containing none of the given allergens"""
+        return self.query(exclude_allergens=allergens)
+    
+    def get_allergens(self) -> List[str]:
+        """Normalized allergens carried by at least one item, sorted"""
+        return sorted(self._facet_index.allergens())
+    
     def get_items_by_spice_level(self, max_spice_level: int) -> List[MenuItemBase]:
         """Get items with spice level at or below specified level"""
-        return [
-            item for item in self._items.values()
-            if item.metadata.spice_level <= max_spice_level and item.available
-        ]
+        return self.query(max_spice_level=max_spice_level)
     
-    def search_items(self, query: str) -> List[MenuItemBase]:
-        """Search menu items by name or description"""
+    def search_items(self, query: str, use_index: bool = True) -> List[MenuItemBase]:
+        """
+        Search menu items by name, description or ingredients
+        
+        Uses the trigram search index and returns hits ranked by where the
+        query matched (name first). Pass ``use_index=False`` to fall back to
+        a plain substring scan in menu order.
+        """
+        if use_index:
+            return [self._items[name] for name in self._search_index.search(query)]
+        
         query = query.lower()
         results = []
         
@@ -112,22 +294,140 @@ class MenuManager:
         
         return results
     
+    def fuzzy_search_items(self, query: str, limit: int = 10) -> List[MenuItemBase]:
+        """
+        Typo tolerant search returning the ``limit`` best matching items
+        
+        Words are compared by trigram similarity, so "margarita" still
+        finds "Margherita" when the exact substring search finds nothing.
+        """
+        return [self._items[name] for name, _ in self._fuzzy_search.search(query, limit)]
+    
     def get_chef_specials(self) -> List[MenuItemBase]:
         """Get all chef special items"""
-        return [
-            item for item in self._items.values()
-            if item.metadata.chef_special and item.available
-        ]
+        return self.query(chef_special=True)
     
     def get_seasonal_items(self) -> List[MenuItemBase]:
         """Get all seasonal items"""
-        return [
-            item for item in self._items.values()
-            if item.metadata.seasonal and item.available
-        ]
+        return self.query(seasonal=True)
+    
+    def query(self,
+              category: Optional[MenuCategory] = None,
+              dietary: Union[DietaryRestriction, Iterable[DietaryRestriction], None] = None,
+              chef_special: Optional[bool] = None,
+              seasonal: Optional[bool] = None,
+              min_spice_level: Optional[int] = None,
+              max_spice_level: Optional[int] = None,
+              available: Optional[bool] = True,
+              exclude_allergens: Optional[Iterable[str]] = None) -> List[MenuItemBase]:
+        """
+        Get items matching every given facet
+        
+        Each facet is a bitset in the facet index, so combined filters are
+        resolved with bitwise ANDs. Facets left as None are not filtered;
+        every dietary restriction passed must be met. Items carrying any of
+        ``exclude_allergens`` are removed by clearing the allergens' bits.
+        A single string counts as one allergen or dietary value. Only
+        available items are returned unless ``available`` is set to False
+        or None.
+        """
+        names = self._facet_names(category, dietary, chef_special, seasonal,
+                                  min_spice_level, max_spice_level, available, exclude_allergens)
+        return [self._items[name] for name in names]
+    
+    def find(self, query: MenuQuery) -> List[MenuItemBase]:
+        """
+        Run a declarative MenuQuery
+        
+        The query is planned against the available indexes (see explain)
+        and its result is kept in a small LRU cache until the menu version
+        changes.
+        """
+        key = (query, self.version)
+        result = self._cached_query(key)
+        if result is None:
+            result = tuple(self._items[name] for name in execute_plan(self, plan_query(self, query)))
+            self._cache_query(key, result)
+        return list(result)
+    
+    def _cached_query(self, key: tuple) -> Optional[tuple]:
+        """Cached result of a (query, version) key, marked as recently used"""
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+        return cached
+    
+    def _cache_query(self, key: tuple, result: tuple) -> None:
+        """Cache a query result, dropping results of older versions and the least recently used"""
+        cache = self._query_cache
+        if cache and next(iter(cache))[1] != key[1]:
+            cache.clear()
+        cache[key] = result
+        if len(cache) > QUERY_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    def plan(self, query: MenuQuery) -> QueryPlan:
+        """Choose how a MenuQuery would run without running it"""
+        return plan_query(self, query)
     
-    def filter_items(self, filter_func: Callable[[MenuItemBase], bool]) -> List[MenuItemBase]:
-        """Filter items using a custom function"""
+    def explain(self, query: MenuQuery) -> str:
+        """Describe the plan for a MenuQuery, one step per line"""
+        return self.plan(query).explain()
+    
+    def _facet_names(self,
+                     category: Optional[MenuCategory] = None,
+                     dietary: Union[DietaryRestriction, Iterable[DietaryRestriction], None] = None,
+                     chef_special: Optional[bool] = None,
+                     seasonal: Optional[bool] = None,
+                     min_spice_level: Optional[int] = None,
+                     max_spice_level: Optional[int] = None,
+                     available: Optional[bool] = True,
+                     exclude_allergens: Optional[Iterable[str]] = None) -> List[str]:
+        """Names of the items matching every given facet; storage backends may override"""
+        mask = self._facet_mask(category, dietary, chef_special, seasonal,
+                                min_spice_level, max_spice_level, available, exclude_allergens)
+        return self._facet_index.names(mask)
+    
+    def _facet_mask(self,
+                    category: Optional[MenuCategory] = None,
+                    dietary: Union[DietaryRestriction, Iterable[DietaryRestriction], None] = None,
+                    chef_special: Optional[bool] = None,
+                    seasonal: Optional[bool] = None,
+                    min_spice_level: Optional[int] = None,
+                    max_spice_level: Optional[int] = None,
+                    available: Optional[bool] = True,
+                    exclude_allergens: Optional[Iterable[str]] = None) -> int:
+        """Bitset of the items matching every given facet"""
+        index = self._facet_index
+        mask = index.all_items()
+        
+        if category is not None:
+            mask &= index.mask(category)
+        for restriction in normalize_dietary(dietary):
+            mask &= index.mask(restriction)
+        if chef_special is not None:
+            mask = self._apply_flag(mask, MenuFacetIndex.CHEF_SPECIAL, chef_special)
+        if seasonal is not None:
+            mask = self._apply_flag(mask, MenuFacetIndex.SEASONAL, seasonal)
+        if available is not None:
+            mask = self._apply_flag(mask, MenuFacetIndex.AVAILABLE, available)
+        if min_spice_level is not None or max_spice_level is not None:
+            mask &= self._spice_mask(min_spice_level, max_spice_level)
+        if exclude_allergens:
+            mask &= ~index.any_of(
+                MenuFacetIndex.allergen_facet(allergen) for allergen in normalize_allergens(exclude_allergens)
+            )
+        return mask
+    
+    def filter_items(self, filter_func: Union[Callable[[MenuItemBase], bool], MenuQuery]) -> List[MenuItemBase]:
+        """
+        Filter items using a custom function or a MenuQuery
+        
+        A function is called on every item; a MenuQuery is planned and
+        cached through find.
+        """
+        if isinstance(filter_func, MenuQuery):
+            return self.find(filter_func)
         return [item for item in self._items.values() if filter_func(item)]
     
     def update_item_availability(self, name: str, available: bool) -> bool:
@@ -137,7 +437,12 @@ class MenuManager:
                 logger.warning(f"Item '{name}' not found in menu")
                 return False
             
-            self._items[name].available = available
+            item = self._items[name]
+            was_available = item.available
+            item = self._write_availability(item, available)
+            self._statistics.availability_changed(item, was_available)
+            self._facet_index.set_facet(name, MenuFacetIndex.AVAILABLE, available)
+            self._change_log.record(OP_AVAILABILITY, name, available)
             logger.info(f"Updated availability for '{name}': {available}")
             return True
             
@@ -152,8 +457,12 @@ class MenuManager:
                 logger.warning(f"Item '{name}' not found in menu")
                 return False
             
-            old_price = self._items[name].price
-            self._items[name].price = new_price
+            item = self._items[name]
+            old_price = item.price
+            item = self._write_price(item, new_price)
+            self._price_index.update(name, new_price)
+            self._statistics.price_changed(old_price, new_price)
+            self._change_log.record(OP_PRICE, name, new_price)
             logger.info(f"Updated price for '{name}': ${old_price:.2f} -> ${new_price:.2f}")
             return True
             
@@ -161,74 +470,531 @@ class MenuManager:
             logger.error(f"Error updating item price: {e}")
             return False
     
+    def bulk_update_prices(self, prices: Dict[str, float]) -> int:
+        """
+        Apply many price changes in one pass
+        
+        Derived indexes are updated once for the whole batch and observers
+        receive one "menu_prices_updated" event. Unknown names are skipped.
+        Returns the number of items whose price changed.
+        """
+        changes: Dict[str, tuple] = {}
+        missing = []
+        
+        for name, new_price in prices.items():
+            item = self._items.get(name)
+            if item is None:
+                missing.append(name)
+                continue
+            old_price = item.price
+            if old_price == new_price:
+                continue
+            item = self._write_price(item, new_price)
+            self._statistics.price_changed(old_price, new_price)
+            changes[name] = (old_price, new_price)
+        
+        if missing:
+            logger.warning(f"Skipped {len(missing)} unknown items in bulk price update")
+        if not changes:
+            return 0
+        
+        self._price_index.update_many({name: new for name, (_, new) in changes.items()})
+        self._change_log.record_many(OP_PRICE, ((name, new) for name, (_, new) in changes.items()))
+        logger.info(f"Bulk updated prices for {len(changes)} items")
+        self.notify("menu_prices_updated", {'changes': changes})
+        return len(changes)
+    
+    def reprice_by_percentage(self,
+                              percent: float,
+                              category: Optional[MenuCategory] = None,
+                              names: Optional[Iterable[str]] = None,
+                              decimals: int = 2) -> int:
+        """
+        Raise (or with a negative percent, lower) prices by a percentage
+        
+        Applies to the given names, otherwise to a whole category, otherwise
+        to the entire menu. New prices are rounded to ``decimals`` places.
+        """
+        if names is None:
+            names = self._price_names(category)
+        factor = 1 + percent / 100
+        
+        new_prices = {}
+        for name in names:
+            item = self._items.get(name)
+            if item is not None:
+                new_prices[name] = round(item.price * factor, decimals)
+        return self.bulk_update_prices(new_prices)
+    
+    def bulk_set_availability(self, names: Iterable[str], available: bool) -> int:
+        """
+        Set availability for many items in one pass (e.g. the day's 86 list)
+        
+        Observers receive one "menu_availability_updated" event. Returns
+        the number of items whose availability changed.
+        """
+        changed = []
+        
+        for name in names:
+            item = self._items.get(name)
+            if item is None or item.available == available:
+                continue
+            item = self._write_availability(item, available)
+            self._statistics.availability_changed(item, not available)
+            changed.append(name)
+        
+        if not changed:
+            return 0
+        
+        self._facet_index.set_facet_many(changed, MenuFacetIndex.AVAILABLE, available)
+        self._change_log.record_many(OP_AVAILABILITY, ((name, available) for name in changed))
+        logger.info(f"Bulk set availability to {available} for {len(changed)} items")
+        self.notify("menu_availability_updated", {'names': changed, 'available': available})
+        return len(changed)
+    
     def get_menu_statistics(self) -> Dict[str, Any]:
-        """Get comprehensive menu statistics"""
-        total_items = len(self._items)
-        available_items = len(self.get_available_items())
+        """
+        Get comprehensive menu statistics
+        
+        Reads the running aggregates and the price index, so the cost does
+        not grow with the menu. In debug mode the result is compared with a
+        full recomputation and any mismatch is logged.
+        """
+        stats = self._statistics
         
-        category_counts = {
-            category.value: len(items) 
-            for category, items in self._categories.items()
+        statistics = {
+            'total_items': stats.total_items,
+            'available_items': stats.available_items,
+            'unavailable_items': stats.total_items - stats.available_items,
+            'category_counts': dict(stats.category_counts),
+            'price_statistics': self._calculate_price_statistics(),
+            'dietary_statistics': dict(stats.dietary_counts),
+            'chef_specials': stats.chef_specials,
+            'seasonal_items': stats.seasonal_items
         }
         
-        price_stats = self._calculate_price_statistics()
-        dietary_stats = self._calculate_dietary_statistics()
+        if self.debug_statistics:
+            expected = self.recompute_menu_statistics()
+            if not self._statistics_match(statistics, expected):
+                logger.error(f"Menu statistics drifted: incremental={statistics} recomputed={expected}")
+                return expected
+        
+        return statistics
+    
+    def recompute_menu_statistics(self) -> Dict[str, Any]:
+        """Compute menu statistics from scratch by scanning every item"""
+        items = list(self._items.values())
+        total_items = len(items)
+        available = [item for item in items if item.available]
+        
+        category_counts = {category.value: 0 for category in MenuCategory}
+        for item in items:
+            menu_category = self._map_food_to_menu_category(item.get_category())
+            if menu_category:
+                category_counts[menu_category.value] += 1
+        
+        price_stats = {}
+        if items:
+            prices = [item.price for item in items]
+            price_stats = {
+                'min_price': min(prices),
+                'max_price': max(prices),
+                'average_price': sum(prices) / len(prices),
+                'median_price': sorted(prices)[len(prices) // 2]
+            }
         
         return {
             'total_items': total_items,
-            'available_items': available_items,
-            'unavailable_items': total_items - available_items,
+            'available_items': len(available),
+            'unavailable_items': total_items - len(available),
             'category_counts': category_counts,
             'price_statistics': price_stats,
-            'dietary_statistics': dietary_stats,
-            'chef_specials': len(self.get_chef_specials()),
-            'seasonal_items': len(self.get_seasonal_items())
+            'dietary_statistics': self._calculate_dietary_statistics(),
+            'chef_specials': len([item for item in available if item.metadata.chef_special]),
+            'seasonal_items': len([item for item in available if item.metadata.seasonal])
         }
     
     def export_menu_data(self) -> Dict[str, Any]:
-        """Export menu data for serialization"""
+        """
+        Export menu data for serialization, tagged with the version it reflects
+        
+        Item dictionaries come from the payload cache, so only items changed
+        since the last export are rendered again.
+        """
         return {
-            'items': [item.to_dict() for item in self._items.values()],
+            'version': self.version,
+            'items': [copy_rendered(record) for record in self._payload_cache.iter_item_dicts()],
             'statistics': self.get_menu_statistics()
         }
     
+    def export_menu_payload(self, compress: bool = False) -> bytes:
+        """
+        The export_menu_data payload as JSON bytes, gzipped if ``compress``
+        
+        The payload is built from cached item renderings and kept until the
+        menu version changes.
+        """
+        return self._payload_cache.menu_payload(compress)
+    
     def import_menu_data(self, menu_data: Dict[str, Any]) -> bool:
         """Import menu data from serialized format"""
         try:
-            for item_data in menu_data.get('items', []):
-                item = self.factory.create_from_dict(item_data)
-                self.add_item(item)
+            items = menu_data.get('items', [])
+            self.add_items(self.factory.create_many(items))
             
-            logger.info(f"Imported {len(menu_data.get('items', []))} menu items")
+            logger.info(f"Imported {len(items)} menu items")
             return True
             
         except Exception as e:
             logger.error(f"Error importing menu data: {e}")
             return False
     
+    @property
+    def version(self) -> int:
+        """Version of the menu, bumped by every mutation"""
+        return self._change_log.version
+    
+    def changes_since(self, version: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the changes made after ``version`` as a compact delta
+        
+        Returns the current version and the changes in the order they were
+        made. Add entries carry the item's current dictionary form and
+        replace any item of the same name. Changes to an item that is no
+        longer on the menu are reduced to its first remove, which can name
+        an item the client never received. Returns None when the log was
+        compacted past ``version``, in which case the client has to start
+        over from export_menu_data.
+        """
+        entries = self._change_log.entries_since(version)
+        if entries is None:
+            logger.warning(f"Change log no longer reaches version {version}; a full export is needed")
+            return None
+        
+        items = self._items
+        removed = set()
+        changes = []
+        for entry_version, operation, name, value in entries:
+            if name not in items:
+                # Only the removal matters for an item that is gone now
+                if operation != OP_REMOVE or name in removed:
+                    continue
+                removed.add(name)
+            change = {'version': entry_version, 'op': operation, 'name': name}
+            if operation == OP_ADD:
+                change['item'] = copy_rendered(self._payload_cache.item_dict(name))
+            elif operation == OP_PRICE:
+                change['price'] = value
+            elif operation == OP_AVAILABILITY:
+                change['available'] = value
+            changes.append(change)
+        
+        return {'from_version': version, 'version': self.version, 'changes': changes}
+    
+    def register_sync_consumer(self, consumer: str) -> int:
+        """
+        Register a client that syncs through changes_since
+        
+        The change log keeps every entry the slowest registered consumer
+        has not acknowledged. Returns the current version.
+        """
+        return self._change_log.register_consumer(consumer)
+    
+    def unregister_sync_consumer(self, consumer: str) -> None:
+        """Forget a sync client so it no longer holds back log compaction"""
+        self._change_log.unregister_consumer(consumer)
+    
+    def acknowledge_changes(self, consumer: str, version: int) -> int:
+        """
+        Record that a sync client applied every change up to ``version``
+        
+        Compacts the change log once all consumers have advanced. Returns
+        the number of entries dropped.
+        """
+        return self._change_log.acknowledge(consumer, version)
+    
+    def save_snapshot(self, path: str) -> int:
+        """
+        Save the menu and all of its indexes to a binary snapshot
+        
+        Attached observers are not saved. Returns the snapshot size in bytes.
+        """
+        size = write_snapshot(self, path)
+        logger.info(f"Saved menu snapshot of {len(self)} items to {path} ({size} bytes)")
+        return size
+    
+    @classmethod
+    def load_snapshot(cls, path: str) -> 'MenuManager':
+        """
+        Load a menu saved with save_snapshot
+        
+        The snapshot is memory-mapped and unpickled as is, so items are not
+        rebuilt through the factory and indexes are not recomputed. Menus
+        saved before allergen facets existed get normalized allergens and a
+        rebuilt facet index once, while loading.
+        """
+        manager = read_snapshot(path)
+        if not isinstance(manager, cls):
+            raise TypeError(f"Snapshot holds {type(manager).__name__}, expected {cls.__name__}")
+        logger.info(f"Loaded menu snapshot of {len(manager)} items from {path}")
+        return manager
+    
+    def use_flyweights(self, flyweights: MenuFlyweightPool) -> int:
+        """
+        Share the immutable parts of the current items through a pool
+        
+        Meant for menus loaded from a snapshot, which come with their own
+        copies. The text search indexes are moved onto the pool's shared
+        indexes and later additions go through the same pool. Returns the
+        number of items shared.
+        """
+        self.flyweights = flyweights
+        self._search_index = flyweights.search_view()
+        self._fuzzy_search = flyweights.fuzzy_view()
+        
+        count = 0
+        for item in self._items.values():
+            flyweights.share(item)
+            self._search_index.add(item.name, item.description, item.metadata.ingredients)
+            self._fuzzy_search.add(item.name, item.description, item.metadata.ingredients)
+            count += 1
+        return count
+    
+    def iter_item_records(self) -> Iterator[Dict[str, Any]]:
+        """Yield each item's dictionary form one at a time"""
+        for item in self._items.values():
+            yield item.to_dict()
+    
+    def export_jsonl(self, path: str) -> int:
+        """
+        Stream the menu to a JSON Lines file, one item per line
+        
+        Items are serialized one at a time, so memory use does not grow
+        with the menu. Returns the number of items written.
+        """
+        count = 0
+        with open(path, 'w', encoding='utf-8') as output:
+            for record in self.iter_item_records():
+                output.write(json.dumps(record, ensure_ascii=False))
+                output.write('\n')
+                count += 1
+        
+        logger.info(f"Exported {count} menu items to {path}")
+        return count
+    
+    def import_jsonl(self, path: str, batch_size: int = 10_000) -> int:
+        """
+        Stream menu items from a JSON Lines file
+        
+        Lines are parsed and turned into items lazily and added in batches
+        of ``batch_size`` so the indexes are updated once per batch.
+        Returns the number of items added.
+        """
+        records = self._read_jsonl(path)
+        added = 0
+        
+        with gc_paused():
+            while True:
+                batch = self.factory.create_many(itertools.islice(records, batch_size))
+                if not batch:
+                    break
+                added += self.add_items(batch)
+        
+        logger.info(f"Imported {added} menu items from {path}")
+        return added
+    
+    def _read_jsonl(self, path: str) -> Iterator[Dict[str, Any]]:
+        """Yield the records of a JSON Lines file, skipping blank lines"""
+        with open(path, 'r', encoding='utf-8') as source:
+            for line in source:
+                if line.strip():
+                    yield json.loads(line)
+    
+    def update_item(self, name: str, /, **changes: Any) -> bool:
+        """
+        Change fields of a menu item, e.g. its description or metadata
+        
+        ``changes`` maps attribute names to new values; the item's indexes
+        and statistics are refreshed afterwards. Renaming is not supported,
+        remove the item and add it under the new name instead.
+        """
+        if 'name' in changes:
+            raise ValueError("update_item cannot rename an item")
+        item = self._items.get(name)
+        if item is None:
+            logger.warning(f"Item '{name}' not found in menu")
+            return False
+        
+        menu_category = self._map_food_to_menu_category(item.get_category())
+        self._statistics.item_removed(item, menu_category)
+        self._unindex_item(item)
+        item = self._write_fields(item, changes)
+        if self.flyweights is not None:
+            self.flyweights.share(item)
+        self._index_item(item)
+        self._statistics.item_added(item, menu_category)
+        self._change_log.record(OP_ADD, name)
+        logger.info(f"Updated menu item: {name}")
+        return True
+    
+    def reindex_item(self, name: str) -> bool:
+        """Refresh the indexes after an item was modified outside the manager"""
+        item = self._items.get(name)
+        if item is None:
+            logger.warning(f"Item '{name}' not found in menu")
+            return False
+        
+        self._unindex_item(item)
+        self._index_item(item)
+        self._rebuild_statistics()
+        self._change_log.record(OP_ADD, name)
+        return True
+    
+    def _rebuild_statistics(self) -> None:
+        """Recount the running statistics from the current items"""
+        self._statistics = MenuStatistics()
+        for item in self._items.values():
+            menu_category = self._map_food_to_menu_category(item.get_category())
+            self._statistics.item_added(item, menu_category)
+    
+    def _statistics_match(self, actual: Dict[str, Any], expected: Dict[str, Any]) -> bool:
+        """Compare statistics, allowing float rounding in the average price"""
+        actual_prices = actual['price_statistics']
+        expected_prices = expected['price_statistics']
+        if actual_prices.keys() != expected_prices.keys():
+            return False
+        for key, value in expected_prices.items():
+            if not math.isclose(actual_prices[key], value, rel_tol=1e-9, abs_tol=1e-9):
+                return False
+        
+        return all(
+            actual[key] == value
+            for key, value in expected.items()
+            if key != 'price_statistics'
+        )
+    
+    def _store_item(self, item: MenuItemBase, menu_category: Optional[MenuCategory]) -> None:
+        """Put an item into the primary storage"""
+        self._items[item.name] = item
+        if menu_category:
+            self._categories[menu_category].append(item)
+    
+    def _discard_item(self, item: MenuItemBase, menu_category: Optional[MenuCategory]) -> None:
+        """Take an item out of the primary storage"""
+        del self._items[item.name]
+        if menu_category and item in self._categories[menu_category]:
+            self._categories[menu_category].remove(item)
+    
+    def _write_price(self, item: MenuItemBase, price: float) -> MenuItemBase:
+        """Store a new price for an item and return the item now holding it"""
+        item.price = price
+        return item
+    
+    def _write_availability(self, item: MenuItemBase, available: bool) -> MenuItemBase:
+        """Store a new availability flag for an item and return the item now holding it"""
+        item.available = available
+        return item
+    
+    def _write_fields(self, item: MenuItemBase, changes: Dict[str, Any]) -> MenuItemBase:
+        """Store new field values for an item and return the item now holding them"""
+        for field, value in changes.items():
+            setattr(item, field, value)
+        return item
+    
+    def _index_items(self, items: List[MenuItemBase]) -> None:
+        """Add a batch of items to the indexes"""
+        for item in items:
+            self._search_index.add(item.name, item.description, item.metadata.ingredients)
+            self._fuzzy_search.add(item.name, item.description, item.metadata.ingredients)
+        self._facet_index.add_many((item.name, self._item_facets(item)) for item in items)
+        self._price_index.add_many((item.name, item.price) for item in items)
+        self._name_index.add_many(
+            (item.name, self._map_food_to_menu_category(item.get_category())) for item in items
+        )
+    
+    def _index_item(self, item: MenuItemBase) -> None:
+        """Add an item to the search indexes"""
+        self._search_index.add(item.name, item.description, item.metadata.ingredients)
+        self._fuzzy_search.add(item.name, item.description, item.metadata.ingredients)
+        self._facet_index.add(item.name, self._item_facets(item))
+        self._price_index.add(item.name, item.price)
+        self._name_index.add(item.name, self._map_food_to_menu_category(item.get_category()))
+    
+    def _unindex_item(self, item: MenuItemBase) -> None:
+        """Remove an item from the search indexes"""
+        self._search_index.remove(item.name)
+        self._fuzzy_search.remove(item.name)
+        self._facet_index.remove(item.name)
+        self._price_index.remove(item.name)
+        self._name_index.remove(item.name)
+    
+    def _item_facets(self, item: MenuItemBase) -> List[Hashable]:
+        """Collect the facet keys an item belongs to"""
+        metadata = item.metadata
+        facets: List[Hashable] = list(metadata.dietary_restrictions or [])
+        facets.append(MenuFacetIndex.spice_facet(metadata.spice_level))
+        facets.extend(MenuFacetIndex.allergen_facet(allergen) for allergen in metadata.allergens or ())
+        
+        menu_category = self._map_food_to_menu_category(item.get_category())
+        if menu_category:
+            facets.append(menu_category)
+        if metadata.chef_special:
+            facets.append(MenuFacetIndex.CHEF_SPECIAL)
+        if metadata.seasonal:
+            facets.append(MenuFacetIndex.SEASONAL)
+        if item.available:
+            facets.append(MenuFacetIndex.AVAILABLE)
+        return facets
+    
+    def _price_names(self, category: Optional[MenuCategory]) -> List[str]:
+        """Names of every item, or of one category, for repricing"""
+        if category is None:
+            return list(self._items)
+        return self._facet_index.names(self._facet_index.mask(category))
+    
+    def _take_available(self, keys: Iterable, count: int) -> List[MenuItemBase]:
+        """Collect the first ``count`` available items from ordered price keys"""
+        result = []
+        if count <= 0:
+            return result
+        for _, name in keys:
+            if self._facet_index.has_facet(name, MenuFacetIndex.AVAILABLE):
+                result.append(self._items[name])
+                if len(result) == count:
+                    break
+        return result
+    
+    def _apply_flag(self, mask: int, facet: Hashable, wanted: bool) -> int:
+        """Narrow a bitset to items with (or without) a boolean facet"""
+        if wanted:
+            return mask & self._facet_index.mask(facet)
+        return mask & ~self._facet_index.mask(facet)
+    
+    def _spice_mask(self, min_level: Optional[int], max_level: Optional[int]) -> int:
+        """Bitset of items whose spice level lies within the bounds"""
+        levels = [
+            level for level in self._facet_index.spice_levels()
+            if (min_level is None or level >= min_level)
+            and (max_level is None or level <= max_level)
+        ]
+        return self._facet_index.any_of(MenuFacetIndex.spice_facet(level) for level in levels)
+    
     def _map_food_to_menu_category(self, food_category: FoodCategory) -> Optional[MenuCategory]:
         """Map FoodCategory to MenuCategory"""
-        mapping = {
-            FoodCategory.APPETIZER: MenuCategory.APPETIZER,
-            FoodCategory.ENTREE: MenuCategory.ENTREE,
-            FoodCategory.DESSERT: MenuCategory.DESSERT,
-            FoodCategory.BEVERAGE: MenuCategory.BEVERAGE,
-            FoodCategory.SIDE: MenuCategory.SIDE
-        }
-        return mapping.get(food_category)
+        return FOOD_TO_MENU_CATEGORY.get(food_category)
     
     def _calculate_price_statistics(self) -> Dict[str, float]:
         """Calculate price statistics for menu items"""
         if not self._items:
             return {}
         
-        prices = [item.price for item in self._items.values()]
+        prices = self._price_index
         
         return {
-            'min_price': min(prices),
-            'max_price': max(prices),
-            'average_price': sum(prices) / len(prices),
-            'median_price': sorted(prices)[len(prices) // 2]
+            'min_price': prices.min_price(),
+            'max_price': prices.max_price(),
+            'average_price': self._statistics.average_price(),
+            'median_price': prices.median_price()
         }
     
     def _calculate_dietary_statistics(self) -> Dict[str, int]:
@@ -242,6 +1008,47 @@ class MenuManager:
         
         return dietary_counts
     
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle support - observers and the flyweight pool belong to the running process"""
+        state = self.__dict__.copy()
+        for key in ('_observers', '_event_index', '_all_events', '_attach_sequence', '_notification_bus'):
+            state.pop(key, None)
+        state['flyweights'] = None
+        state['_query_cache'] = OrderedDict()
+        state['_payload_cache'] = None
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Unpickle support - fill in state missing from older snapshots and start a fresh payload cache"""
+        self.__dict__.update(state)
+        Subject.__init__(self)
+        if '_change_log' not in state:
+            self._change_log = MenuChangeLog()
+        if '_query_cache' not in state:
+            self._query_cache = OrderedDict()
+        if '_name_index' not in state:
+            self._name_index = MenuNameIndex()
+            self._name_index.add_many(
+                (item.name, self._map_food_to_menu_category(item.get_category())) for item in self._items.values()
+            )
+        if getattr(self._facet_index, 'schema', 1) < MenuFacetIndex.SCHEMA:
+            self._upgrade_facet_index()
+        self._payload_cache = MenuPayloadCache(self)
+    
+    def _upgrade_facet_index(self) -> None:
+        """Normalize allergens and rebuild the facet index of a menu saved before allergen facets"""
+        self._normalize_stored_allergens()
+        self._facet_index = MenuFacetIndex()
+        self._facet_index.add_many((item.name, self._item_facets(item)) for item in self._items.values())
+    
+    def _normalize_stored_allergens(self) -> None:
+        """Storage hook - rewrite allergens stored before they were normalized"""
+        for item in self._items.values():
+            metadata = item.metadata
+            allergens = normalize_allergens(metadata.allergens)
+            if allergens != metadata.allergens:
+                item.metadata = dataclasses.replace(metadata, allergens=allergens)
+    
     def __len__(self) -> int:
         """Return number of items in menu"""
         return len(self._items)
@@ -256,5 +1063,5 @@ class MenuManager:
     
     def __repr__(self) -> str:
         """Detailed representation of menu"""
-        stats = self.get_menu_statistics()
-        return f"MenuManager(items={stats['total_items']}, available={stats['available_items']})"
+        stats = self._statistics
+        return f"MenuManager(items={stats.total_items}, available={stats.available_items})"
@@ -0,0 +1,345 @@
+"""
+Menu Overlay - Per-location menus layered over a shared base menu
+
+A chain keeps one master MenuManager and gives every location a
+MenuOverlay holding only what differs there: price overrides and
+availability overrides (the location's 86 list). Reads resolve through the
+overlay and then the base, so a location never holds a merged copy of the
+menu.
+"""
+
+import copy
+import heapq
+import itertools
+import logging
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from core.base_classes import Subject
+from .base import MenuItemBase, MenuCategory, DietaryRestriction
+from .menu_manager import MenuManager
+
+logger = logging.getLogger(__name__)
+
+
+class MenuOverlay(Subject):
+    """
+    A location's view of a shared MenuManager
+
+    Overrides are stored sparsely by item name. Items without overrides are
+    returned as the base's own objects; an overridden item is returned as a
+    copy of the base item with the location's price and availability, made
+    on first read and rebuilt once the override or the base menu's version
+    changes, so a reindexed base item shows through. Edits made directly on
+    returned items are not written back.
+
+    Items, categories, search and the facet filters all come from the base;
+    changes to the base menu show through at once except where the location
+    has its own override.
+    """
+
+    def __init__(self, base: MenuManager, location: str = ""):
+        super().__init__()
+        self.base = base
+        self.location = location
+        self._prices: Dict[str, float] = {}
+        self._availability: Dict[str, bool] = {}
+        self._copies: Dict[str, Tuple[MenuItemBase, int, MenuItemBase]] = {}
+
+    # ===== OVERRIDES =====
+
+    def update_item_price(self, name: str, new_price: float) -> bool:
+        """Set this location's price for an item"""
+        if name not in self.base:
+            logger.warning(f"Item '{name}' not found in menu")
+            return False
+
+        self._prices[name] = new_price
+        self._copies.pop(name, None)
+        logger.info(f"[{self.location}] Updated price for '{name}': ${new_price:.2f}")
+        return True
+
+    def update_item_availability(self, name: str, available: bool) -> bool:
+        """Set this location's availability for an item"""
+        if name not in self.base:
+            logger.warning(f"Item '{name}' not found in menu")
+            return False
+
+        self._availability[name] = available
+        self._copies.pop(name, None)
+        logger.info(f"[{self.location}] Updated availability for '{name}': {available}")
+        return True
+
+    def bulk_update_prices(self, prices: Dict[str, float]) -> int:
+        """
+        Override many prices at once
+
+        Observers receive one "menu_prices_updated" event. Unknown names are
+        skipped. Returns the number of items whose price changed here.
+        """
+        changes: Dict[str, tuple] = {}
+
+        for name, new_price in prices.items():
+            item = self.base.get_item(name)
+            if item is None:
+                continue
+            old_price = self._prices.get(name, item.price)
+            self._prices[name] = new_price
+            self._copies.pop(name, None)
+            if old_price != new_price:
+                changes[name] = (old_price, new_price)
+
+        if not changes:
+            return 0
+
+        logger.info(f"[{self.location}] Bulk updated prices for {len(changes)} items")
+        self.notify("menu_prices_updated", {'changes': changes, 'location': self.location})
+        return len(changes)
+
+    def bulk_set_availability(self, names: Iterable[str], available: bool) -> int:
+        """
+        Override availability for many items (e.g. the location's 86 list)
+
+        Observers receive one "menu_availability_updated" event. Returns the
+        number of items whose availability changed here.
+        """
+        changed = []
+
+        for name in names:
+            item = self.base.get_item(name)
+            if item is None:
+                continue
+            was_available = self._availability.get(name, item.available)
+            self._availability[name] = available
+            self._copies.pop(name, None)
+            if was_available != available:
+                changed.append(name)
+
+        if not changed:
+            return 0
+
+        logger.info(f"[{self.location}] Bulk set availability to {available} for {len(changed)} items")
+        self.notify("menu_availability_updated",
+                    {'names': changed, 'available': available, 'location': self.location})
+        return len(changed)
+
+    def clear_overrides(self, name: Optional[str] = None) -> None:
+        """Drop the overrides of one item, or of every item, falling back to the base"""
+        if name is None:
+            self._prices.clear()
+            self._availability.clear()
+            self._copies.clear()
+            return
+        self._prices.pop(name, None)
+        self._availability.pop(name, None)
+        self._copies.pop(name, None)
+
+    def get_overrides(self) -> Dict[str, Dict[str, Any]]:
+        """This location's overrides, e.g. for saving alongside the base menu"""
+        return {'prices': dict(self._prices), 'availability': dict(self._availability)}
+
+    def load_overrides(self, overrides: Dict[str, Dict[str, Any]]) -> None:
+        """Replace this location's overrides with ones saved by get_overrides"""
+        self.clear_overrides()
+        self._prices.update(overrides.get('prices', {}))
+        self._availability.update(overrides.get('availability', {}))
+
+    # ===== LOOKUPS =====
+
+    def get_item(self, name: str) -> Optional[MenuItemBase]:
+        """Get a menu item by name, with this location's overrides"""
+        item = self.base.get_item(name)
+        return None if item is None else self._resolve(item)
+
+    def get_all_items(self) -> List[MenuItemBase]:
+        """Get all menu items"""
+        return [self._resolve(item) for item in self.base.get_all_items()]
+
+    def get_items_by_category(self, category: MenuCategory) -> List[MenuItemBase]:
+        """Get all items in a specific category"""
+        return [self._resolve(item) for item in self.base.get_items_by_category(category)]
+
+    def get_available_items(self) -> List[MenuItemBase]:
+        """Get all items available at this location"""
+        return self.query()
+
+    def get_items_by_dietary_restriction(self, restriction: DietaryRestriction) -> List[MenuItemBase]:
+        """Get available items that meet a specific dietary restriction"""
+        return self.query(dietary=restriction)
+
+    def get_items_by_spice_level(self, max_spice_level: int) -> List[MenuItemBase]:
+        """Get available items with spice level at or below specified level"""
+        return self.query(max_spice_level=max_spice_level)
+
+    def get_chef_specials(self) -> List[MenuItemBase]:
+        """Get available chef special items"""
+        return self.query(chef_special=True)
+
+    def get_seasonal_items(self) -> List[MenuItemBase]:
+        """Get available seasonal items"""
+        return self.query(seasonal=True)
+
+    def query(self,
+              category: Optional[MenuCategory] = None,
+              dietary: Union[DietaryRestriction, Iterable[DietaryRestriction], None] = None,
+              chef_special: Optional[bool] = None,
+              seasonal: Optional[bool] = None,
+              min_spice_level: Optional[int] = None,
+              max_spice_level: Optional[int] = None,
+              available: Optional[bool] = True,
+              exclude_allergens: Optional[Iterable[str]] = None) -> List[MenuItemBase]:
+        """
+        Get items matching every given facet, see MenuManager.query
+
+        The base resolves every facet except availability, which is then
+        checked against this location's overrides.
+        """
+        facets = dict(category=category, dietary=dietary, chef_special=chef_special, seasonal=seasonal,
+                      min_spice_level=min_spice_level, max_spice_level=max_spice_level,
+                      exclude_allergens=exclude_allergens)
+        if available is None or not self._availability:
+            return [self._resolve(item) for item in self.base.query(available=available, **facets)]
+
+        return [
+            self._resolve(item) for item in self.base.query(available=None, **facets)
+            if self._is_available(item) == available
+        ]
+
+    def get_items_by_price_range(self, min_price: float, max_price: float) -> List[MenuItemBase]:
+        """Get available items within a specific price range, cheapest first"""
+        keys = self._price_keys()
+        start = itertools.dropwhile(lambda key: key[0] < min_price, keys)
+        in_range = itertools.takewhile(lambda key: key[0] <= max_price, start)
+        return self._take_available(in_range, None)
+
+    def get_cheapest_items(self, count: int) -> List[MenuItemBase]:
+        """Get the ``count`` cheapest available items"""
+        return self._take_available(self._price_keys(), count)
+
+    def get_most_expensive_items(self, count: int) -> List[MenuItemBase]:
+        """Get the ``count`` most expensive available items"""
+        return self._take_available(self._price_keys(descending=True), count)
+
+    def search_items(self, query: str, use_index: bool = True) -> List[MenuItemBase]:
+        """Search menu items by name, description or ingredients"""
+        return [self._resolve(item) for item in self.base.search_items(query, use_index)]
+
+    def fuzzy_search_items(self, query: str, limit: int = 10) -> List[MenuItemBase]:
+        """Typo tolerant search returning the ``limit`` best matching items"""
+        return [self._resolve(item) for item in self.base.fuzzy_search_items(query, limit)]
+
+    # ===== STATISTICS =====
+
+    def get_menu_statistics(self) -> Dict[str, Any]:
+        """
+        Get menu statistics for this location
+
+        Starts from the base menu's running statistics and corrects them for
+        the overridden items only; the median walks the merged price order
+        up to its middle.
+        """
+        statistics = self.base.get_menu_statistics()
+        base_items = self.base._items
+        available_delta = chef_delta = seasonal_delta = 0
+
+        for name, available in self._availability.items():
+            item = base_items.get(name)
+            if item is None or item.available == available:
+                continue
+            delta = 1 if available else -1
+            available_delta += delta
+            if item.metadata.chef_special:
+                chef_delta += delta
+            if item.metadata.seasonal:
+                seasonal_delta += delta
+
+        statistics['available_items'] += available_delta
+        statistics['unavailable_items'] -= available_delta
+        statistics['chef_specials'] += chef_delta
+        statistics['seasonal_items'] += seasonal_delta
+        if self._prices and statistics['total_items']:
+            statistics['price_statistics'] = self._calculate_price_statistics(statistics['total_items'])
+        return statistics
+
+    def _calculate_price_statistics(self, total_items: int) -> Dict[str, float]:
+        """Price statistics over the base prices with this location's overrides applied"""
+        base_items = self.base._items
+        price_total = self.base._statistics.price_total
+        for name, price in self._prices.items():
+            item = base_items.get(name)
+            if item is not None:
+                price_total += price - item.price
+
+        ascending = self._price_keys()
+        median_key = next(itertools.islice(ascending, total_items // 2, None))
+        return {
+            'min_price': next(self._price_keys())[0],
+            'max_price': next(self._price_keys(descending=True))[0],
+            'average_price': price_total / total_items,
+            'median_price': median_key[0]
+        }
+
+    # ===== HELPERS =====
+
+    def _resolve(self, item: MenuItemBase) -> MenuItemBase:
+        """The item as seen at this location"""
+        name = item.name
+        if name not in self._prices and name not in self._availability:
+            return item
+
+        version = self.base.version
+        cached = self._copies.get(name)
+        if cached is not None:
+            base_item, base_version, location_item = cached
+            if base_item is item and base_version == version:
+                return location_item
+
+        location_item = copy.copy(item)
+        location_item.price = self._prices.get(name, item.price)
+        location_item.available = self._availability.get(name, item.available)
+        self._copies[name] = (item, version, location_item)
+        return location_item
+
+    def _is_available(self, item: MenuItemBase) -> bool:
+        return self._availability.get(item.name, item.available)
+
+    def _price_keys(self, descending: bool = False) -> Iterator[Tuple[float, str]]:
+        """Every (price, name) key in price order, with overridden prices moved into place"""
+        base_keys = self.base._price_index.ascending()
+        base_items = self.base._items
+        overrides = sorted(
+            (price, name) for name, price in self._prices.items() if name in base_items
+        )
+        if descending:
+            base_keys = reversed(base_keys)
+            overrides.reverse()
+
+        prices = self._prices
+        kept = (key for key in base_keys if key[1] not in prices)
+        return heapq.merge(kept, overrides, reverse=descending)
+
+    def _take_available(self, keys: Iterable[Tuple[float, str]], count: Optional[int]) -> List[MenuItemBase]:
+        """Collect available items from ordered price keys, up to ``count`` when given"""
+        result = []
+        if count is not None and count <= 0:
+            return result
+        base_items = self.base._items
+        for _, name in keys:
+            item = base_items[name]
+            if self._is_available(item):
+                result.append(self._resolve(item))
+                if len(result) == count:
+                    break
+        return result
+
+    def __len__(self) -> int:
+        return len(self.base)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.base
+
+    def __str__(self) -> str:
+        return f"MenuOverlay({self.location!r}, {len(self._prices)} prices, {len(self._availability)} availability overrides)"
+
+    def __repr__(self) -> str:
+        return (f"MenuOverlay(location={self.location!r}, base={self.base!r}, "
+                f"price_overrides={len(self._prices)}, availability_overrides={len(self._availability)})")
@@ -0,0 +1,216 @@
+"""
+Menu Query - Declarative menu queries and the planner that runs them
+
+A ``MenuQuery`` describes what to fetch (facets, price range, text,
+allergens to exclude, sort order and limit) without saying how. The
+planner picks the index that yields the fewest candidates to drive the
+query and checks the remaining conditions on those candidates only.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Union
+
+from .base import MenuCategory, DietaryRestriction, normalize_allergens, normalize_dietary
+
+if TYPE_CHECKING:
+    from .menu_manager import MenuManager
+
+SORT_KEYS = ("name", "price", "-price")
+
+# Number of query results each manager keeps per menu version
+QUERY_CACHE_SIZE = 128
+
+
+@dataclass(frozen=True)
+class MenuQuery:
+    """
+    Declarative description of a menu lookup
+
+    Facets behave like the MenuManager.query arguments. ``text`` uses the
+    substring search index and orders results by relevance unless
+    ``sort_by`` ("name", "price" or "-price") is given. Items containing
+    any of ``exclude_allergens`` are left out; a single string is one
+    allergen and a dietary value such as "vegan" one restriction. Without ``sort_by`` the
+    order follows the index that drives the query. Queries are hashable so
+    results can be cached per menu version.
+    """
+    category: Optional[MenuCategory] = None
+    dietary: Union[DietaryRestriction, Iterable[DietaryRestriction], None] = ()
+    chef_special: Optional[bool] = None
+    seasonal: Optional[bool] = None
+    min_spice_level: Optional[int] = None
+    max_spice_level: Optional[int] = None
+    available: Optional[bool] = True
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    text: Optional[str] = None
+    exclude_allergens: Iterable[str] = ()
+    sort_by: Optional[str] = None
+    limit: Optional[int] = None
+
+    def __post_init__(self):
+        object.__setattr__(self, 'dietary',
+                           tuple(sorted(set(normalize_dietary(self.dietary)), key=lambda d: d.value)))
+        object.__setattr__(self, 'exclude_allergens', tuple(sorted(normalize_allergens(self.exclude_allergens))))
+        if self.text is not None:
+            object.__setattr__(self, 'text', self.text.strip() or None)
+
+        if self.sort_by is not None and self.sort_by not in SORT_KEYS:
+            raise ValueError(f"sort_by must be one of {SORT_KEYS}, got {self.sort_by!r}")
+        if self.limit is not None and self.limit < 0:
+            raise ValueError(f"limit must not be negative, got {self.limit}")
+
+    @property
+    def has_price_range(self) -> bool:
+        return self.min_price is not None or self.max_price is not None
+
+    def facet_filters(self) -> Dict[str, object]:
+        """The facet conditions as MenuManager.query keyword arguments"""
+        return {
+            'category': self.category,
+            'dietary': self.dietary or None,
+            'chef_special': self.chef_special,
+            'seasonal': self.seasonal,
+            'min_spice_level': self.min_spice_level,
+            'max_spice_level': self.max_spice_level,
+            'available': self.available,
+            'exclude_allergens': self.exclude_allergens,
+        }
+
+
+@dataclass
+class QueryPlan:
+    """
+    How a MenuQuery will run against one manager
+
+    ``driver`` is the index candidates come from ("text", "price" or
+    "facets"); every other condition is checked per candidate.
+    """
+    query: MenuQuery
+    driver: str
+    mask: int
+    filter_facets: bool
+    check_price: bool
+    sort_after: bool
+    estimates: Dict[str, int] = field(default_factory=dict)
+
+    def explain(self) -> str:
+        """Readable description of the plan, one step per line"""
+        query = self.query
+        estimates = ", ".join(f"{source}={count}" for source, count in self.estimates.items())
+        steps = []
+        if query.exclude_allergens:
+            steps.append(f"clear the bits of allergens {', '.join(query.exclude_allergens)}")
+        steps.append(f"candidates from {self._driver_description()} (estimated {estimates})")
+        if self.filter_facets:
+            steps.append("keep items in the facet bitset")
+        if self.check_price:
+            steps.append(f"check price within [{query.min_price}, {query.max_price}]")
+        if self.sort_after:
+            steps.append(f"sort by {query.sort_by}")
+        if query.limit is not None:
+            when = "after sorting" if self.sort_after else "stopping the scan early"
+            steps.append(f"limit {query.limit}, {when}")
+        return "\n".join(f"{number}. {step}" for number, step in enumerate(steps, start=1))
+
+    def _driver_description(self) -> str:
+        if self.driver == "text":
+            return f"text index search for {self.query.text!r}"
+        if self.driver == "price":
+            order = "descending" if self.query.sort_by == "-price" else "ascending"
+            return f"price index, {order}"
+        return "facet bitset"
+
+
+def plan_query(manager: 'MenuManager', query: MenuQuery) -> QueryPlan:
+    """
+    Choose how to run a query
+
+    Text queries are driven by the search index. Otherwise the price index
+    drives when its range (or, for a limited price sort, the expected scan
+    until the limit is reached) is smaller than the facet bitset plus the
+    cost of sorting it.
+    """
+    facet_index = manager._facet_index
+    price_index = manager._price_index
+    mask = manager._facet_mask(**query.facet_filters())
+    facet_count = facet_index.count(mask)
+    restricted = mask != facet_index.all_items()
+    estimates = {'facets': facet_count}
+    price_sort = query.sort_by in ("price", "-price")
+
+    if query.text:
+        return QueryPlan(query, "text", mask, restricted, query.has_price_range,
+                         query.sort_by is not None, estimates)
+
+    if query.has_price_range or price_sort:
+        price_count = price_index.count_in_range(query.min_price, query.max_price)
+        estimates['price'] = price_count
+        price_cost = price_count
+        facet_cost = facet_count
+        if price_sort:
+            facet_cost += int(facet_count * math.log2(facet_count + 1))
+            if query.limit is not None and facet_count:
+                price_cost = min(price_count, query.limit * max(len(price_index), 1) // facet_count)
+        if price_cost < facet_cost:
+            return QueryPlan(query, "price", mask, restricted, False,
+                             query.sort_by == "name", estimates)
+
+    return QueryPlan(query, "facets", mask, False, query.has_price_range,
+                     query.sort_by is not None, estimates)
+
+
+def execute_plan(manager: 'MenuManager', plan: QueryPlan) -> List[str]:
+    """Run a plan and return the matching item names in result order"""
+    query = plan.query
+    price_index = manager._price_index
+
+    if plan.driver == "text":
+        names: Iterable[str] = manager._search_index.search(query.text)
+    elif plan.driver == "price":
+        names = price_index.iter_range(query.min_price, query.max_price,
+                                       descending=query.sort_by == "-price")
+    else:
+        names = manager._facet_names(**query.facet_filters())
+
+    candidates = _filtered(manager, plan, names)
+    limit = query.limit
+
+    if plan.sort_after:
+        result = sorted(candidates, key=_sort_key(manager, query.sort_by),
+                        reverse=query.sort_by == "-price")
+        return result if limit is None else result[:limit]
+
+    result = []
+    if limit == 0:
+        return result
+    for name in candidates:
+        result.append(name)
+        if len(result) == limit:
+            break
+    return result
+
+
+def _filtered(manager: 'MenuManager', plan: QueryPlan, names: Iterable[str]) -> Iterator[str]:
+    """Apply the conditions the driving index did not cover"""
+    query = plan.query
+    facet_index = manager._facet_index
+    price_index = manager._price_index
+    low = -math.inf if query.min_price is None else query.min_price
+    high = math.inf if query.max_price is None else query.max_price
+
+    for name in names:
+        if plan.filter_facets and not facet_index.in_mask(name, plan.mask):
+            continue
+        if plan.check_price and not low <= price_index.price_of(name) <= high:
+            continue
+        yield name
+
+
+def _sort_key(manager: 'MenuManager', sort_by: str):
+    """Key function ordering names by the requested field"""
+    if sort_by == "name":
+        return lambda name: name.lower()
+    price_of = manager._price_index.price_of
+    return lambda name: (price_of(name), name)
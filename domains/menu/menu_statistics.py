@@ -0,0 +1,78 @@
+"""Menu Statistics - Running aggregates kept up to date on every menu mutation"""
+
+from typing import Dict, Optional
+from .base import MenuItemBase, MenuCategory, DietaryRestriction
+
+
+class MenuStatistics:
+    """
+    Incrementally maintained menu aggregates
+
+    MenuManager reports every add, remove, availability change and price
+    change here, so reading the counters never walks the menu. Chef special
+    and seasonal counts follow the existing statistics and only include
+    available items; category and dietary counts include every item.
+    """
+
+    def __init__(self):
+        self.total_items = 0
+        self.available_items = 0
+        self.chef_specials = 0
+        self.seasonal_items = 0
+        self.price_total = 0.0
+        self.category_counts: Dict[str, int] = {category.value: 0 for category in MenuCategory}
+        self.dietary_counts: Dict[str, int] = {restriction.value: 0 for restriction in DietaryRestriction}
+
+    def copy(self) -> 'MenuStatistics':
+        """Independent copy of the counters"""
+        clone = MenuStatistics.__new__(MenuStatistics)
+        clone.__dict__.update(self.__dict__)
+        clone.category_counts = dict(self.category_counts)
+        clone.dietary_counts = dict(self.dietary_counts)
+        return clone
+
+    def item_added(self, item: MenuItemBase, menu_category: Optional[MenuCategory]) -> None:
+        """Count a newly added item"""
+        self._apply_item(item, menu_category, 1)
+
+    def item_removed(self, item: MenuItemBase, menu_category: Optional[MenuCategory]) -> None:
+        """Uncount a removed item"""
+        self._apply_item(item, menu_category, -1)
+
+    def availability_changed(self, item: MenuItemBase, was_available: bool) -> None:
+        """Move an item between the available and unavailable counts"""
+        if item.available == was_available:
+            return
+        self._apply_availability(item, 1 if item.available else -1)
+
+    def price_changed(self, old_price: float, new_price: float) -> None:
+        """Adjust the running price total"""
+        self.price_total += new_price - old_price
+
+    def average_price(self) -> Optional[float]:
+        """Mean price of all items"""
+        if not self.total_items:
+            return None
+        return self.price_total / self.total_items
+
+    def _apply_item(self, item: MenuItemBase, menu_category: Optional[MenuCategory], delta: int) -> None:
+        """Add (delta=1) or subtract (delta=-1) an item's contribution"""
+        self.total_items += delta
+        self.price_total += delta * item.price
+        if not self.total_items:
+            # Drop accumulated float error once the menu is empty
+            self.price_total = 0.0
+        if menu_category:
+            self.category_counts[menu_category.value] += delta
+        for restriction in item.metadata.dietary_restrictions or []:
+            self.dietary_counts[restriction.value] += delta
+        if item.available:
+            self._apply_availability(item, delta)
+
+    def _apply_availability(self, item: MenuItemBase, delta: int) -> None:
+        """Counters that only include available items"""
+        self.available_items += delta
+        if item.metadata.chef_special:
+            self.chef_specials += delta
+        if item.metadata.seasonal:
+            self.seasonal_items += delta
@@ -0,0 +1,114 @@
+"""Menu Name Index - Sorted name index for ordered, cursor-based listings"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .base import MenuCategory
+
+# Sort position of each menu category; items without one sort last
+CATEGORY_RANKS: Dict[MenuCategory, int] = {category: rank for rank, category in enumerate(MenuCategory)}
+NO_CATEGORY_RANK = len(CATEGORY_RANKS)
+
+NameKey = Tuple[str, str]
+CategoryKey = Tuple[int, str, str]
+
+
+class MenuNameIndex:
+    """
+    Items kept sorted by name, overall and grouped by menu category
+
+    Two bisect-maintained lists: ``_by_name`` holds (folded name, name)
+    keys and ``_by_category`` prefixes them with the category rank. Both
+    can be walked from any key, which is what listing cursors resume from.
+    """
+
+    def __init__(self):
+        self._by_name: List[NameKey] = []
+        self._by_category: List[CategoryKey] = []
+        self._rank_of: Dict[str, int] = {}
+
+    @staticmethod
+    def name_key(name: str) -> NameKey:
+        """Case-insensitive sort key of a name, ties broken by the exact name"""
+        return (name.casefold(), name)
+
+    @staticmethod
+    def category_rank(category: Optional[MenuCategory]) -> int:
+        """Sort position of a menu category"""
+        return CATEGORY_RANKS.get(category, NO_CATEGORY_RANK)
+
+    def add(self, name: str, category: Optional[MenuCategory]) -> None:
+        """Insert an item at its sorted positions"""
+        if name in self._rank_of:
+            self.remove(name)
+
+        rank = self.category_rank(category)
+        key = self.name_key(name)
+        self._rank_of[name] = rank
+        insort(self._by_name, key)
+        insort(self._by_category, (rank,) + key)
+
+    def copy(self) -> 'MenuNameIndex':
+        """Independent copy of the index"""
+        clone = MenuNameIndex.__new__(MenuNameIndex)
+        clone._by_name = list(self._by_name)
+        clone._by_category = list(self._by_category)
+        clone._rank_of = dict(self._rank_of)
+        return clone
+
+    def add_many(self, entries: Iterable[Tuple[str, Optional[MenuCategory]]]) -> None:
+        """Insert a batch of (name, category) pairs with a single sort"""
+        added = False
+        for name, category in entries:
+            if name in self._rank_of:
+                self.remove(name)
+            rank = self.category_rank(category)
+            key = self.name_key(name)
+            self._rank_of[name] = rank
+            self._by_name.append(key)
+            self._by_category.append((rank,) + key)
+            added = True
+
+        if added:
+            self._by_name.sort()
+            self._by_category.sort()
+
+    def remove(self, name: str) -> None:
+        """Remove an item from the index"""
+        rank = self._rank_of.pop(name, None)
+        if rank is None:
+            return
+
+        key = self.name_key(name)
+        del self._by_name[bisect_left(self._by_name, key)]
+        del self._by_category[bisect_left(self._by_category, (rank,) + key)]
+
+    def by_name(self, after: Optional[NameKey] = None) -> Iterator[Tuple[NameKey, str]]:
+        """Yield (key, name) in name order, starting after a key"""
+        keys = self._by_name
+        start = 0 if after is None else bisect_right(keys, tuple(after))
+        for position in range(start, len(keys)):
+            key = keys[position]
+            yield key, key[1]
+
+    def by_category(self,
+                    after: Optional[CategoryKey] = None,
+                    category: Optional[MenuCategory] = None) -> Iterator[Tuple[CategoryKey, str]]:
+        """
+        Yield (key, name) in category then name order, starting after a key
+
+        With a category only that category's block is walked.
+        """
+        keys = self._by_category
+        start = 0 if after is None else bisect_right(keys, tuple(after))
+        end = len(keys)
+        if category is not None:
+            rank = self.category_rank(category)
+            start = max(start, bisect_left(keys, (rank,)))
+            end = bisect_left(keys, (rank + 1,))
+        for position in range(start, end):
+            key = keys[position]
+            yield key, key[2]
+
+    def __len__(self) -> int:
+        return len(self._by_name)
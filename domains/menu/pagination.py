@@ -0,0 +1,67 @@
+"""Menu Pagination - Pages and opaque keyset cursors for ordered menu listings"""
+
+import base64
+import json
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from .base import MenuItemBase
+
+PAGE_ORDERS = ("category", "name", "price")
+DEFAULT_PAGE_SIZE = 50
+
+# Field types of each ordering's sort key: (rank, folded name, name),
+# (folded name, name) and (price, name)
+_KEY_TYPES = {
+    "category": (int, str, str),
+    "name": (str, str),
+    "price": ((int, float), str),
+}
+
+
+@dataclass
+class MenuPage:
+    """
+    One page of an ordered menu listing
+
+    ``next_cursor`` resumes the listing right after the last item of this
+    page and is None on the last page. ``total`` counts every item matching
+    the listing's filters.
+    """
+    items: List[MenuItemBase]
+    next_cursor: Optional[str]
+    total: int
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+def encode_cursor(order_by: str, key: Sequence) -> str:
+    """
+    Pack the sort key of the last item on a page into a cursor
+
+    The cursor holds the key rather than an offset, so items added or
+    removed before it do not shift the following pages.
+    """
+    payload = json.dumps([order_by, list(key)], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str, order_by: str) -> Tuple:
+    """Unpack a cursor made by encode_cursor for the same ordering"""
+    try:
+        cursor_order, key = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid menu cursor: {cursor!r}") from e
+    if cursor_order != order_by:
+        raise ValueError(f"Cursor was issued for order '{cursor_order}', not '{order_by}'")
+    if not _valid_key(key, _KEY_TYPES[order_by]):
+        raise ValueError(f"Invalid menu cursor: {cursor!r}")
+    return tuple(key)
+
+
+def _valid_key(key: object, types: Tuple) -> bool:
+    """Whether a decoded cursor key has the fields of the ordering's sort key"""
+    return (isinstance(key, list) and len(key) == len(types)
+            and all(isinstance(field, kind) and not isinstance(field, bool)
+                    for field, kind in zip(key, types)))
@@ -0,0 +1,159 @@
+"""
+Menu Payload Cache - Rendered item dictionaries and menu payloads
+
+Items are rendered with ``to_dict`` and JSON-encoded once and reused until
+the manager's change log shows the item changed. The whole-menu payload
+(optionally gzip-compressed) is reassembled from the cached item bytes, so
+after a price change only that item is rendered again.
+"""
+
+import gzip
+import json
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .menu_manager import MenuManager
+
+
+def encode_json(value: Any) -> bytes:
+    """JSON bytes in the format the menu exports use"""
+    return json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+
+# Value types a rendered item nests
+_CONTAINERS = (dict, list)
+
+
+def copy_rendered(value: Any) -> Any:
+    """Independent copy of a rendered dictionary or list, for handing cached renderings to callers"""
+    if type(value) is dict:
+        return {key: item if type(item) not in _CONTAINERS else copy_rendered(item) for key, item in value.items()}
+    return [item if type(item) not in _CONTAINERS else copy_rendered(item) for item in value]
+
+
+class MenuPayloadCache:
+    """
+    Per-item rendering cache for one MenuManager
+
+    Each entry holds the item's dictionary and its JSON bytes, together
+    with the menu version it was rendered at. Before every read the cache
+    replays the change log since its last version and drops the entries of
+    changed items; if the log was compacted past that version everything
+    is dropped. Cached dictionaries are shared, so treat them as read-only.
+    """
+
+    def __init__(self, manager: 'MenuManager'):
+        self._manager = manager
+        self._version = manager.version
+        self._entries: Dict[str, Tuple[int, Dict[str, Any], bytes]] = {}
+        self._payloads: Dict[bool, Tuple[int, bytes]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def fork(self, manager: 'MenuManager') -> 'MenuPayloadCache':
+        """
+        A cache for another view of the same menu, starting from these renderings
+
+        The copied entries are synced against the view's change log on
+        first use. Renderings newer than the view are not reused.
+        """
+        cache = MenuPayloadCache(manager)
+        version = self._version
+        if version <= cache._version:
+            cache._version = version
+            cache._entries = dict(self._entries)
+        return cache
+
+    def item_dict(self, name: str) -> Optional[Dict[str, Any]]:
+        """Rendered dictionary of an item, or None if it is not on the menu"""
+        entry = self._entry(name)
+        return entry[1] if entry else None
+
+    def item_json(self, name: str) -> Optional[bytes]:
+        """JSON bytes of an item, or None if it is not on the menu"""
+        entry = self._entry(name)
+        return entry[2] if entry else None
+
+    def iter_item_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Rendered dictionaries of every item, in menu order"""
+        self._sync()
+        for name in list(self._manager._items):
+            yield self._render(name)[1]
+
+    def iter_item_json(self) -> Iterator[bytes]:
+        """JSON bytes of every item, in menu order"""
+        self._sync()
+        for name in list(self._manager._items):
+            yield self._render(name)[2]
+
+    def menu_payload(self, compress: bool = False) -> bytes:
+        """
+        The export_menu_data payload as JSON bytes
+
+        Kept per version, so repeated requests between changes return the
+        same bytes without any work. ``compress`` gzips the payload.
+        """
+        self._sync()
+        version = self._version
+        cached = self._payloads.get(compress)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        plain = self._payloads.get(False)
+        if plain is not None and plain[0] == version:
+            payload = plain[1]
+        else:
+            payload = b''.join([
+                b'{"version": ', str(version).encode('ascii'),
+                b', "items": [', b', '.join(self.iter_item_json()),
+                b'], "statistics": ', encode_json(self._manager.get_menu_statistics()), b'}'
+            ])
+            self._payloads[False] = (version, payload)
+
+        if compress:
+            payload = gzip.compress(payload, compresslevel=6)
+            self._payloads[True] = (version, payload)
+        return payload
+
+    def clear(self) -> None:
+        """Drop every cached rendering"""
+        self._entries.clear()
+        self._payloads.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Cache size and hit/miss counters"""
+        return {'items': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+    def _entry(self, name: str) -> Optional[Tuple[int, Dict[str, Any], bytes]]:
+        """Cached entry of an item after syncing with the change log"""
+        self._sync()
+        if name not in self._manager._items:
+            return None
+        return self._render(name)
+
+    def _render(self, name: str) -> Tuple[int, Dict[str, Any], bytes]:
+        """Cached entry of an item on the menu, rendering it on a miss"""
+        entry = self._entries.get(name)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        record = self._manager._items[name].to_dict()
+        entry = (self._version, record, encode_json(record))
+        self._entries[name] = entry
+        return entry
+
+    def _sync(self) -> None:
+        """Drop entries of items changed since the last sync"""
+        version = self._manager.version
+        if version == self._version:
+            return
+
+        entries = self._manager._change_log.entries_since(self._version)
+        if entries is None:
+            self._entries.clear()
+        else:
+            for _, _, name, _ in entries:
+                self._entries.pop(name, None)
+        self._version = version
@@ -0,0 +1,136 @@
+"""Menu Price Index - Sorted price index for range and top-N price queries"""
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class MenuPriceIndex:
+    """
+    Items kept sorted by (price, name)
+
+    A bisect-maintained pair of parallel lists: ``_keys`` holds the sort
+    keys and ``_prices`` the bare prices used for range lookups. Range
+    queries cost O(log n + k) and the cheapest, most expensive and median
+    prices are read directly from the ordered lists.
+    """
+
+    def __init__(self):
+        self._keys: List[Tuple[float, str]] = []
+        self._prices: List[float] = []
+        self._price_of: Dict[str, float] = {}
+
+    def add(self, name: str, price: float) -> None:
+        """Insert an item at its sorted position"""
+        if name in self._price_of:
+            self.remove(name)
+
+        key = (price, name)
+        position = bisect_left(self._keys, key)
+        self._keys.insert(position, key)
+        self._prices.insert(position, price)
+        self._price_of[name] = price
+
+    def copy(self) -> 'MenuPriceIndex':
+        """Independent copy of the index"""
+        clone = MenuPriceIndex.__new__(MenuPriceIndex)
+        clone._keys = list(self._keys)
+        clone._prices = list(self._prices)
+        clone._price_of = dict(self._price_of)
+        return clone
+
+    def add_many(self, entries: Iterable[Tuple[str, float]]) -> None:
+        """Insert a batch of (name, price) pairs with a single merge"""
+        new_keys = []
+        for name, price in entries:
+            if name in self._price_of:
+                self.remove(name)
+            self._price_of[name] = price
+            new_keys.append((price, name))
+
+        if not new_keys:
+            return
+        self._keys.extend(new_keys)
+        self._keys.sort()
+        self._prices = [price for price, _ in self._keys]
+
+    def remove(self, name: str) -> None:
+        """Remove an item from the index"""
+        price = self._price_of.pop(name, None)
+        if price is None:
+            return
+
+        position = bisect_left(self._keys, (price, name))
+        del self._keys[position]
+        del self._prices[position]
+
+    def update(self, name: str, price: float) -> None:
+        """Move an item to the position of its new price"""
+        self.remove(name)
+        self.add(name, price)
+
+    def update_many(self, prices: Dict[str, float]) -> None:
+        """Apply many price changes, re-sorting once when that is cheaper"""
+        if len(prices) * 8 < len(self._keys):
+            for name, price in prices.items():
+                self.update(name, price)
+            return
+
+        for name, price in prices.items():
+            self._price_of[name] = price
+        self._keys = sorted((price, name) for name, price in self._price_of.items())
+        self._prices = [price for price, _ in self._keys]
+
+    def in_range(self, min_price: Optional[float], max_price: Optional[float]) -> List[str]:
+        """Names of items priced within [min_price, max_price], cheapest first; None leaves a side open"""
+        start = 0 if min_price is None else bisect_left(self._prices, min_price)
+        end = len(self._prices) if max_price is None else bisect_right(self._prices, max_price)
+        return [name for _, name in self._keys[start:end]]
+
+    def iter_range(self, min_price: Optional[float], max_price: Optional[float],
+                   descending: bool = False) -> Iterator[str]:
+        """Lazily yield names within the bounds, cheapest (or dearest) first"""
+        start = 0 if min_price is None else bisect_left(self._prices, min_price)
+        end = len(self._prices) if max_price is None else bisect_right(self._prices, max_price)
+        keys = self._keys
+        positions = range(end - 1, start - 1, -1) if descending else range(start, end)
+        for position in positions:
+            yield keys[position][1]
+
+    def iter_after(self, after: Optional[Tuple[float, str]] = None) -> Iterator[Tuple[Tuple[float, str], str]]:
+        """Yield (key, name) from cheapest to most expensive, starting after a key"""
+        keys = self._keys
+        start = 0 if after is None else bisect_right(keys, tuple(after))
+        for position in range(start, len(keys)):
+            key = keys[position]
+            yield key, key[1]
+
+    def count_in_range(self, min_price: Optional[float], max_price: Optional[float]) -> int:
+        """Number of items priced within the bounds; None leaves a side open"""
+        start = 0 if min_price is None else bisect_left(self._prices, min_price)
+        end = len(self._prices) if max_price is None else bisect_right(self._prices, max_price)
+        return max(end - start, 0)
+
+    def price_of(self, name: str) -> Optional[float]:
+        """Indexed price of an item"""
+        return self._price_of.get(name)
+
+    def ascending(self) -> List[Tuple[float, str]]:
+        """All (price, name) keys from cheapest to most expensive"""
+        return self._keys
+
+    def min_price(self) -> Optional[float]:
+        """Lowest price on the menu"""
+        return self._prices[0] if self._prices else None
+
+    def max_price(self) -> Optional[float]:
+        """Highest price on the menu"""
+        return self._prices[-1] if self._prices else None
+
+    def median_price(self) -> Optional[float]:
+        """Upper median price, matching the previous sorted()[n // 2] rule"""
+        if not self._prices:
+            return None
+        return self._prices[len(self._prices) // 2]
+
+    def __len__(self) -> int:
+        return len(self._prices)
@@ -0,0 +1,156 @@
+"""Menu Search Index - Incrementally maintained n-gram index for menu text search"""
+
+from typing import Dict, Hashable, List, Optional, Set, Tuple, Iterable
+
+
+class MenuSearchIndex:
+    """
+    Trigram index over item names, descriptions and ingredients
+
+    Every searchable field is lowercased once when the item is indexed and
+    broken into overlapping character trigrams. A query is answered by
+    intersecting the posting sets of its own trigrams and then confirming
+    the substring on the small candidate set, so results match the original
+    substring semantics of ``MenuManager.search_items`` exactly.
+    ``copy`` shares the posting sets; each side copies a shared set the
+    first time it changes it.
+    """
+
+    GRAM_SIZE = 3
+
+    # Ranking weights - a hit in the name outranks ingredients and description
+    NAME_PREFIX_WEIGHT = 8
+    NAME_WEIGHT = 4
+    INGREDIENT_WEIGHT = 2
+    DESCRIPTION_WEIGHT = 1
+
+    # Grams whose posting set this index may change in place; None when it
+    # was never copied and owns every set
+    _owned: Optional[Set[str]] = None
+
+    def __init__(self):
+        self._grams: Dict[str, Set[str]] = {}
+        self._fields: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {}
+
+    def copy(self) -> 'MenuSearchIndex':
+        """Copy of the index that shares posting sets until either side changes them"""
+        clone = MenuSearchIndex.__new__(MenuSearchIndex)
+        clone._grams = dict(self._grams)
+        clone._fields = dict(self._fields)
+        clone._owned = set()
+        self._owned = set()
+        return clone
+
+    def add(self, name: str, description: str, ingredients: Iterable[str],
+            key: Optional[Hashable] = None) -> None:
+        """Index an item's searchable text under ``key`` (the name by default)"""
+        if key is None:
+            key = name
+        if key in self._fields:
+            self.remove(key)
+
+        fields = (
+            name.lower(),
+            (description or "").lower(),
+            tuple(ingredient.lower() for ingredient in ingredients or ())
+        )
+        self._fields[key] = fields
+
+        grams = self._grams
+        owned = self._owned
+        for gram in self._item_grams(fields):
+            postings = grams.get(gram)
+            if postings is None:
+                grams[gram] = {key}
+                if owned is not None:
+                    owned.add(gram)
+            else:
+                if owned is not None and gram not in owned:
+                    postings = self._own_postings(gram)
+                postings.add(key)
+
+    def remove(self, name: str) -> None:
+        """Drop an item from the index"""
+        fields = self._fields.pop(name, None)
+        if fields is None:
+            return
+
+        owned = self._owned
+        for gram in self._item_grams(fields):
+            postings = self._grams.get(gram)
+            if postings is not None:
+                if owned is not None and gram not in owned:
+                    postings = self._own_postings(gram)
+                postings.discard(name)
+                if not postings:
+                    del self._grams[gram]
+
+    def _own_postings(self, gram: str) -> Set[str]:
+        """Replace a posting set shared with a copy by a private one"""
+        postings = self._grams[gram] = set(self._grams[gram])
+        self._owned.add(gram)
+        return postings
+
+    def search(self, query: str) -> List[str]:
+        """Return names of matching items, best matches first"""
+        query = query.lower()
+        scored = []
+
+        for name in self._candidates(query):
+            score = self._score(self._fields[name], query)
+            if score:
+                scored.append((-score, name))
+
+        scored.sort()
+        return [name for _, name in scored]
+
+    def _candidates(self, query: str) -> Iterable[str]:
+        """Narrow the search to items sharing every trigram of the query"""
+        if len(query) < self.GRAM_SIZE:
+            # Too short to use the gram postings; check every indexed item
+            return self._fields.keys()
+
+        postings = []
+        for gram in self._grams_of(query):
+            posting = self._grams.get(gram)
+            if not posting:
+                return ()
+            postings.append(posting)
+
+        postings.sort(key=len)
+        return set.intersection(*postings)
+
+    def _score(self, fields: Tuple[str, str, Tuple[str, ...]], query: str) -> int:
+        """Score an item against the query; zero means no match"""
+        name, description, ingredients = fields
+        score = 0
+
+        if name.startswith(query):
+            score += self.NAME_PREFIX_WEIGHT
+        elif query in name:
+            score += self.NAME_WEIGHT
+        if any(query in ingredient for ingredient in ingredients):
+            score += self.INGREDIENT_WEIGHT
+        if query in description:
+            score += self.DESCRIPTION_WEIGHT
+
+        return score
+
+    def _item_grams(self, fields: Tuple[str, str, Tuple[str, ...]]) -> Set[str]:
+        """Collect the trigrams of every field of an item"""
+        name, description, ingredients = fields
+        grams = self._grams_of(name) | self._grams_of(description)
+        for ingredient in ingredients:
+            grams |= self._grams_of(ingredient)
+        return grams
+
+    def _grams_of(self, text: str) -> Set[str]:
+        """Split text into overlapping trigrams"""
+        size = self.GRAM_SIZE
+        return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._fields
@@ -5,16 +5,27 @@ This package implements the Observer Pattern for notification handling,
 allowing different notification types to be managed independently.
 """
 
-from .notification_system import NotificationObserver, NotificationEvent, NotificationChannel
+from .notification_system import NotificationObserver, NotificationEvent, NotificationChannel, NotificationPriority
 from .customer import CustomerNotifier
 from .staff import StaffNotifier
 from .promotional import PromotionalSubscriber
+from .notification_bus import NotificationBus, BackpressurePolicy
+from .priority_scheduler import NotificationScheduler
+from .campaign import CampaignEngine, Promotion, PreferenceIndex, CampaignReport
 
 __all__ = [
     'NotificationObserver',
     'NotificationEvent',
     'NotificationChannel',
+    'NotificationPriority',
     'CustomerNotifier',
     'StaffNotifier',
-    'PromotionalSubscriber'
+    'PromotionalSubscriber',
+    'NotificationBus',
+    'BackpressurePolicy',
+    'NotificationScheduler',
+    'CampaignEngine',
+    'Promotion',
+    'PreferenceIndex',
+    'CampaignReport'
 ]
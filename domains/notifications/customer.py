@@ -13,6 +13,67 @@ from .notification_system import (
 class CustomerNotifier(NotificationObserver):
     """Notifies customers about their order status"""
     
+    SUPPORTED_EVENTS = frozenset([
+        "order_received",
+        "order_preparing", 
+        "order_ready",
+        "order_delivered",
+        "payment_successful",
+        "payment_failed"
+    ])
+    
+    # Message templates per event, compiled once for the class
+    TEMPLATES: Dict[str, NotificationTemplate] = {
+        "order_received": NotificationTemplate(
+            "order_received",
+            {
+                NotificationChannel.SMS: "Your order #{order_id} has been received! Total: ${total:.2f}",
+                NotificationChannel.EMAIL: "Hi {customer_name}, your order #{order_id} has been received! Total: ${total:.2f}. We'll notify you when it's ready.",
+                NotificationChannel.PUSH: "Order #{order_id} received - ${total:.2f}"
+            }
+        ),
+        "order_preparing": NotificationTemplate(
+            "order_preparing",
+            {
+                NotificationChannel.SMS: "Your order #{order_id} is now being prepared. ETA: {eta} minutes",
+                NotificationChannel.EMAIL: "Good news {customer_name}! Your order #{order_id} is now being prepared. Estimated time: {eta} minutes.",
+                NotificationChannel.PUSH: "Order #{order_id} is being prepared - ETA {eta} min"
+            }
+        ),
+        "order_ready": NotificationTemplate(
+            "order_ready",
+            {
+                NotificationChannel.SMS: "Your order #{order_id} is ready for pickup/delivery!",
+                NotificationChannel.EMAIL: "Great news {customer_name}! Your order #{order_id} is ready for pickup/delivery!",
+                NotificationChannel.PUSH: "Order #{order_id} is ready!"
+            }
+        ),
+        "order_delivered": NotificationTemplate(
+            "order_delivered",
+            {
+                NotificationChannel.SMS: "Your order #{order_id} has been delivered. Thank you!",
+                NotificationChannel.EMAIL: "Thank you {customer_name}! Your order #{order_id} has been delivered. We hope you enjoy your meal!",
+                NotificationChannel.PUSH: "Order #{order_id} delivered. Thank you!"
+            }
+        ),
+        "payment_successful": NotificationTemplate(
+            "payment_successful",
+            {
+                NotificationChannel.SMS: "Payment confirmed! ${amount:.2f} via {payment_method} (ID: {transaction_id})",
+                NotificationChannel.EMAIL: "Hi {customer_name}, your payment of ${amount:.2f} via {payment_method} has been confirmed. Transaction ID: {transaction_id}",
+                NotificationChannel.PUSH: "Payment confirmed - ${amount:.2f}"
+            }
+        ),
+        "payment_failed": NotificationTemplate(
+            "payment_failed",
+            {
+                NotificationChannel.SMS: "Payment failed for order #{order_id}. Please try a different payment method.",
+                NotificationChannel.EMAIL: "Hi {customer_name}, payment failed for order #{order_id}. Please try a different payment method or contact support.",
+                NotificationChannel.PUSH: "Payment failed - please retry"
+            }
+        )
+    }
+    
     def __init__(self, customer_name: str, phone: str = "", email: str = ""):
         super().__init__(recipient_id=f"customer_{customer_name}")
         self.customer_name = customer_name
@@ -30,67 +91,15 @@ class CustomerNotifier(NotificationObserver):
     
     def supports_event(self, event_type: str) -> bool:
         """Customer notifications support order and payment events"""
-        return event_type in [
-            "order_received",
-            "order_preparing", 
-            "order_ready",
-            "order_delivered",
-            "payment_successful",
-            "payment_failed"
-        ]
+        return event_type in self.SUPPORTED_EVENTS
+    
+    def subscribed_events(self) -> List[str]:
+        """Order and payment events"""
+        return list(self.SUPPORTED_EVENTS)
     
     def get_notification_templates(self) -> Dict[str, NotificationTemplate]:
         """Get customer notification templates"""
-        return {
-            "order_received": NotificationTemplate(
-                "order_received",
-                {
-                    NotificationChannel.SMS: "Your order #{order_id} has been received! Total: ${total:.2f}",
-                    NotificationChannel.EMAIL: "Hi {customer_name}, your order #{order_id} has been received! Total: ${total:.2f}. We'll notify you when it's ready.",
-                    NotificationChannel.PUSH: "Order #{order_id} received - ${total:.2f}"
-                }
-            ),
-            "order_preparing": NotificationTemplate(
-                "order_preparing",
-                {
-                    NotificationChannel.SMS: "Your order #{order_id} is now being prepared. ETA: {eta} minutes",
-                    NotificationChannel.EMAIL: "Good news {customer_name}! Your order #{order_id} is now being prepared. Estimated time: {eta} minutes.",
-                    NotificationChannel.PUSH: "Order #{order_id} is being prepared - ETA {eta} min"
-                }
-            ),
-            "order_ready": NotificationTemplate(
-                "order_ready",
-                {
-                    NotificationChannel.SMS: "Your order #{order_id} is ready for pickup/delivery!",
-                    NotificationChannel.EMAIL: "Great news {customer_name}! Your order #{order_id} is ready for pickup/delivery!",
-                    NotificationChannel.PUSH: "Order #{order_id} is ready!"
-                }
-            ),
-            "order_delivered": NotificationTemplate(
-                "order_delivered",
-                {
-                    NotificationChannel.SMS: "Your order #{order_id} has been delivered. Thank you!",
-                    NotificationChannel.EMAIL: "Thank you {customer_name}! Your order #{order_id} has been delivered. We hope you enjoy your meal!",
-                    NotificationChannel.PUSH: "Order #{order_id} delivered. Thank you!"
-                }
-            ),
-            "payment_successful": NotificationTemplate(
-                "payment_successful",
-                {
-                    NotificationChannel.SMS: "Payment confirmed! ${amount:.2f} via {payment_method} (ID: {transaction_id})",
-                    NotificationChannel.EMAIL: "Hi {customer_name}, your payment of ${amount:.2f} via {payment_method} has been confirmed. Transaction ID: {transaction_id}",
-                    NotificationChannel.PUSH: "Payment confirmed - ${amount:.2f}"
-                }
-            ),
-            "payment_failed": NotificationTemplate(
-                "payment_failed",
-                {
-                    NotificationChannel.SMS: "Payment failed for order #{order_id}. Please try a different payment method.",
-                    NotificationChannel.EMAIL: "Hi {customer_name}, payment failed for order #{order_id}. Please try a different payment method or contact support.",
-                    NotificationChannel.PUSH: "Payment failed - please retry"
-                }
-            )
-        }
+        return dict(self.TEMPLATES)
     
     def update(self, event_type: str, data: Dict[str, Any]) -> List[NotificationResult]:
         """Process customer notification"""
@@ -98,12 +107,10 @@ class CustomerNotifier(NotificationObserver):
             return []
         
         results = []
-        templates = self.get_notification_templates()
-        
-        if event_type not in templates:
+        template = self.TEMPLATES.get(event_type)
+        if template is None:
             return []
         
-        template = templates[event_type]
         timestamp = self._format_timestamp()
         
         # Add customer name to data for template formatting
@@ -112,7 +119,7 @@ class CustomerNotifier(NotificationObserver):
         # Send notification via preferred channels
         for channel in self.preferred_channels:
             try:
-                message = template.format_message(channel, **data_with_customer)
+                message = template.render(channel, data_with_customer)
                 
                 # Display the notification (in real app, this would use actual services)
                 recipient = self.email if channel == NotificationChannel.EMAIL else self.phone
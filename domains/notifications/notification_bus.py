@@ -0,0 +1,355 @@
+"""
+Asynchronous Notification Bus
+
+Lets a Subject hand observer deliveries to background worker threads
+instead of running them in the caller. Deliveries are grouped into
+channels (by default one per observer class), each with its own bounded
+queue and workers, so a slow channel only delays itself. When a queue is
+full the channel's backpressure policy decides what happens.
+"""
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class BackpressurePolicy(Enum):
+    """What a full channel queue does with a new delivery"""
+    BLOCK = "block"                  # wait in the publisher until there is room
+    DROP_OLDEST = "drop_oldest"      # discard the oldest queued delivery
+    SPILL_TO_DISK = "spill_to_disk"  # append to a spill file read back in order
+
+
+class DeliveryJob:
+    """One observer update waiting in a channel queue"""
+
+    __slots__ = ('observer', 'event_type', 'data', 'enqueued_at')
+
+    def __init__(self, observer: Any, event_type: str, data: Dict[str, Any], enqueued_at: float):
+        self.observer = observer
+        self.event_type = event_type
+        self.data = data
+        self.enqueued_at = enqueued_at
+
+
+class ChannelStats:
+    """Delivery counters of one channel"""
+
+    __slots__ = ('published', 'delivered', 'failed', 'dropped', 'spilled')
+
+    def __init__(self):
+        self.published = 0
+        self.delivered = 0
+        self.failed = 0
+        self.dropped = 0
+        self.spilled = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class SpillFile:
+    """
+    Append-only file of pickled deliveries, read back in FIFO order
+
+    Observers stay in memory; records refer to them by id. The file is
+    truncated whenever it has been read to the end.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        handle, self.path = tempfile.mkstemp(prefix="notifications-", suffix=".spill", dir=directory)
+        self._file = os.fdopen(handle, 'w+b')
+        self._read_offset = 0
+        self._count = 0
+        self._observers: Dict[int, Tuple[Any, int]] = {}
+
+    def append(self, job: DeliveryJob) -> bool:
+        """Write a delivery to the end of the file; False if its data cannot be pickled"""
+        try:
+            record = pickle.dumps((id(job.observer), job.event_type, job.data, job.enqueued_at))
+        except Exception:
+            return False
+
+        self._file.seek(0, os.SEEK_END)
+        self._file.write(record)
+        observer, references = self._observers.get(id(job.observer), (job.observer, 0))
+        self._observers[id(job.observer)] = (observer, references + 1)
+        self._count += 1
+        return True
+
+    def read(self, limit: int) -> list:
+        """Read back up to ``limit`` of the oldest spilled deliveries"""
+        self._file.flush()
+        self._file.seek(self._read_offset)
+        jobs = []
+        while self._count and len(jobs) < limit:
+            observer_id, event_type, data, enqueued_at = pickle.load(self._file)
+            observer, references = self._observers[observer_id]
+            if references == 1:
+                del self._observers[observer_id]
+            else:
+                self._observers[observer_id] = (observer, references - 1)
+            jobs.append(DeliveryJob(observer, event_type, data, enqueued_at))
+            self._count -= 1
+
+        self._read_offset = self._file.tell()
+        if not self._count:
+            self._file.seek(0)
+            self._file.truncate()
+            self._read_offset = 0
+        return jobs
+
+    def close(self) -> None:
+        self._file.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class ChannelQueue:
+    """
+    Bounded FIFO of deliveries for one channel
+
+    Once anything has spilled to disk, new deliveries follow it into the
+    spill file until it drains, so delivery order is preserved. A delivery
+    whose data cannot be pickled blocks its publisher instead, until the
+    spill file has drained and the queue has room.
+    """
+
+    def __init__(self, name: str, max_size: int, policy: BackpressurePolicy, spill_dir: Optional[str] = None):
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        self.name = name
+        self.max_size = max_size
+        self.policy = policy
+        self.stats = ChannelStats()
+        self._spill_dir = spill_dir
+        self._spill: Optional[SpillFile] = None
+        self._items: Deque[DeliveryJob] = deque()
+        self._condition = threading.Condition()
+        self._unfinished = 0
+        self._closed = False
+
+    def put(self, job: DeliveryJob) -> None:
+        """Queue a delivery, applying the backpressure policy when full"""
+        with self._condition:
+            self._check_open()
+            if self._spill is not None and len(self._spill):
+                if self._spill.append(job):
+                    self.stats.spilled += 1
+                else:
+                    self._wait_for_room(drain_spill=True)
+                    self._items.append(job)
+            elif len(self._items) < self.max_size:
+                self._items.append(job)
+            elif self.policy is BackpressurePolicy.DROP_OLDEST:
+                self._items.popleft()
+                self._items.append(job)
+                self.stats.dropped += 1
+                self._unfinished -= 1
+            elif self.policy is BackpressurePolicy.SPILL_TO_DISK and self._spill_job(job):
+                self.stats.spilled += 1
+            else:
+                self._wait_for_room()
+                self._items.append(job)
+            self.stats.published += 1
+            self._unfinished += 1
+            self._condition.notify_all()
+
+    def get(self) -> Optional[DeliveryJob]:
+        """Take the next delivery, waiting for one; None once closed and empty"""
+        with self._condition:
+            while not self._items:
+                if self._spill is not None and len(self._spill):
+                    self._items.extend(self._spill.read(self.max_size))
+                    break
+                if self._closed:
+                    return None
+                self._condition.wait()
+            job = self._items.popleft()
+            self._condition.notify_all()
+            return job
+
+    def task_done(self, success: bool = True) -> None:
+        """Mark a delivery taken with get as finished and count its outcome"""
+        with self._condition:
+            if success:
+                self.stats.delivered += 1
+            else:
+                self.stats.failed += 1
+            self._unfinished -= 1
+            if not self._unfinished:
+                self._condition.notify_all()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued delivery is finished"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._unfinished:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return True
+
+    def close(self) -> None:
+        """Stop accepting deliveries; workers exit once the queue is empty"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def discard_spill(self) -> None:
+        """Remove the spill file"""
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def _wait_for_room(self, drain_spill: bool = False) -> None:
+        """Block the publisher until the queue has room (and the spill file is empty)"""
+        while not self._closed and (len(self._items) >= self.max_size
+                                    or (drain_spill and len(self._spill))):
+            self._condition.wait()
+        self._check_open()
+
+    def _check_open(self) -> None:
+        """Reject deliveries once the queue is closed, so join cannot wait on them forever"""
+        if self._closed:
+            raise RuntimeError(f"Notification channel '{self.name}' has been closed")
+
+    def _spill_job(self, job: DeliveryJob) -> bool:
+        if self._spill is None:
+            self._spill = SpillFile(self._spill_dir)
+        return self._spill.append(job)
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._items) + (len(self._spill) if self._spill is not None else 0)
+
+
+class NotificationBus:
+    """
+    Thread-backed bus running observer updates off the caller's thread
+
+    Attach it to a Subject with ``set_notification_bus`` and ``notify``
+    enqueues one delivery per observer instead of calling ``update``.
+    ``channel_for`` maps an observer to its channel name; each channel gets
+    a queue of ``max_queue_size`` deliveries and ``workers_per_channel``
+    threads, started when the channel is first used. Errors raised by an
+    observer are logged and counted, never propagated to the publisher.
+    """
+
+    def __init__(self,
+                 max_queue_size: int = 1000,
+                 policy: BackpressurePolicy = BackpressurePolicy.BLOCK,
+                 workers_per_channel: int = 1,
+                 spill_dir: Optional[str] = None,
+                 channel_for: Optional[Callable[[Any], str]] = None):
+        self.max_queue_size = max_queue_size
+        self.policy = policy
+        self.workers_per_channel = workers_per_channel
+        self.spill_dir = spill_dir
+        self.channel_for = channel_for or default_channel
+        self._channels: Dict[str, ChannelQueue] = {}
+        self._workers: Dict[str, list] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def publish(self, observer: Any, event_type: str, data: Dict[str, Any]) -> None:
+        """Queue ``observer.update(event_type, data)`` on the observer's channel"""
+        if self._closed:
+            raise RuntimeError("Notification bus has been shut down")
+        job = DeliveryJob(observer, event_type, dict(data), time.perf_counter())
+        self._channel(self.channel_for(observer)).put(job)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued delivery has run; False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for queue in list(self._channels.values()):
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            if not queue.join(remaining):
+                return False
+        return True
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers, by default after the queued deliveries have run"""
+        if wait:
+            self.flush()
+        self._closed = True
+        for queue in self._channels.values():
+            queue.close()
+        for workers in self._workers.values():
+            for worker in workers:
+                worker.join()
+        for queue in self._channels.values():
+            queue.discard_spill()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Counters and current queue length per channel"""
+        return {
+            name: {**queue.stats.to_dict(), 'queued': len(queue)}
+            for name, queue in self._channels.items()
+        }
+
+    def _channel(self, name: str) -> ChannelQueue:
+        """The queue of a channel, starting its workers on first use"""
+        queue = self._channels.get(name)
+        if queue is not None:
+            return queue
+
+        with self._lock:
+            queue = self._channels.get(name)
+            if queue is None:
+                queue = ChannelQueue(name, self.max_queue_size, self.policy, self.spill_dir)
+                workers = [
+                    threading.Thread(target=self._work, args=(queue,), name=f"notify-{name}-{number}", daemon=True)
+                    for number in range(self.workers_per_channel)
+                ]
+                for worker in workers:
+                    worker.start()
+                self._workers[name] = workers
+                self._channels[name] = queue
+        return queue
+
+    def _work(self, queue: ChannelQueue) -> None:
+        """Worker loop: deliver jobs until the queue is closed and empty"""
+        while True:
+            job = queue.get()
+            if job is None:
+                return
+            success = False
+            try:
+                success = deliver(job)
+            finally:
+                queue.task_done(success)
+
+    def __enter__(self) -> 'NotificationBus':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+
+def deliver(job: DeliveryJob) -> bool:
+    """Run one observer update; errors are logged and reported as False"""
+    try:
+        job.observer.update(job.event_type, job.data)
+        return True
+    except Exception as e:
+        logger.error(f"Notification delivery to {type(job.observer).__name__} failed: {e}")
+        return False
+
+
+def default_channel(observer: Any) -> str:
+    """One channel per observer class"""
+    return type(observer).__name__
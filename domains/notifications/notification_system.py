@@ -2,7 +2,9 @@
 Base Notification System Interfaces and Types
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+import random
+from string import Formatter
+from typing import Any, Callable, Dict, List, Mapping, Optional
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -18,6 +20,17 @@ class NotificationChannel(Enum):
     WEBHOOK = "webhook"
 
 
+# Simulated delivery success rates by channel
+DELIVERY_SUCCESS_RATES = {
+    NotificationChannel.SMS: 0.98,
+    NotificationChannel.EMAIL: 0.95,
+    NotificationChannel.PUSH: 0.90,
+    NotificationChannel.IN_APP: 0.99,
+    NotificationChannel.SLACK: 0.97,
+    NotificationChannel.WEBHOOK: 0.93
+}
+
+
 class NotificationPriority(Enum):
     """Notification priority levels"""
     LOW = "low"
@@ -59,24 +72,63 @@ class NotificationResult:
 
 
 class NotificationTemplate:
-    """Template for notification messages"""
+    """
+    Template for notification messages
+
+    Each channel's format string is compiled into a render function when
+    the template is created, so formatting a message does not parse it again.
+    """
     
     def __init__(self, template_id: str, templates: Dict[NotificationChannel, str]):
         self.template_id = template_id
         self.templates = templates
+        self._renderers = {channel: compile_template(text) for channel, text in templates.items()}
     
     def format_message(self, channel: NotificationChannel, **kwargs) -> str:
         """Format template with provided data"""
-        if channel not in self.templates:
+        return self.render(channel, kwargs)
+    
+    def render(self, channel: NotificationChannel, values: Mapping[str, Any]) -> str:
+        """Format template with the values of a mapping"""
+        renderer = self._renderers.get(channel)
+        if renderer is None:
             raise ValueError(f"No template found for channel {channel.value}")
         
-        template = self.templates[channel]
         try:
-            return template.format(**kwargs)
+            return renderer(values)
         except KeyError as e:
             raise ValueError(f"Missing template variable: {e}")
 
 
+# Format spec characters that cannot be copied into generated source as is
+_UNSAFE_SPEC_CHARS = frozenset('{}"\'\\\n')
+
+
+def compile_template(template: str) -> Callable[[Mapping[str, Any]], str]:
+    """
+    Compile a str.format template into a function rendering a mapping
+
+    Templates using plain field names (with optional conversion and format
+    spec) become a generated f-string function. Anything else, such as
+    attribute or index lookups and nested specs, renders with format_map.
+    """
+    namespace: Dict[str, Any] = {}
+    parts = []
+    for number, (literal, field, spec, conversion) in enumerate(Formatter().parse(template)):
+        if literal:
+            namespace[f"_literal{number}"] = literal
+            parts.append(f"{{_literal{number}}}")
+        if field is None:
+            continue
+        if not field.isidentifier() or any(char in spec for char in _UNSAFE_SPEC_CHARS):
+            return template.format_map
+        parts.append(f"{{values[{field!r}]{'!' + conversion if conversion else ''}{':' + spec if spec else ''}}}")
+    
+    source = f"def render(values):\n    return f\"{''.join(parts)}\"\n"
+    exec(compile(source, f"<template {template[:40]!r}>", "exec"), namespace)
+    return namespace['render']
+
+
 class NotificationObserver(ABC):
     """
     Abstract Observer Interface for Notifications
@@ -115,6 +167,14 @@ class NotificationObserver(ABC):
         """Check if this observer handles the given event type"""
         pass
     
+    def subscribed_events(self) -> Optional[List[str]]:
+        """
+        Event types to subscribe to when attached to a Subject
+        
+        None subscribes to every event and leaves filtering to supports_event.
+        """
+        return None
+    
     @abstractmethod
     def get_notification_templates(self) -> Dict[str, NotificationTemplate]:
         """Get notification templates for this observer"""
@@ -140,19 +200,7 @@ class NotificationObserver(ABC):
         """
         Simulate message delivery (in real app, this would integrate with actual services)
         """
-        import random
-        
-        # Simulate delivery success rates by channel
-        success_rates = {
-            NotificationChannel.SMS: 0.98,
-            NotificationChannel.EMAIL: 0.95,
-            NotificationChannel.PUSH: 0.90,
-            NotificationChannel.IN_APP: 0.99,
-            NotificationChannel.SLACK: 0.97,
-            NotificationChannel.WEBHOOK: 0.93
-        }
-        
-        success = random.random() < success_rates.get(channel, 0.95)
+        success = random.random() < DELIVERY_SUCCESS_RATES.get(channel, 0.95)
         
         if success:
             delivery_id = f"{channel.value}_{random.randint(100000, 999999)}"
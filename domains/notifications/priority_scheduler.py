@@ -0,0 +1,273 @@
+"""
+Priority Notification Scheduler
+
+Delivers observer updates from a shared pool of worker threads in
+NotificationPriority order, so a flood of promotional sends cannot hold
+back "order ready" or "payment failed" alerts. Waiting deliveries age:
+every ``aging_interval`` seconds spent in the queue counts as one priority
+level, so low-priority work still goes out while urgent traffic keeps
+arriving.
+"""
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from .notification_bus import DeliveryJob, deliver
+from .notification_system import NotificationEvent, NotificationPriority
+from .promotional import PromotionalSubscriber
+
+# Highest priority first
+PRIORITY_ORDER = (
+    NotificationPriority.URGENT,
+    NotificationPriority.HIGH,
+    NotificationPriority.NORMAL,
+    NotificationPriority.LOW,
+)
+
+# Priority of the events the system raises; anything else is NORMAL
+EVENT_PRIORITIES: Dict[str, NotificationPriority] = {
+    "order_ready": NotificationPriority.URGENT,
+    "payment_failed": NotificationPriority.URGENT,
+    "order_received": NotificationPriority.HIGH,
+    "order_preparing": NotificationPriority.HIGH,
+    "order_delivered": NotificationPriority.HIGH,
+    "payment_successful": NotificationPriority.HIGH,
+    **{event_type: NotificationPriority.LOW for event_type in PromotionalSubscriber.SUPPORTED_EVENTS},
+}
+
+# Queueing delays kept per priority for the percentile metrics
+DELAY_SAMPLES = 1024
+
+
+def priority_of(event_type: str, data: Optional[Dict[str, Any]] = None) -> NotificationPriority:
+    """Priority of an event: a NotificationPriority under data['priority'], else EVENT_PRIORITIES"""
+    if data:
+        priority = data.get('priority')
+        if isinstance(priority, NotificationPriority):
+            return priority
+    return EVENT_PRIORITIES.get(event_type, NotificationPriority.NORMAL)
+
+
+class ScheduledDelivery(DeliveryJob):
+    """A delivery with its priority and the time aging makes it most urgent"""
+
+    __slots__ = ('priority', 'due')
+
+    def __init__(self, observer: Any, event_type: str, data: Dict[str, Any], enqueued_at: float,
+                 priority: NotificationPriority, due: float):
+        super().__init__(observer, event_type, data, enqueued_at)
+        self.priority = priority
+        self.due = due
+
+
+class PriorityMetrics:
+    """Delivery counters and queueing delays of one priority class"""
+
+    __slots__ = ('delivered', 'failed', 'promoted', 'total_delay', 'max_delay', 'recent_delays')
+
+    def __init__(self):
+        self.delivered = 0
+        self.failed = 0
+        self.promoted = 0
+        self.total_delay = 0.0
+        self.max_delay = 0.0
+        self.recent_delays: Deque[float] = deque(maxlen=DELAY_SAMPLES)
+
+    def record(self, delay: float, promoted: bool, success: bool) -> None:
+        if success:
+            self.delivered += 1
+        else:
+            self.failed += 1
+        if promoted:
+            self.promoted += 1
+        self.total_delay += delay
+        self.max_delay = max(self.max_delay, delay)
+        self.recent_delays.append(delay)
+
+    def to_dict(self, queued: int) -> Dict[str, Any]:
+        """
+        Counters with delays in milliseconds
+
+        ``promoted`` counts deliveries that aging moved ahead of waiting
+        higher-priority ones; percentiles cover the most recent deliveries.
+        """
+        handled = self.delivered + self.failed
+        recent = sorted(self.recent_delays)
+        return {
+            'queued': queued,
+            'delivered': self.delivered,
+            'failed': self.failed,
+            'promoted': self.promoted,
+            'mean_delay_ms': self.total_delay / handled * 1000 if handled else 0.0,
+            'p50_delay_ms': _percentile(recent, 0.50) * 1000,
+            'p95_delay_ms': _percentile(recent, 0.95) * 1000,
+            'max_delay_ms': self.max_delay * 1000,
+        }
+
+
+class NotificationScheduler:
+    """
+    Priority queue of observer updates served by a pool of worker threads
+
+    Deliveries wait in one FIFO per priority. A delivery is due
+    ``aging_interval`` seconds later for every level below URGENT, and
+    workers always take the queue head that is due first, which is
+    strict priority order until something has waited long enough to
+    overtake. Publishers block once ``max_queue_size`` deliveries wait.
+
+    Publishing has the NotificationBus signature, so a Subject can use the
+    scheduler through ``set_notification_bus``; the priority then comes
+    from ``priority_for(event_type, data)``. ``submit`` schedules a
+    NotificationEvent with its own priority.
+    """
+
+    def __init__(self,
+                 workers: int = 2,
+                 aging_interval: float = 0.5,
+                 max_queue_size: int = 10_000,
+                 priority_for: Optional[Callable[[str, Dict[str, Any]], NotificationPriority]] = None):
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if aging_interval <= 0:
+            raise ValueError(f"aging_interval must be positive, got {aging_interval}")
+        if max_queue_size < 1:
+            raise ValueError(f"max_queue_size must be at least 1, got {max_queue_size}")
+        self.worker_count = workers
+        self.aging_interval = aging_interval
+        self.max_queue_size = max_queue_size
+        self.priority_for = priority_for or priority_of
+        self._offsets = {priority: rank * aging_interval for rank, priority in enumerate(PRIORITY_ORDER)}
+        self._queues: Dict[NotificationPriority, Deque[ScheduledDelivery]] = {
+            priority: deque() for priority in PRIORITY_ORDER
+        }
+        self._metrics = {priority: PriorityMetrics() for priority in PRIORITY_ORDER}
+        self._condition = threading.Condition()
+        self._size = 0
+        self._unfinished = 0
+        self._closed = False
+        self._workers: List[threading.Thread] = []
+
+    def publish(self, observer: Any, event_type: str, data: Dict[str, Any],
+                priority: Optional[NotificationPriority] = None) -> None:
+        """Schedule ``observer.update(event_type, data)``"""
+        if priority is None:
+            priority = self.priority_for(event_type, data)
+        enqueued_at = time.perf_counter()
+        job = ScheduledDelivery(observer, event_type, dict(data), enqueued_at,
+                                priority, enqueued_at + self._offsets[priority])
+
+        with self._condition:
+            self._check_open()
+            if not self._workers:
+                self._start_workers()
+            while self._size >= self.max_queue_size and not self._closed:
+                self._condition.wait()
+            self._check_open()
+            self._queues[priority].append(job)
+            self._size += 1
+            self._unfinished += 1
+            self._condition.notify_all()
+
+    def submit(self, event: NotificationEvent, observers: Iterable[Any]) -> None:
+        """Schedule a NotificationEvent for each observer at the event's priority"""
+        for observer in observers:
+            self.publish(observer, event.event_type, event.data, event.priority)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every scheduled delivery has run; False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._unfinished:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return True
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers, by default after the scheduled deliveries have run"""
+        if wait:
+            self.flush()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        for worker in self._workers:
+            worker.join()
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Queue length, counters and queueing delay per priority class"""
+        with self._condition:
+            return {
+                priority.value: self._metrics[priority].to_dict(len(self._queues[priority]))
+                for priority in PRIORITY_ORDER
+            }
+
+    def _check_open(self) -> None:
+        """Reject deliveries once shut down, so flush cannot wait on them forever"""
+        if self._closed:
+            raise RuntimeError("Notification scheduler has been shut down")
+
+    def _start_workers(self) -> None:
+        self._workers = [
+            threading.Thread(target=self._work, name=f"notify-priority-{number}", daemon=True)
+            for number in range(self.worker_count)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def _next(self) -> Optional[Tuple[ScheduledDelivery, bool]]:
+        """
+        Take the queue head that is due first, waiting for one
+
+        Returns the delivery and whether it overtook a higher priority, or
+        None once the scheduler is closed and empty.
+        """
+        with self._condition:
+            while not self._size:
+                if self._closed:
+                    return None
+                self._condition.wait()
+
+            chosen = None
+            promoted = False
+            for priority in PRIORITY_ORDER:
+                queue = self._queues[priority]
+                if not queue:
+                    continue
+                if chosen is None:
+                    chosen = queue
+                elif queue[0].due < chosen[0].due:
+                    chosen = queue
+                    promoted = True
+            job = chosen.popleft()
+            self._size -= 1
+            self._condition.notify_all()
+            return job, promoted
+
+    def _work(self) -> None:
+        """Worker loop: deliver in schedule order until closed and empty"""
+        while True:
+            scheduled = self._next()
+            if scheduled is None:
+                return
+            job, promoted = scheduled
+            delay = time.perf_counter() - job.enqueued_at
+            success = deliver(job)
+            with self._condition:
+                self._metrics[job.priority].record(delay, promoted, success)
+                self._unfinished -= 1
+                if not self._unfinished:
+                    self._condition.notify_all()
+
+    def __enter__(self) -> 'NotificationScheduler':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
@@ -1,7 +1,7 @@
 """
 Promotional Notification Implementation
 """
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 from .notification_system import (
     NotificationObserver, 
     NotificationResult, 
@@ -13,11 +13,67 @@ from .notification_system import (
 class PromotionalSubscriber(NotificationObserver):
     """Handles promotional emails and special deals"""
     
+    SUPPORTED_EVENTS = frozenset([
+        "promotion",
+        "loyalty_reward",
+        "birthday_offer",
+        "seasonal_promotion",
+        "new_menu_item",
+        "special_event"
+    ])
+    
+    # Message templates per event, compiled once for the class
+    TEMPLATES: Dict[str, NotificationTemplate] = {
+        "promotion": NotificationTemplate(
+            "promotion",
+            {
+                NotificationChannel.EMAIL: "🎉 Hi {customer_name}! {message} Use code: {promo_code}",
+                NotificationChannel.PUSH: "🎉 {message}"
+            }
+        ),
+        "loyalty_reward": NotificationTemplate(
+            "loyalty_reward",
+            {
+                NotificationChannel.EMAIL: "🌟 Congratulations {customer_name}! {message}",
+                NotificationChannel.PUSH: "🌟 Loyalty reward: {message}"
+            }
+        ),
+        "birthday_offer": NotificationTemplate(
+            "birthday_offer",
+            {
+                NotificationChannel.EMAIL: "🎂 Happy Birthday {customer_name}! {message}",
+                NotificationChannel.PUSH: "🎂 Birthday special: {message}"
+            }
+        ),
+        "seasonal_promotion": NotificationTemplate(
+            "seasonal_promotion",
+            {
+                NotificationChannel.EMAIL: "🍂 Seasonal Special for {customer_name}! {message}",
+                NotificationChannel.PUSH: "🍂 Seasonal: {message}"
+            }
+        ),
+        "new_menu_item": NotificationTemplate(
+            "new_menu_item",
+            {
+                NotificationChannel.EMAIL: "🍽️ New on the menu, {customer_name}! {message}",
+                NotificationChannel.PUSH: "🍽️ New: {message}"
+            }
+        ),
+        "special_event": NotificationTemplate(
+            "special_event",
+            {
+                NotificationChannel.EMAIL: "🎪 Special Event for {customer_name}! {message}",
+                NotificationChannel.PUSH: "🎪 Event: {message}"
+            }
+        )
+    }
+    
     def __init__(self, customer_name: str, email: str, preferences: Optional[List[str]] = None):
         super().__init__(recipient_id=f"promo_{customer_name}")
         self.customer_name = customer_name
         self.email = email
         self.preferences = preferences if preferences is not None else []
+        self._preference_listeners: List[Callable[['PromotionalSubscriber'], None]] = []
         
         # Promotional notifications typically use email and push
         self.set_preferred_channels([
@@ -27,61 +83,15 @@ class PromotionalSubscriber(NotificationObserver):
     
     def supports_event(self, event_type: str) -> bool:
         """Promotional subscriber handles marketing events"""
-        return event_type in [
-            "promotion",
-            "loyalty_reward",
-            "birthday_offer",
-            "seasonal_promotion",
-            "new_menu_item",
-            "special_event"
-        ]
+        return event_type in self.SUPPORTED_EVENTS
+    
+    def subscribed_events(self) -> List[str]:
+        """Marketing events"""
+        return list(self.SUPPORTED_EVENTS)
     
     def get_notification_templates(self) -> Dict[str, NotificationTemplate]:
         """Get promotional notification templates"""
-        return {
-            "promotion": NotificationTemplate(
-                "promotion",
-                {
-                    NotificationChannel.EMAIL: "🎉 Hi {customer_name}! {message} Use code: {promo_code}",
-                    NotificationChannel.PUSH: "🎉 {message}"
-                }
-            ),
-            "loyalty_reward": NotificationTemplate(
-                "loyalty_reward",
-                {
-                    NotificationChannel.EMAIL: "🌟 Congratulations {customer_name}! {message}",
-                    NotificationChannel.PUSH: "🌟 Loyalty reward: {message}"
-                }
-            ),
-            "birthday_offer": NotificationTemplate(
-                "birthday_offer",
-                {
-                    NotificationChannel.EMAIL: "🎂 Happy Birthday {customer_name}! {message}",
-                    NotificationChannel.PUSH: "🎂 Birthday special: {message}"
-                }
-            ),
-            "seasonal_promotion": NotificationTemplate(
-                "seasonal_promotion",
-                {
-                    NotificationChannel.EMAIL: "🍂 Seasonal Special for {customer_name}! {message}",
-                    NotificationChannel.PUSH: "🍂 Seasonal: {message}"
-                }
-            ),
-            "new_menu_item": NotificationTemplate(
-                "new_menu_item",
-                {
-                    NotificationChannel.EMAIL: "🍽️ New on the menu, {customer_name}! {message}",
-                    NotificationChannel.PUSH: "🍽️ New: {message}"
-                }
-            ),
-            "special_event": NotificationTemplate(
-                "special_event",
-                {
-                    NotificationChannel.EMAIL: "🎪 Special Event for {customer_name}! {message}",
-                    NotificationChannel.PUSH: "🎪 Event: {message}"
-                }
-            )
-        }
+        return dict(self.TEMPLATES)
     
     def update(self, event_type: str, data: Dict[str, Any]) -> List[NotificationResult]:
         """Process promotional notification"""
@@ -95,12 +105,10 @@ class PromotionalSubscriber(NotificationObserver):
                 return []  # Skip if not in customer's preferences
         
         results = []
-        templates = self.get_notification_templates()
-        
-        if event_type not in templates:
+        template = self.TEMPLATES.get(event_type)
+        if template is None:
             return []
         
-        template = templates[event_type]
         timestamp = self._format_timestamp()
         
         # Add customer info to data
@@ -112,7 +120,7 @@ class PromotionalSubscriber(NotificationObserver):
         # Send notification via preferred channels
         for channel in self.preferred_channels:
             try:
-                message = template.format_message(channel, **data_with_customer)
+                message = template.render(channel, data_with_customer)
                 
                 # Display the notification
                 channel_prefix = "PROMO EMAIL" if channel == NotificationChannel.EMAIL else "PROMO PUSH"
@@ -140,11 +148,27 @@ class PromotionalSubscriber(NotificationObserver):
         """Add a promotional preference"""
         if preference not in self.preferences:
             self.preferences.append(preference)
+            self._preferences_changed()
     
     def remove_preference(self, preference: str) -> None:
         """Remove a promotional preference"""
         if preference in self.preferences:
             self.preferences.remove(preference)
+            self._preferences_changed()
+    
+    def watch_preferences(self, listener: Callable[['PromotionalSubscriber'], None]) -> None:
+        """Call ``listener(subscriber)`` whenever add_preference or remove_preference changes preferences"""
+        if listener not in self._preference_listeners:
+            self._preference_listeners.append(listener)
+    
+    def unwatch_preferences(self, listener: Callable[['PromotionalSubscriber'], None]) -> None:
+        """Stop calling a preference listener"""
+        if listener in self._preference_listeners:
+            self._preference_listeners.remove(listener)
+    
+    def _preferences_changed(self) -> None:
+        for listener in list(self._preference_listeners):
+            listener(self)
     
     def get_preferences(self) -> List[str]:
         """Get customer's promotional preferences"""
@@ -13,6 +13,57 @@ from .notification_system import (
 class StaffNotifier(NotificationObserver):
     """Notifies restaurant staff about order updates"""
     
+    ROLE_EVENTS = {
+        "kitchen": ["order_received", "order_preparing"],
+        "server": ["order_preparing", "order_ready"],
+        "manager": ["order_received", "order_ready", "payment_successful", "payment_failed"],
+        "cashier": ["payment_successful", "payment_failed"]
+    }
+    
+    # Message templates per event, compiled once for the class
+    TEMPLATES: Dict[str, NotificationTemplate] = {
+        "order_received": NotificationTemplate(
+            "order_received",
+            {
+                NotificationChannel.SLACK: "🍽️ New order #{order_id} received - {item_count} items",
+                NotificationChannel.IN_APP: "NEW ORDER: #{order_id} ({item_count} items)",
+                NotificationChannel.PUSH: "New order #{order_id} - {item_count} items"
+            }
+        ),
+        "order_preparing": NotificationTemplate(
+            "order_preparing", 
+            {
+                NotificationChannel.SLACK: "👨‍🍳 Order #{order_id} in preparation",
+                NotificationChannel.IN_APP: "PREPARING: Order #{order_id}",
+                NotificationChannel.PUSH: "Order #{order_id} in preparation"
+            }
+        ),
+        "order_ready": NotificationTemplate(
+            "order_ready",
+            {
+                NotificationChannel.SLACK: "✅ Order #{order_id} ready for service!",
+                NotificationChannel.IN_APP: "READY: Order #{order_id} - ready for service!",
+                NotificationChannel.PUSH: "Order #{order_id} ready for service!"
+            }
+        ),
+        "payment_successful": NotificationTemplate(
+            "payment_successful",
+            {
+                NotificationChannel.SLACK: "💰 Payment received! Order #{order_id} - ${amount:.2f} via {payment_method}",
+                NotificationChannel.IN_APP: "PAYMENT: Order #{order_id} - ${amount:.2f} via {payment_method}",
+                NotificationChannel.PUSH: "Payment received - ${amount:.2f}"
+            }
+        ),
+        "payment_failed": NotificationTemplate(
+            "payment_failed",
+            {
+                NotificationChannel.SLACK: "❌ Payment FAILED for order #{order_id} - Requires attention!",
+                NotificationChannel.IN_APP: "PAYMENT FAILED: Order #{order_id} - action required",
+                NotificationChannel.PUSH: "Payment failed - order #{order_id}"
+            }
+        )
+    }
+    
     def __init__(self, staff_name: str, role: str):
         super().__init__(recipient_id=f"staff_{staff_name}")
         self.staff_name = staff_name
@@ -27,59 +78,15 @@ class StaffNotifier(NotificationObserver):
     
     def supports_event(self, event_type: str) -> bool:
         """Check if this staff member should receive notifications for this event type"""
-        role_events = {
-            "kitchen": ["order_received", "order_preparing"],
-            "server": ["order_preparing", "order_ready"],
-            "manager": ["order_received", "order_ready", "payment_successful", "payment_failed"],
-            "cashier": ["payment_successful", "payment_failed"]
-        }
-        
-        return event_type in role_events.get(self.role, [])
+        return event_type in self.ROLE_EVENTS.get(self.role, [])
+    
+    def subscribed_events(self) -> List[str]:
+        """The events of this staff member's role"""
+        return self.get_supported_events()
     
     def get_notification_templates(self) -> Dict[str, NotificationTemplate]:
         """Get staff notification templates based on role"""
-        return {
-            "order_received": NotificationTemplate(
-                "order_received",
-                {
-                    NotificationChannel.SLACK: "🍽️ New order #{order_id} received - {item_count} items",
-                    NotificationChannel.IN_APP: "NEW ORDER: #{order_id} ({item_count} items)",
-                    NotificationChannel.PUSH: "New order #{order_id} - {item_count} items"
-                }
-            ),
-            "order_preparing": NotificationTemplate(
-                "order_preparing", 
-                {
-                    NotificationChannel.SLACK: "👨‍🍳 Order #{order_id} in preparation",
-                    NotificationChannel.IN_APP: "PREPARING: Order #{order_id}",
-                    NotificationChannel.PUSH: "Order #{order_id} in preparation"
-                }
-            ),
-            "order_ready": NotificationTemplate(
-                "order_ready",
-                {
-                    NotificationChannel.SLACK: "✅ Order #{order_id} ready for service!",
-                    NotificationChannel.IN_APP: "READY: Order #{order_id} - ready for service!",
-                    NotificationChannel.PUSH: "Order #{order_id} ready for service!"
-                }
-            ),
-            "payment_successful": NotificationTemplate(
-                "payment_successful",
-                {
-                    NotificationChannel.SLACK: "💰 Payment received! Order #{order_id} - ${amount:.2f} via {payment_method}",
-                    NotificationChannel.IN_APP: "PAYMENT: Order #{order_id} - ${amount:.2f} via {payment_method}",
-                    NotificationChannel.PUSH: "Payment received - ${amount:.2f}"
-                }
-            ),
-            "payment_failed": NotificationTemplate(
-                "payment_failed",
-                {
-                    NotificationChannel.SLACK: "❌ Payment FAILED for order #{order_id} - Requires attention!",
-                    NotificationChannel.IN_APP: "PAYMENT FAILED: Order #{order_id} - action required",
-                    NotificationChannel.PUSH: "Payment failed - order #{order_id}"
-                }
-            )
-        }
+        return dict(self.TEMPLATES)
     
     def update(self, event_type: str, data: Dict[str, Any]) -> List[NotificationResult]:
         """Process staff notification"""
@@ -87,12 +94,10 @@ class StaffNotifier(NotificationObserver):
             return []
         
         results = []
-        templates = self.get_notification_templates()
-        
-        if event_type not in templates:
+        template = self.TEMPLATES.get(event_type)
+        if template is None:
             return []
         
-        template = templates[event_type]
         timestamp = self._format_timestamp()
         
         # Add staff info and item count to data
@@ -106,7 +111,7 @@ class StaffNotifier(NotificationObserver):
         # Send notification via preferred channels
         for channel in self.preferred_channels:
             try:
-                message = template.format_message(channel, **data_with_staff)
+                message = template.render(channel, data_with_staff)
                 
                 # Display the notification (in real app, this would use actual services)
                 print(f"[{timestamp}] STAFF ALERT ({self.staff_name} - {self.role}): {message}")
@@ -138,10 +143,4 @@ class StaffNotifier(NotificationObserver):
     
     def get_supported_events(self) -> List[str]:
         """Get list of events this staff member receives notifications for"""
-        role_events = {
-            "kitchen": ["order_received", "order_preparing"],
-            "server": ["order_preparing", "order_ready"],
-            "manager": ["order_received", "order_ready", "payment_successful", "payment_failed"],
-            "cashier": ["payment_successful", "payment_failed"]
-        }
-        return role_events.get(self.role, [])
+        return list(self.ROLE_EVENTS.get(self.role, []))
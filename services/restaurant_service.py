@@ -4,7 +4,10 @@ Restaurant Management Service integrating all design patterns
 from typing import Dict, List, Optional
 
 from core.base_classes import Subject
-from domains.notifications import StaffNotifier, PromotionalSubscriber
+from domains.notifications import (
+    StaffNotifier, PromotionalSubscriber, NotificationBus,
+    CampaignEngine, CampaignReport, PreferenceIndex, Promotion
+)
 from domains.menu import MenuManager, MenuItemFactory, MenuCategory
 from models.order import Order
 from config.enums import FoodCategory
@@ -19,17 +22,8 @@ class MenuWrapper:
     
     def add_item(self, category: FoodCategory, name: str, price: float, description: str = ""):
         """Backward compatible add_item method"""
-        if category == FoodCategory.APPETIZER:
-            item = self._factory.create_appetizer(name, description, price)
-        elif category == FoodCategory.ENTREE:
-            item = self._factory.create_main_course(name, description, price)
-        elif category == FoodCategory.DESSERT:
-            item = self._factory.create_dessert(name, description, price)
-        elif category == FoodCategory.BEVERAGE:
-            item = self._factory.create_beverage(name, description, price)
-        else:
-            # Default to appetizer for unknown categories
-            item = self._factory.create_appetizer(name, description, price)
+        # Unknown categories default to an appetizer
+        item = self._factory.create(category, name, description, price)
         
         self._manager.add_item(item)
         category_str = category.value if category else "Unknown Category"
@@ -76,13 +70,20 @@ class MenuWrapper:
 
 
 class RestaurantService(Subject):
-    """Restaurant Management System with Observer Pattern"""
-    def __init__(self, name: str):
+    """
+    Restaurant Management System with Observer Pattern
+
+    With a ``notification_bus`` the restaurant and every order it creates
+    deliver notifications on the bus's worker threads.
+    """
+    def __init__(self, name: str, notification_bus: Optional[NotificationBus] = None):
         super().__init__()
         self.name = name
+        self.set_notification_bus(notification_bus)
         self._menu_manager = MenuManager()
         self.orders: Dict[int, Order] = {}
         self.promotional_subscribers: List[PromotionalSubscriber] = []
+        self.subscriber_index = PreferenceIndex()
         
         # Initialize menu factory for compatibility
         self.menu_factory = MenuItemFactory()
@@ -102,6 +103,7 @@ class RestaurantService(Subject):
             preferences = []
         subscriber = PromotionalSubscriber(customer_name, email, preferences)
         self.promotional_subscribers.append(subscriber)
+        self.subscriber_index.add(subscriber)
         self.attach(subscriber)
         print(f"✅ {customer_name} subscribed to promotional emails")
         return subscriber
@@ -109,6 +111,7 @@ class RestaurantService(Subject):
     def create_order(self, customer_name: str, customer_phone: str = "", customer_email: str = "") -> Order:
         """Create a new order"""
         order = Order(customer_name, customer_phone, customer_email)
+        order.set_notification_bus(self._notification_bus)
         self.orders[order.order_id] = order
         
         # Attach restaurant staff to this order
@@ -146,6 +149,16 @@ class RestaurantService(Subject):
         """Send promotional notification to subscribers"""
         self.notify("promotion", {"category": category, "message": message})
     
+    def send_promotion_campaign(self, category: str, message: str, promo_code: str = "",
+                                checkpoint_path: Optional[str] = None,
+                                workers: Optional[int] = None) -> CampaignReport:
+        """Send a promotion to the subscriber list in batches, resumable through a checkpoint"""
+        engine = CampaignEngine(self.subscriber_index, workers=workers)
+        report = engine.run(Promotion(message, category=category, promo_code=promo_code), checkpoint_path)
+        print(f"📣 Campaign {report.campaign_id}: {report.sent} sent, {report.failed} failed "
+              f"to {report.recipients} subscribers in {report.elapsed:.1f}s")
+        return report
+    
     def display_restaurant_info(self):
         """Display restaurant information"""
         print(f"\n🏪 {self.name}")
@@ -0,0 +1,70 @@
+"""Tests for the batched promotional campaign engine"""
+
+import pytest
+
+from domains.notifications import CampaignEngine, PreferenceIndex, Promotion, PromotionalSubscriber
+
+
+class FlakySender:
+    """Sends every message, failing once when it reaches a given batch"""
+
+    def __init__(self, fail_on_call=None):
+        self.fail_on_call = fail_on_call
+        self.calls = 0
+        self.emails = []
+
+    def __call__(self, messages):
+        self.calls += 1
+        if self.calls == self.fail_on_call:
+            raise ConnectionError("provider unavailable")
+        self.emails.extend(email for _, _, email, _ in messages)
+        return len(messages), 0
+
+
+def make_index(count=10):
+    return PreferenceIndex(
+        PromotionalSubscriber(f"Guest {number}", f"guest{number}@example.com") for number in range(count)
+    )
+
+
+def test_interrupted_campaign_resumes_after_finished_batches(tmp_path):
+    index = make_index()
+    promotion = Promotion("Half price pizza", promo_code="PIZZA50")
+    checkpoint = str(tmp_path / "campaign.json")
+
+    crashing = FlakySender(fail_on_call=3)
+    with pytest.raises(ConnectionError):
+        CampaignEngine(index, workers=0, batch_size=3, sender=crashing).run(promotion, checkpoint)
+
+    resumed = FlakySender()
+    report = CampaignEngine(index, workers=0, batch_size=3, sender=resumed).run(promotion, checkpoint)
+
+    assert report.batches == 4
+    assert report.resumed_batches == 2
+    assert report.sent == 20
+    assert sorted(crashing.emails + resumed.emails) == sorted(
+        f"guest{number}@example.com" for number in range(10) for _ in range(2)
+    )
+
+
+def test_finished_campaign_sends_nothing_on_rerun(tmp_path):
+    index = make_index(4)
+    promotion = Promotion("Free dessert")
+    checkpoint = str(tmp_path / "campaign.json")
+    CampaignEngine(index, workers=0, batch_size=2, sender=FlakySender()).run(promotion, checkpoint)
+
+    sender = FlakySender()
+    report = CampaignEngine(index, workers=0, batch_size=2, sender=sender).run(promotion, checkpoint)
+
+    assert sender.calls == 0
+    assert report.resumed_batches == 2
+    assert report.sent == 8
+
+
+def test_checkpoint_of_another_recipient_list_is_refused(tmp_path):
+    promotion = Promotion("Free dessert")
+    checkpoint = str(tmp_path / "campaign.json")
+    CampaignEngine(make_index(4), workers=0, batch_size=2, sender=FlakySender()).run(promotion, checkpoint)
+
+    with pytest.raises(ValueError):
+        CampaignEngine(make_index(5), workers=0, batch_size=2, sender=FlakySender()).run(promotion, checkpoint)
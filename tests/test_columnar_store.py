@@ -0,0 +1,40 @@
+"""Tests for the columnar menu store"""
+
+from domains.menu.columnar_store import ColumnarMenuManager
+from domains.menu.menu_item_factory import MainCourseItem
+
+
+class SignatureMain(MainCourseItem):
+    __slots__ = ('chef_name',)
+
+
+class TastingMain(SignatureMain):
+    __slots__ = ('courses',)
+
+
+def make_tasting_menu():
+    item = TastingMain(name="Tasting", description="Seven courses", price=95.0, protein_source="duck")
+    item.chef_name = "Ana"
+    item.courses = 7
+    return item
+
+
+def test_views_keep_slots_of_every_item_class():
+    menu = ColumnarMenuManager()
+    menu.add_item(make_tasting_menu())
+
+    view = menu.get_item("Tasting")
+
+    assert type(view) is TastingMain
+    assert (view.protein_source, view.chef_name, view.courses) == ("duck", "Ana", 7)
+
+
+def test_snapshot_keeps_slots_of_every_item_class(tmp_path):
+    menu = ColumnarMenuManager()
+    menu.add_item(make_tasting_menu())
+    path = str(tmp_path / "menu.snap")
+    menu.save_snapshot(path)
+
+    view = ColumnarMenuManager.load_snapshot(path).get_item("Tasting")
+
+    assert (view.price, view.chef_name, view.courses) == (95.0, "Ana", 7)
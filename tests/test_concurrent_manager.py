@@ -0,0 +1,60 @@
+"""Tests for the copy-on-write concurrent menu manager"""
+
+import dataclasses
+
+from domains.menu.concurrent_manager import ConcurrentMenuManager
+from domains.menu.menu_item_factory import MenuItemFactory
+
+
+def make_menu(count=3):
+    menu = ConcurrentMenuManager()
+    menu.add_items(
+        MenuItemFactory.create_main_course(f"Dish {index}", "House dish", 10.0 + index)
+        for index in range(count)
+    )
+    return menu
+
+
+def test_update_item_leaves_published_snapshot_untouched():
+    menu = make_menu()
+    before = menu.snapshot()
+    old_item = before.get_item("Dish 1")
+
+    metadata = dataclasses.replace(old_item.metadata, chef_special=True)
+    assert menu.update_item("Dish 1", metadata=metadata)
+
+    assert not old_item.metadata.chef_special
+    assert before.get_chef_specials() == []
+    assert [item.name for item in menu.get_chef_specials()] == ["Dish 1"]
+    assert menu.get_item("Dish 1") is not old_item
+
+
+def test_price_write_copies_the_item():
+    menu = make_menu()
+    before = menu.snapshot()
+
+    menu.update_item_price("Dish 0", 4.0)
+
+    assert before.get_item("Dish 0").price == 10.0
+    assert menu.get_item("Dish 0").price == 4.0
+    assert before.get_cheapest_items(1)[0].name == "Dish 0"
+    assert before.get_menu_statistics()['price_statistics']['min_price'] == 10.0
+
+
+def test_batch_copies_once_and_publishes_at_exit():
+    menu = make_menu()
+    before = menu.snapshot()
+
+    with menu.batch():
+        items = menu._items
+        for index in range(3):
+            menu.update_item_price(f"Dish {index}", 1.0)
+            menu.update_item_availability(f"Dish {index}", False)
+        assert menu._items is items
+        assert menu.snapshot() is before
+
+    after = menu.snapshot()
+    assert after is not before
+    assert menu.get_available_items() == []
+    assert len(before.get_available_items()) == 3
+    assert all(item.price == 1.0 for item in menu.get_all_items())
@@ -0,0 +1,40 @@
+"""Tests for the menu item factory"""
+
+from config.enums import FoodCategory
+from domains.menu.base import MenuCategory
+from domains.menu.menu_manager import MenuManager
+from domains.menu.menu_item_factory import (
+    MenuItemFactory, AppetizerItem, DessertItem, MainCourseItem
+)
+from services.restaurant_service import MenuWrapper
+
+
+def test_create_uses_registered_class():
+    assert isinstance(MenuItemFactory.create(MenuCategory.DESSERT, "Pie", "", 5.0), DessertItem)
+    assert isinstance(MenuItemFactory.create("entree", "Steak", "", 20.0), MainCourseItem)
+
+
+def test_create_defaults_to_appetizer_for_missing_category():
+    item = MenuItemFactory.create(None, "Bread", "Warm bread", 3.0)
+
+    assert isinstance(item, AppetizerItem)
+    assert item.price == 3.0
+
+
+def test_create_defaults_to_appetizer_for_unknown_category():
+    assert isinstance(MenuItemFactory.create("brunch", "Toast", "", 3.0), AppetizerItem)
+
+
+def test_create_from_dict_defaults_to_appetizer():
+    item = MenuItemFactory.create_from_dict({'name': 'Toast', 'description': '', 'price': '3', 'category': 'brunch'})
+
+    assert isinstance(item, AppetizerItem)
+    assert item.price == 3.0
+
+
+def test_menu_wrapper_adds_uncategorised_item_as_appetizer(capsys):
+    manager = MenuManager()
+    MenuWrapper(manager, MenuItemFactory()).add_item(None, "Bread", 3.0)
+
+    assert isinstance(manager.get_item("Bread"), AppetizerItem)
+    assert "Unknown Category" in capsys.readouterr().out
@@ -0,0 +1,34 @@
+"""Tests for MenuManager item updates"""
+
+import dataclasses
+
+import pytest
+
+from domains.menu.columnar_store import ColumnarMenuManager
+from domains.menu.menu_item_factory import MenuItemFactory
+from domains.menu.menu_manager import MenuManager
+
+
+@pytest.fixture(params=[MenuManager, ColumnarMenuManager])
+def menu(request):
+    manager = request.param()
+    manager.add_item(MenuItemFactory.create_main_course("Burger", "Beef burger", 12.0))
+    manager.add_item(MenuItemFactory.create_appetizer("Fries", "Crispy fries", 4.0))
+    return manager
+
+
+def test_update_item_refreshes_indexes_and_statistics(menu):
+    metadata = dataclasses.replace(menu.get_item("Fries").metadata, chef_special=True, ingredients=["potato"])
+
+    assert menu.update_item("Fries", description="Hand cut", metadata=metadata)
+
+    assert menu.get_item("Fries").description == "Hand cut"
+    assert [item.name for item in menu.get_chef_specials()] == ["Fries"]
+    assert [item.name for item in menu.search_items("potato")] == ["Fries"]
+    assert menu.get_menu_statistics() == menu.recompute_menu_statistics()
+
+
+def test_update_item_rejects_unknown_items_and_renames(menu):
+    assert not menu.update_item("Salad", description="Green")
+    with pytest.raises(ValueError):
+        menu.update_item("Fries", name="Chips")
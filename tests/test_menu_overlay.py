@@ -0,0 +1,47 @@
+"""Tests for per-location menu overlays"""
+
+import dataclasses
+
+from domains.menu.menu_item_factory import MenuItemFactory
+from domains.menu.menu_manager import MenuManager
+from domains.menu.menu_overlay import MenuOverlay
+
+
+def make_overlay():
+    base = MenuManager()
+    base.add_item(MenuItemFactory.create_main_course("Burger", "Beef burger", 12.0))
+    base.add_item(MenuItemFactory.create_appetizer("Fries", "Crispy fries", 4.0))
+    return base, MenuOverlay(base, "Downtown")
+
+
+def test_overridden_item_uses_location_price():
+    base, overlay = make_overlay()
+    overlay.update_item_price("Burger", 10.0)
+
+    assert overlay.get_item("Burger").price == 10.0
+    assert base.get_item("Burger").price == 12.0
+    assert overlay.get_item("Fries") is base.get_item("Fries")
+
+
+def test_reindexed_base_item_shows_through_override():
+    base, overlay = make_overlay()
+    overlay.update_item_price("Burger", 10.0)
+    assert not overlay.get_item("Burger").metadata.chef_special
+
+    item = base.get_item("Burger")
+    item.metadata = dataclasses.replace(item.metadata, chef_special=True)
+    base.reindex_item("Burger")
+
+    location_item = overlay.get_item("Burger")
+    assert location_item.metadata.chef_special
+    assert location_item.price == 10.0
+    assert [special.name for special in overlay.get_chef_specials()] == ["Burger"]
+    assert overlay.get_chef_specials()[0].metadata.chef_special
+
+
+def test_availability_override_filters_queries():
+    base, overlay = make_overlay()
+    overlay.update_item_availability("Fries", False)
+
+    assert [item.name for item in overlay.get_available_items()] == ["Burger"]
+    assert base.get_item("Fries").available
@@ -0,0 +1,71 @@
+"""Tests for the threaded notification bus"""
+
+import threading
+
+import pytest
+
+from domains.notifications import BackpressurePolicy, NotificationBus
+from domains.notifications.notification_bus import ChannelQueue, DeliveryJob
+
+
+class Recorder:
+    def __init__(self):
+        self.received = []
+
+    def update(self, event_type, data):
+        self.received.append((event_type, data['number']))
+
+
+def job(number):
+    return DeliveryJob(Recorder(), "order_ready", {'number': number}, 0.0)
+
+
+def test_bus_delivers_in_order_per_channel():
+    observer = Recorder()
+    with NotificationBus(max_queue_size=2) as bus:
+        for number in range(20):
+            bus.publish(observer, "order_ready", {'number': number})
+        assert bus.flush(timeout=5)
+
+    assert observer.received == [("order_ready", number) for number in range(20)]
+
+
+def test_drop_oldest_keeps_the_newest_deliveries():
+    queue = ChannelQueue("email", 2, BackpressurePolicy.DROP_OLDEST)
+    for number in range(4):
+        queue.put(job(number))
+
+    assert [queue.get().data['number'] for _ in range(2)] == [2, 3]
+    assert queue.stats.dropped == 2
+
+
+def test_blocked_put_is_rejected_when_queue_closes():
+    queue = ChannelQueue("email", 1, BackpressurePolicy.BLOCK)
+    queue.put(job(0))
+    errors = []
+
+    def put_when_full():
+        try:
+            queue.put(job(1))
+        except RuntimeError as error:
+            errors.append(error)
+
+    publisher = threading.Thread(target=put_when_full)
+    publisher.start()
+    publisher.join(0.1)
+    assert publisher.is_alive()
+
+    queue.close()
+    publisher.join(5)
+
+    assert not publisher.is_alive()
+    assert len(errors) == 1
+    assert len(queue) == 1
+
+
+def test_publish_after_shutdown_raises():
+    bus = NotificationBus()
+    bus.shutdown()
+
+    with pytest.raises(RuntimeError):
+        bus.publish(Recorder(), "order_ready", {'number': 0})
@@ -0,0 +1,47 @@
+"""Tests for menu pages and cursors"""
+
+import base64
+import json
+
+import pytest
+
+from domains.menu.menu_item_factory import MenuItemFactory
+from domains.menu.menu_manager import MenuManager
+from domains.menu.pagination import decode_cursor, encode_cursor
+
+
+def cursor_for(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii')
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor("price", (4.5, "Fries")), "price") == (4.5, "Fries")
+    assert decode_cursor(encode_cursor("category", (0, "fries", "Fries")), "category") == (0, "fries", "Fries")
+
+
+@pytest.mark.parametrize("order_by, cursor", [
+    ("name", "not a cursor"),
+    ("name", cursor_for("name")),
+    ("name", cursor_for(["name", 5])),
+    ("name", cursor_for(["name", ["fries"]])),
+    ("name", cursor_for(["name", ["fries", 3]])),
+    ("price", cursor_for(["price", ["cheap", "Fries"]])),
+    ("category", cursor_for(["category", [True, "fries", "Fries"]])),
+])
+def test_malformed_cursor_raises_value_error(order_by, cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, order_by)
+
+
+def test_cursor_for_another_order_is_rejected():
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor("name", ("fries", "Fries")), "price")
+
+
+def test_pages_cover_the_menu_once():
+    menu = MenuManager()
+    menu.add_items(MenuItemFactory.create_appetizer(f"Item {index}", "", float(index % 4)) for index in range(9))
+
+    for order_by in ("category", "name", "price"):
+        names = [item.name for page in menu.iter_pages(order_by, page_size=2) for item in page.items]
+        assert sorted(names) == sorted(f"Item {index}" for index in range(9))
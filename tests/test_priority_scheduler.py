@@ -0,0 +1,59 @@
+"""Tests for the priority notification scheduler"""
+
+import threading
+
+import pytest
+
+from domains.notifications import NotificationScheduler
+
+
+class BlockingObserver:
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.received = []
+
+    def update(self, event_type, data):
+        self.started.set()
+        self.release.wait(5)
+        self.received.append(event_type)
+
+
+def test_publish_after_shutdown_raises():
+    scheduler = NotificationScheduler(workers=1)
+    scheduler.shutdown()
+
+    with pytest.raises(RuntimeError):
+        scheduler.publish(BlockingObserver(), "order_ready", {})
+
+
+def test_blocked_publisher_is_rejected_by_shutdown():
+    scheduler = NotificationScheduler(workers=1, max_queue_size=1)
+    observer = BlockingObserver()
+    scheduler.publish(observer, "order_ready", {})
+    assert observer.started.wait(5)
+    scheduler.publish(observer, "order_received", {})
+
+    errors = []
+
+    def publish_when_full():
+        try:
+            scheduler.publish(observer, "payment_successful", {})
+        except RuntimeError as error:
+            errors.append(error)
+
+    publisher = threading.Thread(target=publish_when_full)
+    publisher.start()
+    publisher.join(0.1)
+    assert publisher.is_alive()
+
+    stopper = threading.Thread(target=scheduler.shutdown, kwargs={'wait': False})
+    stopper.start()
+    publisher.join(5)
+    observer.release.set()
+    stopper.join(5)
+
+    assert not publisher.is_alive() and not stopper.is_alive()
+    assert len(errors) == 1
+    assert scheduler.flush(timeout=1)
+    assert observer.received == ["order_ready", "order_received"]
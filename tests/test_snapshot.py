@@ -0,0 +1,61 @@
+"""Tests for binary menu snapshots"""
+
+import pytest
+
+from domains.menu.columnar_store import ColumnarMenuManager
+from domains.menu.menu_item_factory import MenuItemFactory
+from domains.menu.menu_manager import MenuManager
+from domains.menu.snapshot import read_snapshot
+
+
+def make_menu(manager_class):
+    menu = manager_class()
+    menu.add_item(MenuItemFactory.create_main_course("Burger", "Beef burger", 12.0, protein_source="beef"))
+    menu.add_item(MenuItemFactory.create_dessert("Pie", "Apple pie", 6.0, temperature="warm"))
+    menu.update_item_availability("Pie", False)
+    return menu
+
+
+@pytest.mark.parametrize("manager_class", [MenuManager, ColumnarMenuManager])
+def test_snapshot_round_trip(tmp_path, manager_class):
+    menu = make_menu(manager_class)
+    path = str(tmp_path / "menu.snap")
+    menu.save_snapshot(path)
+
+    loaded = manager_class.load_snapshot(path)
+
+    assert loaded.export_menu_data()['items'] == menu.export_menu_data()['items']
+    assert loaded.get_menu_statistics() == menu.get_menu_statistics()
+    assert loaded.get_item("Burger").protein_source == "beef"
+    assert [item.name for item in loaded.get_available_items()] == ["Burger"]
+
+
+@pytest.mark.parametrize("manager_class", [MenuManager, ColumnarMenuManager])
+def test_truncated_snapshot_raises_value_error(tmp_path, manager_class):
+    path = tmp_path / "menu.snap"
+    make_menu(manager_class).save_snapshot(str(path))
+    data = path.read_bytes()
+
+    for length in (0, 10, 30, len(data) // 2, len(data) - 1):
+        path.write_bytes(data[:length])
+        with pytest.raises(ValueError):
+            read_snapshot(str(path))
+
+
+def test_corrupt_snapshot_raises_value_error(tmp_path):
+    path = tmp_path / "menu.snap"
+    make_menu(MenuManager).save_snapshot(str(path))
+    data = bytearray(path.read_bytes())
+    data[-40:] = b"\xff" * 40
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError):
+        MenuManager.load_snapshot(str(path))
+
+
+def test_snapshot_of_another_type_raises_type_error(tmp_path):
+    path = str(tmp_path / "menu.snap")
+    make_menu(MenuManager).save_snapshot(path)
+
+    with pytest.raises(TypeError):
+        ColumnarMenuManager.load_snapshot(path)
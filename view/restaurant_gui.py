@@ -12,8 +12,9 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from domains.menu import (
     MenuManager, MenuItemFactory, MenuCategory, 
     DietaryRestriction, NutritionalInfo, MenuItemMetadata, 
-    PreparationStyle
+    PreparationStyle, MenuQuery
 )
+from config.settings import MENU_SNAPSHOT_PATH
 
 class RestaurantApp:
     def __init__(self):
@@ -58,6 +59,9 @@ class RestaurantApp:
     
     def initialize_menu(self):
         """Initialize menu with sample data using the menu domain"""
+        if self.load_menu_snapshot():
+            return
+        
         
         # Appetizers
         appetizers = [
@@ -326,6 +330,20 @@ class RestaurantApp:
         for beverage_data in beverages:
             item = self.menu_factory.create_beverage(**beverage_data)
             self.menu_manager.add_item(item)
+        
+        if MENU_SNAPSHOT_PATH:
+            self.menu_manager.save_snapshot(MENU_SNAPSHOT_PATH)
+    
+    def load_menu_snapshot(self):
+        """Load the menu from the configured snapshot instead of rebuilding it"""
+        if not MENU_SNAPSHOT_PATH or not os.path.exists(MENU_SNAPSHOT_PATH):
+            return False
+        try:
+            self.menu_manager = MenuManager.load_snapshot(MENU_SNAPSHOT_PATH)
+            return True
+        except (OSError, ValueError, TypeError) as e:
+            print(f"Ignoring unusable menu snapshot: {e}")
+            return False
 
     # ===== INITIALIZATION & SETUP =====
         
@@ -447,7 +465,10 @@ class RestaurantApp:
             ('🥬 Vegetarian', DietaryRestriction.VEGETARIAN),
             ('⭐ Chef Special', 'chef_special'),
             ('🍂 Seasonal', 'seasonal'),
-            ('🌶️ Spicy', 'spicy')
+            ('🌶️ Spicy', 'spicy'),
+            ('🥜 No Nuts', ('exclude_allergen', 'nuts')),
+            ('🥛 No Dairy', ('exclude_allergen', 'dairy')),
+            ('🌾 No Gluten', ('exclude_allergen', 'gluten'))
         ]
         
         for label, filter_type in filters:
@@ -520,21 +541,17 @@ class RestaurantApp:
         for widget in self.menu_content_frame.winfo_children():
             widget.destroy()
             
-        # Get items based on category
+        # Get items for the current category and active filters in one cached query
         if self.current_category == "All":
-            items_to_show = self.menu_manager.get_available_items()
+            category = None
         else:
             # Convert category name back to MenuCategory enum
             try:
-                menu_category = MenuCategory(self.current_category.lower())
-                items_to_show = self.menu_manager.get_items_by_category(menu_category)
-                # Filter available items
-                items_to_show = [item for item in items_to_show if item.available]
+                category = MenuCategory(self.current_category.lower())
             except ValueError:
-                items_to_show = []
+                return
         
-        # Apply filters
-        items_to_show = self.apply_filters(items_to_show)
+        items_to_show = self.menu_manager.find(MenuQuery(category=category, **self.get_filter_facets()))
             
         # Create grid of menu items
         columns = 2
@@ -543,37 +560,22 @@ class RestaurantApp:
             col = i % columns
             self.create_menu_item_card(self.menu_content_frame, item, row, col)
             
-    def apply_filters(self, items):
-        """Apply active filters to items list"""
-        if not self.active_filters:
-            return items
-        
-        filtered_items = []
-        for item in items:
-            show_item = True
-            
-            for filter_type in self.active_filters:
-                if isinstance(filter_type, DietaryRestriction):
-                    if not item.matches_dietary_restriction(filter_type):
-                        show_item = False
-                        break
-                elif filter_type == 'chef_special':
-                    if not item.metadata.chef_special:
-                        show_item = False
-                        break
-                elif filter_type == 'seasonal':
-                    if not item.metadata.seasonal:
-                        show_item = False
-                        break
-                elif filter_type == 'spicy':
-                    if item.metadata.spice_level == 0:
-                        show_item = False
-                        break
-            
-            if show_item:
-                filtered_items.append(item)
-        
-        return filtered_items
+    def get_filter_facets(self):
+        """Translate active filters into MenuQuery facets"""
+        facets = {}
+        dietary = [f for f in self.active_filters if isinstance(f, DietaryRestriction)]
+        if dietary:
+            facets['dietary'] = dietary
+        if 'chef_special' in self.active_filters:
+            facets['chef_special'] = True
+        if 'seasonal' in self.active_filters:
+            facets['seasonal'] = True
+        if 'spicy' in self.active_filters:
+            facets['min_spice_level'] = 1
+        allergens = [f[1] for f in self.active_filters if isinstance(f, tuple) and f[0] == 'exclude_allergen']
+        if allergens:
+            facets['exclude_allergens'] = allergens
+        return facets
         
     def create_menu_item_card(self, parent, item, row, col):
         """Create a menu item card using the MenuItemBase object"""